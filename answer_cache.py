@@ -0,0 +1,186 @@
+"""Optional disk-backed LRU cache of `respond_subject_specific` answers.
+
+Entries are keyed by the normalized prompt, the previous answer (it is spliced
+into the next one) and a knowledge version: a hash of the stamps of every
+file the responder reads. Editing any data file changes the version, so old
+answers stop matching and are purged the next time the cache is used.
+
+The cache is a JSON file bounded to `max_entries` with least-recently-used
+eviction. New answers are written at most once per `save_interval` seconds
+(and by `flush()`, which runs at exit), each time to a fresh temporary file
+that replaces the cache atomically. A save first merges in the entries other
+processes sharing the file have written for the same knowledge version, so
+concurrent writers do not drop each other's answers. In deterministic mode the
+responder draws its random affirmations from a generator seeded by the
+prompt, so a fresh answer is identical to the cached one.
+
+Enable it with `eng1neer.enable_answer_cache()`.
+"""
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+from knowledge_store import DATA_DIR, file_stamp, store
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(ROOT, 'answer_cache.json')
+CACHE_FORMAT = 2
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_SAVE_INTERVAL = 30.0
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Prompt with surrounding whitespace stripped and inner runs collapsed (case is kept)."""
+    return ' '.join((prompt or '').split())
+
+
+def knowledge_version(data_dirs: Iterable[str] = (DATA_DIR,), paths: Iterable[str] = ()) -> str:
+    """Hash of the stamps of every JSON file in `data_dirs` plus the extra `paths`."""
+    parts = []
+    for d in data_dirs:
+        parts.append((os.path.abspath(d), store.signature(d)))
+    for p in paths:
+        parts.append((os.path.abspath(p), file_stamp(p)))
+    return hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=12).hexdigest()
+
+
+def seeded_random(prompt: str) -> random.Random:
+    """Random generator seeded by the normalized prompt (same prompt, same choices)."""
+    seed = hashlib.blake2b(normalize_prompt(prompt).encode('utf-8'), digest_size=8).digest()
+    return random.Random(int.from_bytes(seed, 'big'))
+
+
+class AnswerCache:
+    """Size-bounded LRU of answers persisted to a JSON file."""
+
+    def __init__(self, path: str = CACHE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES, deterministic: bool = True,
+                 save_interval: float = DEFAULT_SAVE_INTERVAL):
+        self.path = path
+        self.max_entries = max_entries
+        self.deterministic = deterministic
+        self.save_interval = save_interval
+        self._entries: 'Optional[OrderedDict[str, Dict[str, Any]]]' = None
+        self._version = None
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0, 'purged': 0, 'saves': 0}
+
+    @staticmethod
+    def make_key(prompt: str, previous_answer: str, version: str, scope: str = '') -> str:
+        raw = json.dumps([normalize_prompt(prompt), previous_answer or '', version, scope])
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _read_file(self) -> 'OrderedDict[str, Dict[str, Any]]':
+        entries = OrderedDict()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                doc = json.load(f)
+            if isinstance(doc, dict) and doc.get('format') == CACHE_FORMAT:
+                for key, ent in doc.get('entries', []):
+                    entries[key] = ent
+        except (OSError, ValueError, TypeError):
+            pass
+        return entries
+
+    def _load(self) -> 'OrderedDict[str, Dict[str, Any]]':
+        if self._entries is None:
+            self._entries = self._read_file()
+        return self._entries
+
+    def save(self, merge: bool = True) -> None:
+        """Write the cache now. With `merge`, entries another process saved for
+        the current knowledge version are kept (as the least recently used)."""
+        # one writer at a time, so an older snapshot never replaces a newer one
+        with self._save_lock:
+            on_disk = self._read_file() if merge else {}
+            with self._lock:
+                entries = self._load()
+                theirs = [(k, ent) for k, ent in on_disk.items()
+                          if k not in entries and self._version is not None and ent.get('version') == self._version]
+                if theirs:
+                    merged = OrderedDict(theirs)
+                    merged.update(entries)
+                    while len(merged) > self.max_entries:
+                        merged.popitem(last=False)
+                    self._entries = entries = merged
+                doc = {'format': CACHE_FORMAT, 'entries': list(entries.items())}
+                self._dirty = False
+            self._last_save = time.monotonic()
+            try:
+                f = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(os.path.abspath(self.path)),
+                                                prefix=os.path.basename(self.path) + '.', suffix='.tmp', delete=False)
+            except OSError:
+                self._dirty = True
+                return
+            try:
+                with f:
+                    json.dump(doc, f, ensure_ascii=False)
+                os.replace(f.name, self.path)
+            except OSError:
+                self._dirty = True
+                try:
+                    os.unlink(f.name)
+                except OSError:
+                    pass
+                return
+            self.stats['saves'] += 1
+
+    def flush(self) -> None:
+        """Write the cache if answers were stored or purged since the last save."""
+        if self._dirty:
+            self.save()
+
+    def _purge_other_versions(self, version: str) -> None:
+        # entries from older knowledge versions can never match again
+        if version == self._version:
+            return
+        self._version = version
+        entries = self._load()
+        stale = [k for k, ent in entries.items() if ent.get('version') != version]
+        for k in stale:
+            del entries[k]
+        if stale:
+            self.stats['purged'] += len(stale)
+            self._dirty = True
+
+    def get(self, key: str, version: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._purge_other_versions(version)
+            ent = self._load().get(key)
+            if ent is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return ent
+
+    def put(self, key: str, version: str, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._purge_other_versions(version)
+            entries = self._load()
+            entries[key] = dict(entry, version=version)
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+                self.stats['evictions'] += 1
+            self.stats['stores'] += 1
+            self._dirty = True
+        if time.monotonic() - self._last_save >= self.save_interval:
+            self.flush()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
+        self.save(merge=False)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._load())
@@ -0,0 +1,75 @@
+"""Throughput benchmark for `formula_utils.normalize_fragment` / `normalize_many`.
+
+Reads the fragments of the extracted formulas corpus (JSONL with a `fragment`
+field per line) and reports fragments per second for the per-fragment call and
+for the bulk API. The corpus is small, so it is repeated `--repeat` times;
+`normalize_many` computes each distinct fragment once, so its figure reflects
+the duplication typical of the extracted corpus.
+
+    python benchmark_normalize.py [--path data/extracted_formulas.jsonl] [--repeat 200]
+"""
+import json
+import os
+import sys
+import time
+from typing import List
+
+from formula_utils import normalize_fragment, normalize_many
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(ROOT, 'data', 'extracted_formulas.jsonl')
+
+
+def load_fragments(path: str = CORPUS_PATH) -> List[str]:
+    fragments = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict) and isinstance(rec.get('fragment'), str):
+                fragments.append(rec['fragment'])
+    return fragments
+
+
+def run(fragments: List[str], repeat: int = 200) -> dict:
+    corpus = fragments * repeat
+    t = time.perf_counter()
+    for frag in corpus:
+        normalize_fragment(frag)
+    single = time.perf_counter() - t
+    t = time.perf_counter()
+    normalize_many(corpus)
+    bulk = time.perf_counter() - t
+    return {
+        'fragments': len(corpus),
+        'distinct': len(set(corpus)),
+        'normalize_fragment_per_s': len(corpus) / single if single else float('inf'),
+        'normalize_many_per_s': len(corpus) / bulk if bulk else float('inf'),
+    }
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Benchmark formula fragment normalization')
+    parser.add_argument('--path', default=CORPUS_PATH, help='JSONL corpus with a "fragment" field per line')
+    parser.add_argument('--repeat', type=int, default=200, help='times to repeat the corpus')
+    args = parser.parse_args(argv)
+
+    fragments = load_fragments(args.path)
+    if not fragments:
+        print(f'No fragments found in {args.path}')
+        return 1
+    res = run(fragments, max(1, args.repeat))
+    print(f"{res['fragments']} fragments ({res['distinct']} distinct)")
+    print(f"normalize_fragment: {res['normalize_fragment_per_s']:,.0f} fragments/s")
+    print(f"normalize_many:     {res['normalize_many_per_s']:,.0f} fragments/s")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main(sys.argv[1:]))
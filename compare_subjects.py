@@ -12,6 +12,9 @@ import re
 import sys
 from pathlib import Path
 
+from knowledge_store import store
+from pos_lexicon import VERB_POS, pos_lexicon
+
 
 STOPWORDS = {
     'the', 'a', 'an', 'of', 'and', 'in', 'on', 'for', 'with', 'to', 'by', 'is', 'are',
@@ -127,18 +130,19 @@ def _first_sentence_containing(text: str, term: str) -> str:
     return ''
 
 
-def is_noise_token(t: str) -> bool:
-    return is_noise_token(t)
-
-
 def extract_nouns_and_predicates(text: str):
     text = (text or '').lower()
     tokens = re.findall(r"[a-zA-Z_]+", text)
     tokens = [t for t in tokens if t not in STOPWORDS and len(t) > 2 and not is_noise_token(t)]
     nouns = set()
     predicates = set()
+    # words the POS lexicon tags as verbs count as predicates as well
+    try:
+        tags = pos_lexicon.tag_many(tokens)
+    except Exception:
+        tags = {}
     for t in tokens:
-        if t.endswith(('ion', 'ment', 'ing', 'ize', 'ise')) or t in {'compute', 'calculate', 'measure', 'solve'}:
+        if tags.get(t) in VERB_POS or t.endswith(('ion', 'ment', 'ing', 'ize', 'ise')) or t in {'compute', 'calculate', 'measure', 'solve'}:
             predicates.add(t)
         else:
             nouns.add(t)
@@ -200,21 +204,8 @@ def _strip_leading_term(text: str, name: str) -> str:
 
 
 def load_subject_definitions(data_dir='data'):
-    defs = {}
-    if not os.path.isdir(data_dir):
-        return defs
-    for fn in os.listdir(data_dir):
-        if not fn.endswith('.json'):
-            continue
-        try:
-            with open(os.path.join(data_dir, fn), 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    for k, v in data.items():
-                        defs[k.lower()] = v
-        except Exception:
-            continue
-    return defs
+    # merged view is cached by the knowledge store; copy so callers may mutate it
+    return dict(store.merged_terms(data_dir))
 
 
 def _find_sentences_with_terms(text, terms, max_n=5):
@@ -1,4 +1,16 @@
+from typing import Optional
+
+from pos_lexicon import pos_lexicon
+from session import Session, resolve as resolve_session
+
+# tags for which a lexicon word is never treated as a participle
+_NON_PARTICIPLE_POS = ('NOUN', 'PROPN', 'PRON', 'NUM')
+
+
 def is_participle(word):
+    # a word the POS lexicon knows as a noun (or pronoun/number) is not a participle
+    if pos_lexicon.lookup(word) in _NON_PARTICIPLE_POS:
+        return False
     # Heuristic: participles often end with these suffixes
     return word.lower().endswith((
         'ing', 'ed', 'en', 'nt', 'd', 't', 'n', 'ne', 'wn', 'pt', 'st', 'ft', 'ld', 'lt', 'rt', 'rd', 'rn', 'rk', 'rm', 'mp', 'nd', 'nt', 'sk', 'sp', 'st', 'th', 'wn', 'zz', 'ss', 'sh', 'ch', 'ph', 'gh', 'wh', 'ng', 'nk', 'ct', 'ft', 'pt', 'xt', 'zz', 'ed', 'en'
@@ -11,12 +23,22 @@ def strip_participles_from_end(text):
         words.pop()
     return ' '.join(words)
 
-def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', data_dir='data') -> str:
+def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', data_dir='data', session: Optional[Session] = None) -> str:
+    """Subject-specific answer to `prompt`, continuing the conversation held in `session`.
+
+    Without a session the process-wide default session is used. Turns of one
+    session are answered one at a time.
+    """
+    session = resolve_session(session)
+    with session.lock:
+        session.touch()
+        return _respond_subject_specific(prompt, assoc_path, data_dir, session)
+
+
+def _respond_subject_specific(prompt: str, assoc_path: str, data_dir: str, session: Session) -> str:
     # --- Context-aware answer splicing ---
     # If previous answer exists, use it as context for the next answer
-    if not hasattr(respond_subject_specific, '_last_answer'):
-        respond_subject_specific._last_answer = ''
-    previous_answer = respond_subject_specific._last_answer
+    previous_answer = session.last_answer
 
     # Intercept patcher-related natural-language requests and handle them here.
     # If a pending patch exists, interpret the user's reply as confirm/cancel/apply.
@@ -36,7 +58,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
             apply_pending_patch,
         )
         # If there's a pending patch awaiting confirmation, check user response
-        pending = getattr(respond_subject_specific, '_pending_patch', None)
+        pending = session.pending_patch
         user_cmd = prompt.strip().lower()
         import re
 
@@ -82,7 +104,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
             # parse commands: apply, apply N, apply 1-3, apply all, cancel, preview, blame N, diff N
             import re
             if re.search(r"\b(cancel|no|abort)\b", user_cmd):
-                respond_subject_specific._pending_patch = None
+                session.pending_patch = None
                 return 'Patch cancelled.'
 
             m_all = re.search(r"\bapply(?:\s+all)?(?:\s+inplace)?\b", user_cmd)
@@ -91,7 +113,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
                 # apply all
                 inplace_flag = 'inplace' in user_cmd or pending.get('apply_flag', False)
                 res = apply_selected_changes(pending['path'], pending['old'], pending['new'], regex=pending['regex_flag'], layer=pending['layer'], selected_indices=None, inplace=inplace_flag, dry_run=pending['dry_run'])
-                respond_subject_specific._pending_patch = None
+                session.pending_patch = None
                 return f"Applied {res['applied']} changes. Wrote to: {res['written_to']}" if res['written_to'] else f"Applied {res['applied']} changes. No file written."
 
             if m_sel:
@@ -114,7 +136,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
                             continue
                 inplace_flag = 'inplace' in user_cmd or pending.get('apply_flag', False)
                 res = apply_selected_changes(pending['path'], pending['old'], pending['new'], regex=pending['regex_flag'], layer=pending['layer'], selected_indices=idxs, inplace=inplace_flag, dry_run=pending['dry_run'])
-                respond_subject_specific._pending_patch = None
+                session.pending_patch = None
                 return f"Applied {res['applied']} changes. Wrote to: {res['written_to']}" if res['written_to'] else f"Applied {res['applied']} changes. No file written."
 
             if re.search(r"\bpreview\b|\bshow\b|\bwhat\b", user_cmd):
@@ -144,12 +166,53 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
         intent = detect_patch_intent(prompt)
         if intent:
             # store pending intent and return preview with explicit confirmation instructions
-            respond_subject_specific._pending_patch = intent
+            session.pending_patch = intent
             preview = patch_kingdom_json_chat(intent['path'], intent['old'], intent['new'], regex=intent['regex_flag'], layer=intent['layer'], apply=False)
             return preview + "\n\nIf you want to apply these changes, reply 'apply'. To cancel, reply 'cancel'. To apply and write the file, reply 'apply inplace'."
     except Exception:
         pass
 
+    return _answer_subject_query(prompt, assoc_path, data_dir, previous_answer, session)
+
+
+def _answer_subject_query(prompt: str, assoc_path: str, data_dir: str, previous_answer: str, session: Session) -> str:
+    """Answer a non-patch prompt, through the answer cache when it is enabled.
+
+    Past the patch commands the answer depends only on the prompt, the previous
+    answer and the knowledge files, so it can be cached. The session state it
+    updates (`last_answer`, `last_subject`) is recorded with the answer and
+    replayed on a hit.
+    """
+    cache = _answer_cache
+    if cache is None:
+        return _compose_subject_answer(prompt, assoc_path, data_dir, previous_answer, session)
+    version = knowledge_version(sorted({data_dir, 'data'}), [assoc_path, WORD_FREQ_PATH])
+    scope = f'{os.path.abspath(data_dir)}|{os.path.abspath(assoc_path)}'
+    key = cache.make_key(prompt, previous_answer, version, scope)
+    hit = cache.get(key, version)
+    if hit is not None:
+        session.update(**{name: hit[name] for name in _CACHED_STATE if name in hit})
+        return hit['answer']
+
+    with session.recording() as changes:
+        answer = _compose_subject_answer(prompt, assoc_path, data_dir, previous_answer, session)
+    entry = {name: changes[name] for name in _CACHED_STATE if name in changes}
+    entry['answer'] = answer
+    cache.put(key, version, entry)
+    return answer
+
+
+def _response_random(prompt: str):
+    """`random` module, or a prompt-seeded generator when the answer cache is deterministic."""
+    if _answer_cache is not None and _answer_cache.deterministic:
+        return seeded_random(prompt)
+    import random
+    return random
+
+
+def _compose_subject_answer(prompt: str, assoc_path: str, data_dir: str, previous_answer: str, session: Session) -> str:
+    import re
+
     # Quick detection: natural-language equality/inclusion questions
     try:
         # common patterns: "is X the same as Y", "are X and Y the same", "does X include Y", "is X a type of Y"
@@ -258,15 +321,15 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
                 thresh = 0.35
                 if a_pred < thresh and b_pred < thresh and reltype in ('overlap', 'equal'):
                     out = f"Neither {a_term} nor {b_term} {predicate} (no indication either does)."
-                    respond_subject_specific._last_answer = out
+                    session.update(last_answer=out)
                     return out
                 if a_pred >= thresh and b_pred < thresh:
                     out = f"{a_term.capitalize()} {predicate}, whereas {b_term} does not appear to {predicate}."
-                    respond_subject_specific._last_answer = out
+                    session.update(last_answer=out)
                     return out
                 if b_pred >= thresh and a_pred < thresh:
                     out = f"{b_term.capitalize()} {predicate}, whereas {a_term} does not appear to {predicate}."
-                    respond_subject_specific._last_answer = out
+                    session.update(last_answer=out)
                     return out
                 # fall through to normal equal/inclusion logic if ambiguous
             try:
@@ -283,7 +346,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
                     out = f"'{a}' and '{b}' overlap (score {verdict.get('score'):.2f})."
                 else:
                     out = f"'{a}' and '{b}' appear distinct. ({verdict.get('reason')})"
-                respond_subject_specific._last_answer = out
+                session.update(last_answer=out)
                 return out
             except Exception:
                 # fall back to normal processing if verifier fails
@@ -304,20 +367,14 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
 
     # --- Association loading ---
     # Loads the main subject association file for fast lookup
-    with open(assoc_path, 'r', encoding='utf-8') as f:
-        assoc = json.load(f)
+    assoc = knowledge_store.load_json(assoc_path)
 
-    # --- Term extraction and similarity import ---
-    # Extracts candidate terms from the prompt and prepares Levenshtein similarity
+    # --- Term extraction and fuzzy index import ---
+    # Extracts candidate terms from the prompt and prepares the fuzzy word index
     import sys
     sys.path.append(os.path.dirname(__file__))
-    try:
-        from util_word_topic_lookup import similarity
-    except ImportError:
-        similarity = None
+    from fuzzy_index import load_word_index
     # --- Persistent subject memory ---
-    if not hasattr(respond_subject_specific, "_last_subject"):
-        respond_subject_specific._last_subject = None
     terms = extract_terms(prompt)
     # Find the first noun (regular/proper) in the prompt
     import string
@@ -326,22 +383,29 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
         return word and word[0].isalpha() and word.lower() not in {"i","me","my","mine","myself","you","your","yours","yourself","yourselves","he","him","his","himself","she","her","hers","herself","it","its","itself","we","us","our","ours","ourselves","they","them","their","theirs","themselves","this","that","these","those","who","whom","whose","which","what","where","when","why","how"}
     noun_in_prompt = next((w for w in prompt_tokens if is_noun_candidate(w)), None)
     if noun_in_prompt:
-        respond_subject_specific._last_subject = noun_in_prompt
-    current_subject = respond_subject_specific._last_subject
+        session.update(last_subject=noun_in_prompt)
+    current_subject = session.last_subject
 
     # --- Domain lineage and sibling/subspecies logic ---
     # For each filtered term, find its subject (file), type (term), synonyms (subspecies), and siblings (other terms in file)
+    # The inverted term index tells us which files define each term, so only
+    # those files are consulted instead of scanning the whole directory per term.
+    # Every key looked up below (terms, their lowercased forms and aliases) is
+    # resolved in one pass, so the directory is checked for changes only once.
+    SPECIAL_EQUIV = {
+        'american football': 'football'
+    }
+    lookup_keys = set(terms)
+    for term in terms:
+        term_l = term.lower().strip()
+        lookup_keys.add(term_l)
+        if term_l in SPECIAL_EQUIV:
+            lookup_keys.add(SPECIAL_EQUIV[term_l])
+    files_defining = knowledge_store.files_defining_many(lookup_keys, data_dir)
     domain_info = {}
-    for fname in os.listdir(data_dir):
-        if not fname.endswith('.json'):
-            continue
-        fpath = os.path.join(data_dir, fname)
-        try:
-            with open(fpath, 'r', encoding='utf-8') as fjson:
-                data = json.load(fjson)
-        except Exception:
-            continue
-        for term in terms:
+    for term in terms:
+        for fname in files_defining[term]:
+            data = knowledge_store.get(fname, data_dir, default={})
             if term in data:
                 entry = data[term]
                 # Synonyms (subspecies)
@@ -369,15 +433,11 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
     # 4. Direct match in code_dictionary.json
     # 5. Direct match in definitions.json
     # This order ensures the most relevant, subject-specific, and expressive definitions are used first.
-    with open(assoc_path, 'r', encoding='utf-8') as f:
-        assoc = json.load(f)
+    assoc = knowledge_store.load_json(assoc_path)
     filtered_terms = []
     for term in terms:
         term_l = term.lower().strip()
         # Handle special multi-word aliases (map to canonical keys)
-        SPECIAL_EQUIV = {
-            'american football': 'football'
-        }
         mapped = SPECIAL_EQUIV.get(term_l)
         if mapped:
             # if mapped term has an association, prefer that
@@ -389,59 +449,26 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
             filtered_terms.append(term_l)
             continue
         # --- 2. Fuzzy word match (Levenshtein) ---
-        word_freq_path = os.path.join(os.path.dirname(__file__), 'word_freq.txt')
-        with open(word_freq_path, 'r', encoding='utf-8') as wf:
-            word_freq = [line.strip().lower() for line in wf if line.strip()]
-        best_match = None
-        best_score = 0.0
-        if similarity:
-            for wf_word in word_freq:
-                score = similarity(term_l, wf_word)
-                if score > best_score:
-                    best_score = score
-                    best_match = wf_word
-        if best_score >= 0.8:
+        # The word list is indexed once per process (see fuzzy_index.py)
+        word_index = load_word_index(os.path.join(os.path.dirname(__file__), 'word_freq.txt'))
+        best_match = word_index.best_match(term_l, 0.8)
+        if best_match:
             # If Levenshtein match, re-check thesaurus_assoc for the matched word
             if best_match in assoc:
                 filtered_terms.append(best_match)
                 continue
-        # --- 3. Direct match in any data/*.json file ---
-        found_in_data = False
+        # --- 3. Direct match in any data/*.json file (via the term index) ---
         # If term has a special mapping, prefer checking the mapped key in data files
-        if mapped:
-            for fname in os.listdir(data_dir):
-                if fname.endswith('.json'):
-                    fpath = os.path.join(data_dir, fname)
-                    try:
-                        with open(fpath, 'r', encoding='utf-8') as fjson:
-                            data = json.load(fjson)
-                        if mapped in data:
-                            filtered_terms.append(mapped)
-                            found_in_data = True
-                            break
-                    except Exception:
-                        continue
-        if found_in_data:
+        if mapped and files_defining[mapped]:
+            filtered_terms.append(mapped)
             continue
-        for fname in os.listdir(data_dir):
-            if fname.endswith('.json'):
-                fpath = os.path.join(data_dir, fname)
-                try:
-                    with open(fpath, 'r', encoding='utf-8') as fjson:
-                        data = json.load(fjson)
-                    if term_l in data:
-                        filtered_terms.append(term_l)
-                        found_in_data = True
-                        break
-                except Exception:
-                    continue
-        if found_in_data:
+        if files_defining[term_l]:
+            filtered_terms.append(term_l)
             continue
         # --- 4. code_dictionary.json ---
         code_dict_path = os.path.join(data_dir, 'code_dictionary.json')
         if os.path.exists(code_dict_path):
-            with open(code_dict_path, 'r', encoding='utf-8') as fcd:
-                code_dict = json.load(fcd)
+            code_dict = knowledge_store.load_json(code_dict_path)
             if term_l in code_dict:
                 filtered_terms.append(term_l)
                 continue
@@ -449,8 +476,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
         wiki_defs_path = os.path.join(data_dir, 'wikipedia_defs.json')
         if os.path.exists(wiki_defs_path):
             try:
-                with open(wiki_defs_path, 'r', encoding='utf-8') as fd:
-                    wiki_defs = json.load(fd)
+                wiki_defs = knowledge_store.load_json(wiki_defs_path)
                 if term_l in wiki_defs:
                     filtered_terms.append(term_l)
                     continue
@@ -460,8 +486,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
         definitions_path = os.path.join(data_dir, 'definitions.json')
         if os.path.exists(definitions_path):
             try:
-                with open(definitions_path, 'r', encoding='utf-8') as fd:
-                    definitions = json.load(fd)
+                definitions = knowledge_store.load_json(definitions_path)
                 if term_l in definitions:
                     filtered_terms.append(term_l)
                     continue
@@ -473,8 +498,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
         try:
             wiki_defs_path = os.path.join(data_dir, 'wikipedia_defs.json')
             if os.path.exists(wiki_defs_path):
-                with open(wiki_defs_path, 'r', encoding='utf-8') as fw:
-                    wiki_defs = json.load(fw)
+                wiki_defs = knowledge_store.load_json(wiki_defs_path)
                 # Prefer the noun_in_prompt if we detected one earlier
                 candidates = []
                 if noun_in_prompt:
@@ -538,12 +562,16 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
     term_to_files = {term: [] for term in terms}
     file_to_terms = {fname: set() for fname in ordered_files}
     file_term_defs = {fname: {} for fname in ordered_files}
+    ordered_set = set(ordered_files)
+    defining = {term: set(files) & ordered_set for term, files in knowledge_store.files_defining_many(terms, data_dir).items()}
     for fname in ordered_files:
-        fpath = os.path.join(data_dir, fname)
         try:
-            with open(fpath, 'r', encoding='utf-8') as fjson:
-                data = json.load(fjson)
+            data = None
             for term in terms:
+                if fname not in defining[term]:
+                    continue
+                if data is None:
+                    data = knowledge_store.get(fname, data_dir, default={})
                 entry = data.get(term)
                 if not entry:
                     continue
@@ -744,8 +772,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
         try:
             wiki_defs_path = os.path.join(data_dir, 'wikipedia_defs.json')
             if os.path.exists(wiki_defs_path):
-                with open(wiki_defs_path, 'r', encoding='utf-8') as fw:
-                    wiki_defs = json.load(fw)
+                wiki_defs = knowledge_store.load_json(wiki_defs_path)
                 # prefer noun_in_prompt, then extracted terms
                 candidates = []
                 if noun_in_prompt:
@@ -807,14 +834,14 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
 
         # if we have multiple candidates, use blend_definitions to merge fragments
         if len(candidates_all) > 1:
+            frags = []
             try:
-                blended = blend_definitions(candidates_all, subject=term)
+                blended = blend_definitions(candidates_all, subject=term, fragments=frags)
             except Exception:
                 blended = None
             if blended:
                 token_defs[term] = blended
-                # extract associations from last fragments (if available)
-                frags = getattr(blend_definitions, '_last_fragments', [])
+                # extract associations from the fragments the blend used
                 assoc_counter = {}
                 stop_local = set(["the","and","of","in","on","for","to","a","an","is","are","was","were","this","that"])
                 for frag in frags:
@@ -865,7 +892,7 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
     referenced_later = any(t.lower() in subject_terms for t in prompt_tokens[1:])
 
     # --- Compose response with domain lineage and siblings ---
-    import random
+    random = _response_random(prompt)
     affirmatives = [
         "Certainly.", "Of course.", "Here's what I found:", "Affirmative.", "Let me explain:", "Absolutely.", "Here's the information:", "Sure.", "Indeed.", "As requested:", "Here's a summary:", "Let me clarify:", "Here's what the data shows:", "According to the data:", "Based on available information:", "Here's what I know:"
     ]
@@ -913,8 +940,43 @@ def respond_subject_specific(prompt: str, assoc_path='thesaurus_assoc.json', dat
     response_lines = kept_prev + new_fragments
     response = ' '.join(response_lines)
     # Store this answer for next turn
-    respond_subject_specific._last_answer = response
+    session.update(last_answer=response)
     return response if response.strip() else "No subject-specific definitions found for your query."
+
+
+import atexit
+
+from answer_cache import CACHE_PATH, DEFAULT_MAX_ENTRIES, AnswerCache, knowledge_version, seeded_random
+from fuzzy_index import WORD_FREQ_PATH
+
+# session attributes the answer cache records with each answer
+_CACHED_STATE = ('last_answer', 'last_subject')
+_answer_cache = None
+
+
+def enable_answer_cache(path: str = None, max_entries: int = DEFAULT_MAX_ENTRIES, deterministic: bool = True) -> AnswerCache:
+    """Serve repeated prompts from a persistent LRU answer cache (see answer_cache.py)."""
+    global _answer_cache
+    _flush_answer_cache()
+    _answer_cache = AnswerCache(path or CACHE_PATH, max_entries, deterministic)
+    return _answer_cache
+
+
+def disable_answer_cache() -> None:
+    global _answer_cache
+    _flush_answer_cache()
+    _answer_cache = None
+
+
+def _flush_answer_cache() -> None:
+    # answers stored since the last debounced save
+    if _answer_cache is not None:
+        _answer_cache.flush()
+
+
+atexit.register(_flush_answer_cache)
+
+
 def extract_subject_modifier_pairs(text: str, defs: dict) -> list:
     """
     Extract (subject, modifier) pairs in linear order from the text.
@@ -975,6 +1037,9 @@ import json
 import math
 from typing import Any, Dict, List, Optional, Tuple
 from new_natural_code_engine import NaturalCodeEngine
+from knowledge_store import store as knowledge_store
+from exec_cache import exec_cache
+from nlp_service import nlp_service
 
 # Exclude generic relational words from term extraction and synonym expansion
 RELATIONAL_EXCLUSIONS = {
@@ -1090,85 +1155,86 @@ def load_all_knowledge(directory: str = "data") -> dict:
         for filename in files:
             if filename.endswith(".json"):
                 path = os.path.join(root, filename)
-                with open(path, "r", encoding="utf-8") as f:
-                    try:
-                        data = json.load(f)
-                    except Exception as e:
-                        print(f"Error loading {path}: {e}")
-                        continue
-                    if isinstance(data, dict):
-                        for k, v in data.items():
-                            entry = knowledge.setdefault(k, {'definitions': [], 'relations': [], 'formulas': [], 'exec': [], 'sources': set()})
-                            # Definitions
-                            if isinstance(v, str):
-                                entry['definitions'].append(v)
-                            elif isinstance(v, dict):
-                                if 'definition' in v:
-                                    entry['definitions'].append(v['definition'])
-                                if 'gloss' in v:
-                                    entry['definitions'].append(v['gloss'])
-                                # Relations
-                                for rel_key in ['is a', 'type of', 'class of', 'category of', 'related to', 'see also', 'synonyms']:
-                                    if rel_key in v:
-                                        rels = v[rel_key]
-                                        if isinstance(rels, str):
-                                            entry['relations'].append((rel_key, rels))
-                                        elif isinstance(rels, list):
-                                            for rel in rels:
-                                                entry['relations'].append((rel_key, rel))
-                                # Formulas
-                                if 'formula' in v:
-                                    entry['formulas'].append(v['formula'])
-                                # Executable code
-                                if 'exec' in v:
-                                    entry['exec'].append(v['exec'])
-                            elif isinstance(v, list):
-                                for item in v:
-                                    if isinstance(item, dict):
-                                        if 'definition' in item:
-                                            entry['definitions'].append(item['definition'])
-                                        if 'gloss' in item:
-                                            entry['definitions'].append(item['gloss'])
-                                        for rel_key in ['is a', 'type of', 'class of', 'category of', 'related to', 'see also', 'synonyms']:
-                                            if rel_key in item:
-                                                rels = item[rel_key]
-                                                if isinstance(rels, str):
-                                                    entry['relations'].append((rel_key, rels))
-                                                elif isinstance(rels, list):
-                                                    for rel in rels:
-                                                        entry['relations'].append((rel_key, rel))
-                                        if 'formula' in item:
-                                            entry['formulas'].append(item['formula'])
-                                        if 'exec' in item:
-                                            entry['exec'].append(item['exec'])
-                            entry['sources'].add(filename)
-                    elif isinstance(data, list):
-                        base_name = os.path.splitext(os.path.basename(path))[0]
-                        entry = knowledge.setdefault(base_name, {'definitions': [], 'relations': [], 'formulas': [], 'exec': [], 'sources': set()})
-                        for item in data:
-                            if isinstance(item, dict):
-                                if 'definition' in item:
-                                    entry['definitions'].append(item['definition'])
-                                if 'gloss' in item:
-                                    entry['definitions'].append(item['gloss'])
-                                for rel_key in ['is a', 'type of', 'class of', 'category of', 'related to', 'see also', 'synonyms']:
-                                    if rel_key in item:
-                                        rels = item[rel_key]
-                                        if isinstance(rels, str):
-                                            entry['relations'].append((rel_key, rels))
-                                        elif isinstance(rels, list):
-                                            for rel in rels:
-                                                entry['relations'].append((rel_key, rel))
-                                if 'formula' in item:
-                                    entry['formulas'].append(item['formula'])
-                                if 'exec' in item:
-                                    entry['exec'].append(item['exec'])
+                try:
+                    data = knowledge_store.load_json(path)
+                except Exception as e:
+                    print(f"Error loading {path}: {e}")
+                    continue
+                if isinstance(data, dict):
+                    for k, v in data.items():
+                        entry = knowledge.setdefault(k, {'definitions': [], 'relations': [], 'formulas': [], 'exec': [], 'sources': set()})
+                        # Definitions
+                        if isinstance(v, str):
+                            entry['definitions'].append(v)
+                        elif isinstance(v, dict):
+                            if 'definition' in v:
+                                entry['definitions'].append(v['definition'])
+                            if 'gloss' in v:
+                                entry['definitions'].append(v['gloss'])
+                            # Relations
+                            for rel_key in ['is a', 'type of', 'class of', 'category of', 'related to', 'see also', 'synonyms']:
+                                if rel_key in v:
+                                    rels = v[rel_key]
+                                    if isinstance(rels, str):
+                                        entry['relations'].append((rel_key, rels))
+                                    elif isinstance(rels, list):
+                                        for rel in rels:
+                                            entry['relations'].append((rel_key, rel))
+                            # Formulas
+                            if 'formula' in v:
+                                entry['formulas'].append(v['formula'])
+                            # Executable code
+                            if 'exec' in v:
+                                entry['exec'].append(v['exec'])
+                        elif isinstance(v, list):
+                            for item in v:
+                                if isinstance(item, dict):
+                                    if 'definition' in item:
+                                        entry['definitions'].append(item['definition'])
+                                    if 'gloss' in item:
+                                        entry['definitions'].append(item['gloss'])
+                                    for rel_key in ['is a', 'type of', 'class of', 'category of', 'related to', 'see also', 'synonyms']:
+                                        if rel_key in item:
+                                            rels = item[rel_key]
+                                            if isinstance(rels, str):
+                                                entry['relations'].append((rel_key, rels))
+                                            elif isinstance(rels, list):
+                                                for rel in rels:
+                                                    entry['relations'].append((rel_key, rel))
+                                    if 'formula' in item:
+                                        entry['formulas'].append(item['formula'])
+                                    if 'exec' in item:
+                                        entry['exec'].append(item['exec'])
                         entry['sources'].add(filename)
-                    else:
-                        print(f"Warning: {path} is not a dict or list. Skipping.")
+                elif isinstance(data, list):
+                    base_name = os.path.splitext(os.path.basename(path))[0]
+                    entry = knowledge.setdefault(base_name, {'definitions': [], 'relations': [], 'formulas': [], 'exec': [], 'sources': set()})
+                    for item in data:
+                        if isinstance(item, dict):
+                            if 'definition' in item:
+                                entry['definitions'].append(item['definition'])
+                            if 'gloss' in item:
+                                entry['definitions'].append(item['gloss'])
+                            for rel_key in ['is a', 'type of', 'class of', 'category of', 'related to', 'see also', 'synonyms']:
+                                if rel_key in item:
+                                    rels = item[rel_key]
+                                    if isinstance(rels, str):
+                                        entry['relations'].append((rel_key, rels))
+                                    elif isinstance(rels, list):
+                                        for rel in rels:
+                                            entry['relations'].append((rel_key, rel))
+                            if 'formula' in item:
+                                entry['formulas'].append(item['formula'])
+                            if 'exec' in item:
+                                entry['exec'].append(item['exec'])
+                    entry['sources'].add(filename)
+                else:
+                    print(f"Warning: {path} is not a dict or list. Skipping.")
     # Convert sources to list for serialization
     for v in knowledge.values():
         v['sources'] = list(v['sources'])
+    # parse_math_exec evaluates with the 'safe' profile only
+    exec_cache.precompile((code for v in knowledge.values() for code in v['exec']), ('safe',))
     return knowledge
 
 def normalize_defs(defs: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
@@ -1210,13 +1276,13 @@ def normalize_defs(defs: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
 
     return normalized
 
-def load_all_definitions() -> Dict[str, List[Dict[str, Any]]]:
+def load_all_definitions(data_dir: str = "data") -> Dict[str, List[Dict[str, Any]]]:
     """
-    Load core definitions and math definitions,
+    Load core definitions and math definitions from `data_dir`,
     merge them into a single normalized dictionary.
     """
     # Use the new unified loader, but extract only definitions for legacy compatibility
-    knowledge = load_all_knowledge("data")
+    knowledge = load_all_knowledge(data_dir)
     defs = {}
     for term, info in knowledge.items():
         # Prefer structured definitions
@@ -1233,51 +1299,128 @@ def load_all_definitions() -> Dict[str, List[Dict[str, Any]]]:
 import ast
 import operator as op
 
+_EXPR_OPERATORS = {
+    ast.Add: op.add,
+    ast.Sub: op.sub,
+    ast.Mult: op.mul,
+    ast.Div: op.truediv,
+    ast.Pow: op.pow,
+    ast.Mod: op.mod,
+    ast.USub: op.neg,
+    ast.UAdd: op.pos
+}
+_MAX_COMPILED_EXPRESSIONS = 1024
+_compiled_expressions: Dict[str, Any] = {}
+
+
+def _compile_node(node):
+    """Turn a supported AST node into a closure over the variables mapping."""
+    if isinstance(node, ast.Num):
+        value = node.n
+        return lambda variables: value
+    if isinstance(node, ast.BinOp):
+        fn = _EXPR_OPERATORS[type(node.op)]
+        left = _compile_node(node.left)
+        right = _compile_node(node.right)
+        return lambda variables: fn(left(variables), right(variables))
+    if isinstance(node, ast.UnaryOp):
+        fn = _EXPR_OPERATORS[type(node.op)]
+        operand = _compile_node(node.operand)
+        return lambda variables: fn(operand(variables))
+    if isinstance(node, ast.Name):
+        name = node.id
+
+        def lookup(variables):
+            if name in variables:
+                return variables[name]
+            raise ValueError(f"Unknown variable: {name}")
+        return lookup
+    raise TypeError(f"Unsupported expression: {ast.dump(node)}")
+
+
+def compile_expression(text: str):
+    """Compile a math expression once into a callable `f(variables) -> value`.
+
+    Supports the same syntax as `try_eval_expression` (+, -, *, /, **, %,
+    unary signs, parentheses, numbers and variable names; '^' means '**').
+    Returns None when the text does not parse or uses anything else.
+    Results are cached by expression text.
+    """
+    if not text or not isinstance(text, str):
+        return None
+    try:
+        return _compiled_expressions[text]
+    except KeyError:
+        pass
+    try:
+        fn = _compile_node(ast.parse(text.strip().replace('^', '**'), mode='eval').body)
+    except Exception:
+        fn = None
+    if len(_compiled_expressions) >= _MAX_COMPILED_EXPRESSIONS:
+        _compiled_expressions.clear()
+    _compiled_expressions[text] = fn
+    return fn
+
+
 def try_eval_expression(text: str, variables: dict = None) -> Optional[float]:
     """
     Evaluate a math expression with variables and correct order of operations.
     Supports: +, -, *, /, **, %, parentheses, and variables.
     Example: '2*x + 3*y', variables={'x': 4, 'y': 5}
     """
-    if not text or not isinstance(text, str):
+    fn = compile_expression(text)
+    if fn is None:
         return None
-    expr = text.strip().replace('^', '**')
-    variables = variables or {}
-    # Supported operators
-    allowed_operators = {
-        ast.Add: op.add,
-        ast.Sub: op.sub,
-        ast.Mult: op.mul,
-        ast.Div: op.truediv,
-        ast.Pow: op.pow,
-        ast.Mod: op.mod,
-        ast.USub: op.neg,
-        ast.UAdd: op.pos
-    }
-    def eval_node(node):
-        if isinstance(node, ast.Num):
-            return node.n
-        elif isinstance(node, ast.BinOp):
-            left = eval_node(node.left)
-            right = eval_node(node.right)
-            return allowed_operators[type(node.op)](left, right)
-        elif isinstance(node, ast.UnaryOp):
-            operand = eval_node(node.operand)
-            return allowed_operators[type(node.op)](operand)
-        elif isinstance(node, ast.Name):
-            if node.id in variables:
-                return variables[node.id]
-            else:
-                raise ValueError(f"Unknown variable: {node.id}")
-        else:
-            raise TypeError(f"Unsupported expression: {ast.dump(node)}")
     try:
-        parsed = ast.parse(expr, mode='eval')
-        return eval_node(parsed.body)
+        return fn(variables or {})
     except Exception:
         return None
 
 
+def evaluate_batch(text: str, variables_list: List[dict], vectorize: bool = False) -> List[Optional[Any]]:
+    """Evaluate one expression for many variable bindings; None for bindings that fail.
+
+    The expression is compiled once. With `vectorize=True` the bindings are
+    stacked into NumPy arrays and evaluated in a single pass (results are then
+    floats); bindings that are missing a variable or give a non-finite value
+    are re-evaluated one by one, so the per-binding results match the scalar
+    path up to int/float type.
+    """
+    fn = compile_expression(text)
+    if fn is None:
+        return [None] * len(variables_list)
+
+    def scalar(variables):
+        try:
+            return fn(variables or {})
+        except Exception:
+            return None
+
+    if not vectorize or not variables_list:
+        return [scalar(v) for v in variables_list]
+
+    try:
+        import numpy as np
+        names = set().union(*[set(v or {}) for v in variables_list])
+        complete = [i for i, v in enumerate(variables_list) if v and len(v) == len(names)]
+        columns = {name: np.asarray([variables_list[i][name] for i in complete], dtype=float) for name in names}
+        with np.errstate(all='ignore'):
+            arr = np.broadcast_to(np.asarray(fn(columns), dtype=float), (len(complete),))
+    except Exception:
+        return [scalar(v) for v in variables_list]
+
+    results = [None] * len(variables_list)
+    done = set()
+    for i, value, ok in zip(complete, arr.tolist(), np.isfinite(arr).tolist()):
+        if ok:
+            results[i] = value
+            done.add(i)
+    for i, v in enumerate(variables_list):
+        if i not in done:
+            results[i] = scalar(v)
+    return results
+
+
 def parse_math_exec(defs: Dict[str, List[Dict[str, Any]]], term: str, *args: float) -> Optional[Any]:
     """
     Execute the math function stored in the 'exec' field of a definition.
@@ -1295,9 +1438,9 @@ def parse_math_exec(defs: Dict[str, List[Dict[str, Any]]], term: str, *args: flo
     if not code:
         return None
 
-    try:
-        fn = eval(code, SAFE_GLOBALS, {})
-    except Exception:
+    # compiled once per source text and shared with taxonomic_grammar (see exec_cache)
+    fn = exec_cache.get(code, 'safe')
+    if fn is None:
         return None
 
     try:
@@ -1561,35 +1704,34 @@ def lookup_definition(defs: Dict[str, Any], term: str) -> Optional[Any]:
     return None
 
 
-def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
-    global _last_evidence
+def respond(defs: Dict[str, List[Dict[str, Any]]], text: str, session: Optional[Session] = None) -> str:
+    """Answer `text` from `defs`; the evidence for the turn is left on `session.last_evidence`.
+
+    Without a session the process-wide default session is used.
+    """
+    session = resolve_session(session)
+    with session.lock:
+        session.touch()
+        session.last_evidence = None
+        return _respond(defs, text, session)
+
 
+def _respond(defs: Dict[str, List[Dict[str, Any]]], text: str, session: Session) -> str:
     raw = text.strip()
     if not raw:
         return "I need something to define."
 
     # Context and pronoun resolution (preserve previous behavior)
-    if not hasattr(respond, "_context"):
-        respond._context = []
-    context = respond._context
-    resolved_raw = resolve_pronouns(raw, context)
-    context.append(raw)
-    if len(context) > 10:
-        context.pop(0)
-
-    # Initialize spaCy (cached on the function to avoid repeated loads)
-    if not hasattr(respond, "_nlp"):
-        try:
-            import spacy
-            respond._nlp = spacy.load('en_core_web_sm')
-        except Exception:
-            respond._nlp = None
-    nlp = respond._nlp
+    resolved_raw = resolve_pronouns(raw, session.context)
+    session.remember_prompt(raw)
+
+    # shared spaCy pipeline (loaded once per process, None when unavailable)
+    nlp = nlp_service.get()
 
     # Extract topics using spaCy noun chunks and nouns/proper nouns
     topics = []
     if nlp:
-        doc = nlp(resolved_raw)
+        doc = nlp_service.doc(resolved_raw)
         seen = set()
         for nc in doc.noun_chunks:
             lem = nc.lemma_.lower().strip()
@@ -1741,8 +1883,7 @@ def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
                     try:
                         wiki_path = os.path.join(os.path.dirname(__file__), 'data', 'wikipedia_defs.json')
                         if os.path.exists(wiki_path):
-                            with open(wiki_path, 'r', encoding='utf-8') as wf:
-                                wdefs = json.load(wf)
+                            wdefs = knowledge_store.load_json(wiki_path)
                             ent2 = wdefs.get(subj) or wdefs.get(subj.lower())
                             if ent2:
                                 blended = ent2.get('summary') if isinstance(ent2, dict) else (ent2 if isinstance(ent2, str) else None)
@@ -1757,7 +1898,7 @@ def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
                     lines.append(f"{subj.capitalize()}: (no definition found)")
             # expose minimal evidence for these direct-definition responses
             try:
-                _last_evidence = {'direct_definition_request': True, 'subjects': def_reqs}
+                session.last_evidence = {'direct_definition_request': True, 'subjects': def_reqs}
             except Exception:
                 pass
             return '\n'.join(lines)
@@ -1782,15 +1923,11 @@ def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
         if not frags:
             continue
         # Blend fragments for this term
-        blended = blend_definitions(frags, subject=t)
+        # token sets come from the fragments this blend actually used
+        raw_frags = []
+        blended = blend_definitions(frags, subject=t, fragments=raw_frags)
         term_blends[t] = blended
         found_terms.append(t)
-        # Use the last_fragments recorded by blend_definitions for token sets
-        raw_frags = []
-        try:
-            raw_frags = blend_definitions._last_fragments or []
-        except Exception:
-            raw_frags = frags
         toks = set()
         for s in raw_frags:
             for w in re.findall(r"\b[a-zA-Z]+\b", s.lower()):
@@ -1828,8 +1965,7 @@ def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
                 try:
                     wiki_path = os.path.join(os.path.dirname(__file__), 'data', 'wikipedia_defs.json')
                     if os.path.exists(wiki_path):
-                        with open(wiki_path, 'r', encoding='utf-8') as wf:
-                            wdefs = json.load(wf)
+                        wdefs = knowledge_store.load_json(wiki_path)
                         ent = wdefs.get(primary) or wdefs.get(primary.lower())
                         if ent:
                             summ = ent.get('summary') if isinstance(ent, dict) else (ent if isinstance(ent, str) else None)
@@ -1852,7 +1988,7 @@ def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
     pred_stop = {'do','does','did','move','moves','moved','be','is','are','have','has','by','with','using','use'}
     if 'nlp' in locals() and nlp:
         try:
-            docq = nlp(resolved_raw)
+            docq = nlp_service.doc(resolved_raw)
             for tok in docq:
                 # prefer the ROOT verb or a real verb that isn't a light auxiliary
                 if tok.dep_ == 'ROOT' or (tok.pos_ == 'VERB' and tok.lemma_.lower() not in pred_stop):
@@ -1976,7 +2112,7 @@ def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
 
     # expose last evidence for inspection (supporting / unsupporting fragments)
     try:
-        _last_evidence = {
+        session.last_evidence = {
             'found_terms': found_terms,
             'term_raw_fragments': term_raw_fragments,
             'predicate_phrases': predicate_phrases,
@@ -1984,7 +2120,7 @@ def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
             'out_lines': out_lines,
         }
     except Exception:
-        _last_evidence = None
+        session.last_evidence = None
 
     return "\n".join(out_lines)
 
@@ -1996,26 +2132,26 @@ def respond(defs: Dict[str, List[Dict[str, Any]]], text: str) -> str:
 # Simple CLI loop for manual testing
 # ---------------------------------------------------------------------
 
-def test_blend_fragments():
-    """Test and print the last sentence fragments used in blending."""
-    if hasattr(blend_definitions, '_last_fragments'):
-        print("Fragments used in last blend:")
-        for i, frag in enumerate(blend_definitions._last_fragments, 1):
-            print(f"Fragment {i}: {frag}")
-    else:
-        print("No fragments stored yet.")
+def _evidence_pass(defs: Dict[str, List[Dict[str, Any]]], text: str, session: Optional[Session] = None) -> Dict[str, Any]:
+    """Run `respond()` once and capture the evidence it left for this prompt."""
+    session = resolve_session(session)
+    with session.lock:
+        sentence = respond(defs, text, session=session)
+        return {'text': text, 'response': sentence, 'evidence': session.last_evidence}
 
 
-def respond_with_evidence(defs: Dict[str, List[Dict[str, Any]]], text: str, verbose: bool = False):
+def respond_with_evidence(defs: Dict[str, List[Dict[str, Any]]], text: str, verbose: bool = False,
+                          session: Optional[Session] = None):
     """Call `respond()` and return structured evidence.
 
     - If `verbose` is True, return the sentence string (same as `respond`).
     - If `verbose` is False, return a dict: `{'response': str, 'evidence': dict_or_None}`.
     This keeps `respond()` unchanged while providing a non-breaking API.
     """
-    # call existing responder (it populates module-level `_last_evidence`)
-    sentence = respond(defs, text)
-    evidence = globals().get('_last_evidence')
+    # one responder pass; the comparison below reuses it instead of responding again
+    result = _evidence_pass(defs, text, session)
+    sentence = result['response']
+    evidence = result['evidence']
     # If this was a direct definition request, and verbose requested, prefer the direct responder output
     try:
         if verbose and evidence and isinstance(evidence, dict) and evidence.get('direct_definition_request'):
@@ -2025,7 +2161,7 @@ def respond_with_evidence(defs: Dict[str, List[Dict[str, Any]]], text: str, verb
     if verbose:
         # prefer returning the learner-oriented narrative when verbose is requested
         try:
-            detailed = detailed_comparison(defs, text)
+            detailed = detailed_comparison(defs, text, evidence_result=result)
             narrative = detailed.get('narrative') if isinstance(detailed, dict) else None
             return narrative or sentence
         except Exception:
@@ -2036,7 +2172,35 @@ def respond_with_evidence(defs: Dict[str, List[Dict[str, Any]]], text: str, verb
     }
 
 
-def detailed_comparison(defs: Dict[str, List[Dict[str, Any]]], text: str, predicate: Optional[str] = None) -> Dict[str, Any]:
+def evidence_turn(defs: Dict[str, List[Dict[str, Any]]], text: str, predicate: Optional[str] = None,
+                  session: Optional[Session] = None) -> Dict[str, Any]:
+    """Everything the chat UI shows for one prompt, from a single responder pass.
+
+    Returns a dict with keys:
+      - `text`, `response`, `evidence`: the prompt, `respond()` output and its evidence
+      - `comparison`: the `detailed_comparison()` result (token sets, predicate counts,
+        supporting fragments), or None if it failed
+      - `narrative`: what `respond_with_evidence(verbose=True)` returns
+
+    Keep the dict to serve a later "show evidence" request for the same prompt.
+    """
+    turn = _evidence_pass(defs, text, session)
+    evidence = turn['evidence']
+    try:
+        turn['comparison'] = detailed_comparison(defs, text, predicate, evidence_result=turn)
+    except Exception:
+        turn['comparison'] = None
+    narrative = None
+    if not (isinstance(evidence, dict) and evidence.get('direct_definition_request')):
+        if isinstance(turn['comparison'], dict):
+            narrative = turn['comparison'].get('narrative')
+    turn['narrative'] = narrative or turn['response']
+    return turn
+
+
+def detailed_comparison(defs: Dict[str, List[Dict[str, Any]]], text: str, predicate: Optional[str] = None,
+                        evidence_result: Optional[Dict[str, Any]] = None,
+                        session: Optional[Session] = None) -> Dict[str, Any]:
     """Produce a full description of supportive and unsupportive likenesses/unlikenesses for the predicate.
 
     Returns a dict with keys:
@@ -2051,8 +2215,10 @@ def detailed_comparison(defs: Dict[str, List[Dict[str, Any]]], text: str, predic
 
     This focuses primarily on the predicate provided or the first predicate discovered
     in the input. It highlights evidence (fragments) and lexical similarities/differences.
+    Pass `evidence_result` (a `respond_with_evidence(verbose=False)`-style dict from
+    the same prompt) to reuse an existing responder pass instead of running another.
     """
-    result = respond_with_evidence(defs, text, verbose=False)
+    result = evidence_result if evidence_result is not None else _evidence_pass(defs, text, session)
     evidence = result.get('evidence')
     resp = result.get('response')
 
@@ -2082,8 +2248,7 @@ def detailed_comparison(defs: Dict[str, List[Dict[str, Any]]], text: str, predic
                     try:
                         wiki_path = os.path.join(os.path.dirname(__file__), 'data', 'wikipedia_defs.json')
                         if os.path.exists(wiki_path):
-                            with open(wiki_path, 'r', encoding='utf-8') as wf:
-                                wdefs = json.load(wf)
+                            wdefs = knowledge_store.load_json(wiki_path)
                             ent2 = wdefs.get(subj) or wdefs.get(subj.lower())
                             if ent2:
                                 blended = ent2.get('summary') if isinstance(ent2, dict) else (ent2 if isinstance(ent2, str) else None)
@@ -2146,17 +2311,21 @@ def detailed_comparison(defs: Dict[str, List[Dict[str, Any]]], text: str, predic
     # auxiliaries to exclude unless used as nouns in context
     aux_tokens = set(['do','does','did','be','is','are','was','were','have','has','had','can','could','will','would','shall','should','may','might','must','ought'])
 
+    # tag the fragments that contain auxiliaries in one batched pass; the per-token checks below
+    # are then cache lookups
+    try:
+        nlp_service.analyze_many([s for t in found for s in term_frags.get(t, [])
+                                  if aux_tokens.intersection(re.findall(r"\b[a-zA-Z]+\b", s.lower()))])
+    except Exception:
+        pass
+
     def token_used_as_noun_in_frag(token: str, frag: str) -> bool:
-        # prefer the spaCy analyzer initialized by respond(); fall back to heuristic
-        nlp_local = globals().get('respond').__dict__.get('_nlp') if 'respond' in globals() else None
-        if nlp_local:
-            try:
-                doc = nlp_local(frag)
-                for tk in doc:
-                    if tk.text.lower() == token and tk.pos_ in ('NOUN', 'PROPN'):
-                        return True
-            except Exception:
-                pass
+        # prefer the shared spaCy analysis; fall back to heuristic
+        try:
+            if nlp_service.is_noun_in(token, frag):
+                return True
+        except Exception:
+            pass
         # fallback heuristic: check for patterns like 'a TOKEN' or 'the TOKEN' or TOKEN followed by noun markers
         if re.search(r"\b(a|the|an)\s+" + re.escape(token) + r"\b", frag, re.I):
             return True
@@ -2186,7 +2355,7 @@ def detailed_comparison(defs: Dict[str, List[Dict[str, Any]]], text: str, predic
         for t in found:
             unique[t] = toksets.get(t, set())
 
-    # supporting/unsupporting fragments (from _last_evidence/evidence_pair if available)
+    # supporting/unsupporting fragments (from the turn's evidence_pair if available)
     supporting = {}
     unsupporting = {}
     ev_pair = evidence.get('evidence_pair')
@@ -2553,12 +2722,16 @@ def taxonomy_demo(prompt=None, variations_steps=0):
 # ---------------------------------------------------------------------
 # Module-level blending function (exported for tests)
 # ---------------------------------------------------------------------
-def blend_fragments(def_list, subject=None):
+def blend_fragments(def_list, subject=None, fragments: Optional[List[str]] = None):
     """Blend a list of definition fragments into a concise combined string.
 
     This is a module-level copy of the internal blending logic so tests and
-    other modules can reuse it. Sets `. _last_fragments` on the function.
+    other modules can reuse it. When `fragments` is a list it is filled with
+    the cleaned fragments the result was built from (per call, so concurrent
+    callers never see each other's fragments).
     """
+    used = fragments if fragments is not None else []
+    del used[:]
     if not def_list:
         return ""
     import re
@@ -2582,6 +2755,12 @@ def blend_fragments(def_list, subject=None):
             words.pop()
         return ' '.join(words)
 
+    # tag every word of the input in one lexicon pass; the noun/participle checks below are lookups
+    try:
+        pos_lexicon.tag_many(w for d in def_list if isinstance(d, str) for w in re.findall(r"\b\w+\b", d))
+    except Exception:
+        pass
+
     # Clean fragments and remove duplicates while preserving order
     frags = []
     seen = set()
@@ -2595,24 +2774,22 @@ def blend_fragments(def_list, subject=None):
         seen.add(key)
         frags.append(s)
     if not frags:
-        blend_fragments._last_fragments = []
         return ""
-    blend_fragments._last_fragments = frags.copy()
+    used[:] = frags
 
     # If a wikipedia-derived summary exists for the subject, prefer it when it's informative
     try:
         if subject and isinstance(subject, str):
             wiki_path = os.path.join(os.path.dirname(__file__), 'data', 'wikipedia_defs.json')
             if os.path.exists(wiki_path):
-                with open(wiki_path, 'r', encoding='utf-8') as wf:
-                    wdefs = json.load(wf)
+                wdefs = knowledge_store.load_json(wiki_path)
                 ent = wdefs.get(subject) or wdefs.get(subject.lower())
                 if ent:
                     summ = ent.get('summary') if isinstance(ent, dict) else (ent if isinstance(ent, str) else None)
                     if summ and len(summ.split()) >= 6:
                         # return the lead sentence
                         lead = re.split(r'(?<=[.!?])\s+', summ.strip())[0]
-                        blend_fragments._last_fragments = [lead]
+                        used[:] = [lead]
                         return lead
     except Exception:
         pass
@@ -2662,7 +2839,7 @@ def blend_fragments(def_list, subject=None):
             cp = cp + '.'
         out_parts.append(cp)
     if out_parts:
-        blend_fragments._last_fragments = out_parts.copy()
+        used[:] = out_parts
         return ' '.join(out_parts)
 
     stop = set(["the","and","or","of","in","on","for","to","with","a","an","is"])
@@ -2695,30 +2872,10 @@ def blend_fragments(def_list, subject=None):
             return True
         return is_noun_like(w)
 
-    # Try to initialize spaCy for better POS tagging; if unavailable, fall back to heuristic
-    _spacy_nlp = None
-    try:
-        import spacy
-        try:
-            _spacy_nlp = spacy.load('en_core_web_sm')
-        except Exception:
-            # model not installed; attempt to load generic if available
-            try:
-                _spacy_nlp = spacy.load('en_core_web_sm')
-            except Exception:
-                _spacy_nlp = None
-    except Exception:
-        _spacy_nlp = None
-
+    # spaCy POS tag from the shared lexicon; heuristic when the word has no tag
     def is_noun_spacy(w: str) -> bool:
-        if not _spacy_nlp:
-            return False
         try:
-            doc = _spacy_nlp(w)
-            if not doc:
-                return False
-            tok = doc[0]
-            return tok.pos_ == 'NOUN' or tok.pos_ == 'PROPN'
+            return pos_lexicon.is_noun(w)
         except Exception:
             return False
 
@@ -1,9 +1,13 @@
 import os
 import json
 import re
-from collections import Counter
+import bisect
+import threading
+from collections import Counter, OrderedDict
 from typing import Optional, Tuple
 
+from knowledge_store import store
+
 STOPWORDS = set([w.strip() for w in ("the and or is a an of in on for to with by as at from that which who whom where when why how be been are was were it its this these those but if then so".split())])
 
 
@@ -18,53 +22,165 @@ def tokenize(text):
 
 
 def load_all_data(data_dir='data'):
-    data = {}
-    for fname in os.listdir(data_dir):
-        if not fname.endswith('.json'):
-            continue
-        try:
-            with open(os.path.join(data_dir, fname), 'r', encoding='utf8') as fh:
-                data[fname] = json.load(fh)
-        except Exception:
-            data[fname] = {}
-    return data
+    return store.files(data_dir)
 
 
-def find_entries(term, data_map):
-    """Return list of (file, key, entry_obj) matching by key or synonyms."""
-    nk = normalize_token(term)
-    out = []
-    for fname, data in data_map.items():
-        for k, v in data.items():
-            if normalize_token(k) == nk or nk in normalize_token(k):
-                out.append((fname, k, v))
+class EntryIndex:
+    """Pre-tokenized view of every entry in a data map.
+
+    Each entry's normalized key, normalized synonyms and gloss tokens are
+    computed once. Every distinct normalized string is kept in a vocabulary
+    that maps it to the entries it came from, so a term lookup only searches
+    the vocabulary instead of re-normalizing each file. Keyword lists and year
+    ranges for entry objects are memoized as they are requested.
+    Files whose top level is not a dict are skipped.
+    """
+
+    KEY, SYNONYM, GLOSS = 0, 1, 2
+
+    def __init__(self, data_map):
+        # keep the parsed files alive so the id()-based cache key stays unique
+        self.sources = list(data_map.items())
+        self.entries = []    # entry number -> (fname, key, value, [sub-objects])
+        self.postings = {}   # normalized string -> [(entry number, role, sub index)]
+        self._keywords = {}
+        self._ranges = {}
+        for fname, data in self.sources:
+            if not isinstance(data, dict):
                 continue
-            # check synonyms/gloss
-            if isinstance(v, list):
-                for o in v:
-                    if isinstance(o, dict):
-                        syns = o.get('synonyms', [])
-                        gloss = o.get('gloss','')
-                        for s in syns:
-                            if normalize_token(s) == nk or nk in normalize_token(s):
-                                out.append((fname, k, o))
-                                break
-                        if nk in ' '.join(tokenize(gloss)):
-                            out.append((fname, k, o))
-            elif isinstance(v, dict):
-                syns = v.get('synonyms', [])
-                gloss = v.get('gloss','')
-                for s in syns:
-                    if normalize_token(s) == nk or nk in normalize_token(s):
-                        out.append((fname, k, v))
-                        break
-                if nk in ' '.join(tokenize(gloss)):
-                    out.append((fname, k, v))
-    # keep unique by (fname,key)
-    uniq = {}
-    for f,k,v in out:
-        uniq[(f,k)] = (f,k,v)
-    return list(uniq.values())
+            for k, v in data.items():
+                n = len(self.entries)
+                if isinstance(v, list):
+                    subs = [o for o in v if isinstance(o, dict)]
+                elif isinstance(v, dict):
+                    subs = [v]
+                else:
+                    subs = []
+                self.entries.append((fname, k, v, subs))
+                self._post(normalize_token(k), n, self.KEY, -1)
+                for i, o in enumerate(subs):
+                    for syn in o.get('synonyms', []):
+                        self._post(normalize_token(syn), n, self.SYNONYM, i)
+                    for tok in set(tokenize(o.get('gloss', ''))):
+                        self._post(tok, n, self.GLOSS, i)
+        self.vocab = list(self.postings)
+        # one newline-separated blob lets substring search run in C
+        self._blob = '\n'.join(self.vocab)
+        self._starts = []
+        pos = 0
+        for w in self.vocab:
+            self._starts.append(pos)
+            pos += len(w) + 1
+
+    def _post(self, text, n, role, sub):
+        if text:
+            self.postings.setdefault(text, []).append((n, role, sub))
+
+    def _containing(self, nk):
+        """Vocabulary strings that contain `nk`."""
+        found = []
+        pos = self._blob.find(nk)
+        while pos != -1:
+            i = bisect.bisect_right(self._starts, pos) - 1
+            found.append(self.vocab[i])
+            # continue after the string that matched
+            nxt = self._starts[i] + len(self.vocab[i]) + 1
+            pos = self._blob.find(nk, nxt)
+        return found
+
+    def find(self, term):
+        """Same result as scanning every entry: (file, key, entry_obj) per matching entry."""
+        nk = normalize_token(term)
+        if not nk:
+            # an empty term is a substring of every key
+            return [(f, k, v) for f, k, v, _ in self.entries]
+        hits = {}
+        for text in self._containing(nk):
+            for n, role, sub in self.postings[text]:
+                best = hits.get(n)
+                if role == self.KEY or best == -1:
+                    hits[n] = -1
+                elif best is None or sub > best:
+                    hits[n] = sub
+        out = []
+        for n in sorted(hits):
+            fname, k, v, subs = self.entries[n]
+            # a key hit returns the whole entry; otherwise the last matching sub-object wins
+            out.append((fname, k, v if hits[n] == -1 else subs[hits[n]]))
+        return out
+
+    def keywords(self, entry_obj):
+        """Memoized `entry_keywords(entry_obj)`; treat the result as read-only."""
+        key = id(entry_obj)
+        cached = self._keywords.get(key)
+        if cached is None or cached[0] is not entry_obj:
+            cached = (entry_obj, entry_keywords(entry_obj))
+            self._keywords[key] = cached
+        return cached[1]
+
+    def year_ranges(self, entry_obj):
+        """(start, end) year ranges declared by an entry object (dict or list of dicts)."""
+        key = id(entry_obj)
+        cached = self._ranges.get(key)
+        if cached is None or cached[0] is not entry_obj:
+            cached = (entry_obj, _record_ranges(entry_obj))
+            self._ranges[key] = cached
+        return cached[1]
+
+
+def _record_ranges(val):
+    candidates = []
+    if isinstance(val, dict):
+        candidates.append(val)
+    elif isinstance(val, list):
+        for v in val:
+            if isinstance(v, dict):
+                candidates.append(v)
+    ranges = []
+    for rec in candidates:
+        sy = rec.get('start_year')
+        ey = rec.get('end_year')
+        if sy is None and 'year' in rec:
+            sy = rec.get('year')
+            ey = rec.get('year')
+        if sy is not None and ey is not None:
+            try:
+                ranges.append((int(sy), int(ey)))
+            except Exception:
+                continue
+    return ranges
+
+
+ENTRY_INDEX_CACHE_SIZE = 4
+# (file name, id(parsed data)) per file -> (index, the data objects); holding
+# the objects keeps their ids from being reused while the entry is cached
+_entry_index_cache = OrderedDict()
+_entry_index_lock = threading.Lock()
+
+
+def entry_index(data_map):
+    """`EntryIndex` for `data_map`, reused while its files are the same parsed objects.
+
+    The cache is keyed by object identity: treat the maps and their parsed
+    files as immutable. The last ENTRY_INDEX_CACHE_SIZE maps are kept.
+    """
+    key = tuple((fname, id(data)) for fname, data in data_map.items())
+    with _entry_index_lock:
+        cached = _entry_index_cache.get(key)
+        if cached is not None:
+            _entry_index_cache.move_to_end(key)
+            return cached[0]
+    index = EntryIndex(data_map)
+    with _entry_index_lock:
+        _entry_index_cache[key] = (index, tuple(data_map.values()))
+        while len(_entry_index_cache) > ENTRY_INDEX_CACHE_SIZE:
+            _entry_index_cache.popitem(last=False)
+    return index
+
+
+def find_entries(term, data_map):
+    """Return list of (file, key, entry_obj) matching by key, synonyms or gloss tokens."""
+    return entry_index(data_map).find(term)
 
 
 def entry_keywords(entry_obj):
@@ -90,8 +206,10 @@ def inclusion_score(broad_entry, narrow_entry):
 
     Returns score in [0,1] representing fraction of narrow tokens covered by broad tokens.
     """
-    broad = set(entry_keywords(broad_entry))
-    narrow = entry_keywords(narrow_entry)
+    return _inclusion(set(entry_keywords(broad_entry)), entry_keywords(narrow_entry))
+
+
+def _inclusion(broad, narrow):
     if not narrow:
         return 0.0
     if not broad:
@@ -100,34 +218,29 @@ def inclusion_score(broad_entry, narrow_entry):
     return match / max(1, len(narrow))
 
 
-def relation_between_terms(a, b, data_dir='data', include_threshold=0.6, overlap_threshold=0.25):
-    """Return a relation dict describing equality/inclusion/overlap/distinct.
+def _parse_year_range_from_term(term) -> Optional[Tuple[int,int]]:
+    """Parse an explicit year or year-range from a plain term like '1914' or '1914-1918'."""
+    nums = re.findall(r"-?\d{1,4}", term)
+    if not nums:
+        return None
+    years = [int(n) for n in nums]
+    if len(years) == 1:
+        return (years[0], years[0])
+    return (min(years), max(years))
 
-    relation types: 'equal' (synonym or identical), 'a_includes_b', 'b_includes_a', 'overlap', 'distinct'
-    """
-    data = load_all_data(data_dir)
-    found_a = find_entries(a, data)
-    found_b = find_entries(b, data)
-
-    # Helper: parse explicit year or year-range from a plain term like '1914' or '1914-1918'
-    def _parse_year_range_from_term(term) -> Optional[Tuple[int,int]]:
-        nums = re.findall(r"-?\d{1,4}", term)
-        if not nums:
-            return None
-        years = [int(n) for n in nums]
-        if len(years) == 1:
-            return (years[0], years[0])
-        return (min(years), max(years))
-
-    def _overlap_frac(s1,e1,s2,e2):
-        start = max(s1,s2)
-        end = min(e1,e2)
-        if end < start:
-            return 0.0
-        inter = end - start + 1
-        union = max(e1,e2) - min(s1,s2) + 1
-        return inter / union
 
+def _overlap_frac(s1,e1,s2,e2):
+    start = max(s1,s2)
+    end = min(e1,e2)
+    if end < start:
+        return 0.0
+    inter = end - start + 1
+    union = max(e1,e2) - min(s1,s2) + 1
+    return inter / union
+
+
+def _early_relation(a, b, found_a, found_b, index):
+    """Temporal and identical-token checks that decide a relation before any token scoring."""
     # If either term encodes a year/range explicitly, compute temporal relation first
     range_a = _parse_year_range_from_term(a)
     range_b = _parse_year_range_from_term(b)
@@ -136,25 +249,8 @@ def relation_between_terms(a, b, data_dir='data', include_threshold=0.6, overlap
     def _collect_ranges(found_list):
         ranges = []
         for fname, key, val in found_list:
-            # records may be dict or list
-            candidates = []
-            if isinstance(val, dict):
-                candidates.append(val)
-            elif isinstance(val, list):
-                for v in val:
-                    if isinstance(v, dict):
-                        candidates.append(v)
-            for rec in candidates:
-                sy = rec.get('start_year')
-                ey = rec.get('end_year')
-                if sy is None and 'year' in rec:
-                    sy = rec.get('year')
-                    ey = rec.get('year')
-                if sy is not None and ey is not None:
-                    try:
-                        ranges.append((int(sy), int(ey), f"{fname}:{key}"))
-                    except Exception:
-                        continue
+            for sy, ey in index.year_ranges(val):
+                ranges.append((sy, ey, f"{fname}:{key}"))
         return ranges
 
     ranges_a = _collect_ranges(found_a)
@@ -194,12 +290,42 @@ def relation_between_terms(a, b, data_dir='data', include_threshold=0.6, overlap
     # if exact same normalized name
     if normalize_token(a) == normalize_token(b):
         return {'relation':'equal', 'reason':'identical tokens'}
+    return None
+
+
+def _relation_from_scores(a, b, best_a_in_b, best_b_in_a, best_overlap, include_threshold, overlap_threshold):
+    """Final inclusion/overlap decision shared by the scalar and batch paths."""
+    if best_a_in_b >= include_threshold and best_b_in_a >= include_threshold:
+        return {'relation':'equal', 'reason':f'both definitions include the other (scores {best_a_in_b:.2f}/{best_b_in_a:.2f})'}
+    if best_a_in_b >= include_threshold:
+        return {'relation':'a_includes_b', 'score': best_a_in_b, 'reason': f'{a} definition covers {best_a_in_b:.2f} of {b}'}
+    if best_b_in_a >= include_threshold:
+        return {'relation':'b_includes_a', 'score': best_b_in_a, 'reason': f'{b} definition covers {best_b_in_a:.2f} of {a}'}
+    if best_overlap >= overlap_threshold:
+        return {'relation':'overlap', 'score': best_overlap, 'reason': f'Jaccard overlap {best_overlap:.2f}'}
+    return {'relation':'distinct', 'reason':'low overlap and no inclusion detected'}
+
+
+def relation_between_terms(a, b, data_dir='data', include_threshold=0.6, overlap_threshold=0.25):
+    """Return a relation dict describing equality/inclusion/overlap/distinct.
+
+    relation types: 'equal' (synonym or identical), 'a_includes_b', 'b_includes_a', 'overlap', 'distinct'
+    """
+    index = entry_index(load_all_data(data_dir))
+    found_a = index.find(a)
+    found_b = index.find(b)
+
+    early = _early_relation(a, b, found_a, found_b, index)
+    if early:
+        return early
+
+    # token sets per resolved entry, computed once instead of per pair
+    kws_a_list = [set(index.keywords(va)) for _, _, va in found_a]
+    kws_b_list = [set(index.keywords(vb)) for _, _, vb in found_b]
 
     # check synonyms / exact gloss equality
-    for fa, ka, va in found_a:
-        kws_a = set(entry_keywords(va))
-        for fb, kb, vb in found_b:
-            kws_b = set(entry_keywords(vb))
+    for (fa, ka, va), kws_a in zip(found_a, kws_a_list):
+        for (fb, kb, vb), kws_b in zip(found_b, kws_b_list):
             # identical gloss or large symmetric overlap
             if ka == kb and fa == fb:
                 return {'relation':'equal', 'reason':f'same entry in {fa}:{ka}'}
@@ -212,36 +338,153 @@ def relation_between_terms(a, b, data_dir='data', include_threshold=0.6, overlap
     # check inclusion both ways
     best_a_in_b = 0.0
     best_b_in_a = 0.0
-    for fa, ka, va in found_a:
-        for fb, kb, vb in found_b:
-            s_ab = inclusion_score(va, vb)
-            s_ba = inclusion_score(vb, va)
+    for (fa, ka, va), sa in zip(found_a, kws_a_list):
+        for (fb, kb, vb), sb in zip(found_b, kws_b_list):
+            s_ab = _inclusion(sa, index.keywords(vb))
+            s_ba = _inclusion(sb, index.keywords(va))
             best_a_in_b = max(best_a_in_b, s_ab)
             best_b_in_a = max(best_b_in_a, s_ba)
 
-    if best_a_in_b >= include_threshold and best_b_in_a >= include_threshold:
-        return {'relation':'equal', 'reason':f'both definitions include the other (scores {best_a_in_b:.2f}/{best_b_in_a:.2f})'}
-    if best_a_in_b >= include_threshold:
-        return {'relation':'a_includes_b', 'score': best_a_in_b, 'reason': f'{a} definition covers {best_a_in_b:.2f} of {b}'}
-    if best_b_in_a >= include_threshold:
-        return {'relation':'b_includes_a', 'score': best_b_in_a, 'reason': f'{b} definition covers {best_b_in_a:.2f} of {a}'}
-
     # partial overlap
     # compute token overlap across best pair
     best_overlap = 0.0
-    for fa, ka, va in found_a:
-        for fb, kb, vb in found_b:
-            sa = set(entry_keywords(va))
-            sb = set(entry_keywords(vb))
+    for sa in kws_a_list:
+        for sb in kws_b_list:
             if not sa or not sb:
                 continue
             inter = len(sa & sb)
             j = inter / max(1, len(sa | sb))
             best_overlap = max(best_overlap, j)
-    if best_overlap >= overlap_threshold:
-        return {'relation':'overlap', 'score': best_overlap, 'reason': f'Jaccard overlap {best_overlap:.2f}'}
 
-    return {'relation':'distinct', 'reason':'low overlap and no inclusion detected'}
+    return _relation_from_scores(a, b, best_a_in_b, best_b_in_a, best_overlap, include_threshold, overlap_threshold)
+
+
+def relations_for_pairs(pairs, data_dir='data', include_threshold=0.6, overlap_threshold=0.25, max_entries_per_batch=2048):
+    """Batch version of `relation_between_terms` for many (a, b) pairs.
+
+    Returns one relation dict per pair, identical to calling the scalar function
+    on each. Every distinct entry is encoded once as a token-count vector; set
+    sizes, intersections and inclusion counts for all entry pairs of a batch come
+    from two matrix products, and the per-pair maxima and first synonym hits are
+    reduced with NumPy. `max_entries_per_batch` bounds the matrices' size.
+    """
+    import numpy as np
+
+    index = entry_index(load_all_data(data_dir))
+    found_cache = {}
+
+    def found(term):
+        if term not in found_cache:
+            found_cache[term] = index.find(term)
+        return found_cache[term]
+
+    results = [None] * len(pairs)
+    batch, batch_objs = [], {}
+
+    def flush():
+        if batch:
+            _score_batch(np, index, batch, list(batch_objs.values()), results, include_threshold, overlap_threshold)
+        batch.clear()
+        batch_objs.clear()
+
+    for i, (a, b) in enumerate(pairs):
+        found_a, found_b = found(a), found(b)
+        early = _early_relation(a, b, found_a, found_b, index)
+        if early:
+            results[i] = early
+            continue
+        if not found_a or not found_b:
+            results[i] = _relation_from_scores(a, b, 0.0, 0.0, 0.0, include_threshold, overlap_threshold)
+            continue
+        new_objs = {id(v): v for _, _, v in found_a + found_b if id(v) not in batch_objs}
+        if batch and len(batch_objs) + len(new_objs) > max_entries_per_batch:
+            flush()
+            new_objs = {id(v): v for _, _, v in found_a + found_b}
+        batch_objs.update(new_objs)
+        batch.append((i, a, b, found_a, found_b))
+    flush()
+    return results
+
+
+def _score_batch(np, index, batch, objs, results, include_threshold, overlap_threshold):
+    row = {id(o): r for r, o in enumerate(objs)}
+    kws = [index.keywords(o) for o in objs]
+    set_size = np.array([len(set(k)) for k in kws], dtype=np.int32)
+    list_len = np.array([len(k) for k in kws], dtype=np.int32)
+    # tokens held by a single entry never meet another entry, so only shared
+    # tokens become columns; this keeps the matrix products small
+    holders = Counter(t for k in kws for t in set(k))
+    vocab = {}
+    cells = []
+    for r, k in enumerate(kws):
+        for t in k:
+            if holders[t] > 1:
+                cells.append((r, vocab.setdefault(t, len(vocab))))
+    counts = np.zeros((len(objs), max(1, len(vocab))), dtype=np.float32)
+    if cells:
+        rr, cc = np.array(cells).T
+        np.add.at(counts, (rr, cc), 1)
+    present = (counts > 0).astype(np.float32)
+    # inter[i, j] = |set_i & set_j|; covered[i, j] = tokens of list_j found in set_i
+    inter_m = np.rint(present @ present.T).astype(np.int32)
+    covered_m = np.rint(present @ counts.T).astype(np.int32)
+
+    # flatten every (entry of a) x (entry of b) pair, row-major like the scalar loops
+    key_ids = {}
+    term_arrays = {}
+
+    def arrays(found_list):
+        cached = term_arrays.get(id(found_list))
+        if cached is None:
+            rows = np.array([row[id(v)] for _, _, v in found_list], dtype=np.int32)
+            keys = np.array([key_ids.setdefault((f, k), len(key_ids)) for f, k, _ in found_list])
+            cached = term_arrays[id(found_list)] = (rows, keys)
+        return cached
+
+    parts_i, parts_j, parts_same, sizes = [], [], [], []
+    for _, _, _, found_a, found_b in batch:
+        rows_a, keys_a = arrays(found_a)
+        rows_b, keys_b = arrays(found_b)
+        parts_i.append(np.repeat(rows_a, len(rows_b)))
+        parts_j.append(np.tile(rows_b, len(rows_a)))
+        parts_same.append(np.repeat(keys_a, len(keys_b)) == np.tile(keys_b, len(keys_a)))
+        sizes.append(len(rows_a) * len(rows_b))
+    I = np.concatenate(parts_i)
+    J = np.concatenate(parts_j)
+    same = np.concatenate(parts_same)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    seg = np.repeat(np.arange(len(batch)), sizes)
+
+    inter = inter_m[I, J]
+    sa, sb = set_size[I], set_size[J]
+    syn_hit = same | (inter / np.maximum(1, np.minimum(sa, sb)) > 0.85)
+
+    def inclusion(cov, broad_size, narrow_len):
+        ok = (narrow_len > 0) & (broad_size > 0)
+        return np.where(ok, cov / np.maximum(1, narrow_len), 0.0)
+
+    s_ab = inclusion(covered_m[I, J], sa, list_len[J])
+    s_ba = inclusion(covered_m[J, I], sb, list_len[I])
+    jac = np.where((sa > 0) & (sb > 0), inter / np.maximum(1, sa + sb - inter), 0.0)
+    best_ab = np.maximum.reduceat(s_ab, starts)
+    best_ba = np.maximum.reduceat(s_ba, starts)
+    best_jac = np.maximum.reduceat(jac, starts)
+    hit_pos = np.flatnonzero(syn_hit)
+    hit_segs, first = np.unique(seg[hit_pos], return_index=True)
+    first_hit = dict(zip(hit_segs.tolist(), hit_pos[first].tolist()))
+
+    for s, (i, a, b, found_a, found_b) in enumerate(batch):
+        k = first_hit.get(s)
+        if k is not None:
+            off = k - starts[s]
+            fa, ka, _ = found_a[off // len(found_b)]
+            fb, kb, _ = found_b[off % len(found_b)]
+            if same[k]:
+                results[i] = {'relation':'equal', 'reason':f'same entry in {fa}:{ka}'}
+            else:
+                results[i] = {'relation':'equal', 'reason':f'high token overlap between {ka} and {kb}'}
+            continue
+        results[i] = _relation_from_scores(a, b, float(best_ab[s]), float(best_ba[s]), float(best_jac[s]), include_threshold, overlap_threshold)
 
 
 def cli(argv):
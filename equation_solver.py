@@ -0,0 +1,227 @@
+"""Equation solving service for the shell's `a = b, c = d` lines.
+
+The shell used to import sympy and `sympify` both sides of every equation on
+each line. `EquationSolver` keeps a sympy worker process alive instead:
+
+- lines are canonicalized (first 10 equations, whitespace collapsed) and the
+  outcome is cached per canonical text, so repeating a line is instant;
+- the worker keeps its own cache of parsed sides, so systems that reuse an
+  equation only parse the new ones;
+- each solve has a timeout; a worker stuck on a pathological system is killed
+  and replaced on the next request, and the REPL thread never blocks past it
+  (timeouts are not cached);
+- `prewarm()` starts the worker (and imports sympy in it) in the background
+  at startup.
+
+The result cache has its own lock, held only for lookups and inserts; the
+worker pipe is guarded separately, so cache hits are answered while another
+line is being solved.
+
+If a worker process cannot be started, solving falls back to the calling
+process without a timeout.
+"""
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+MAX_EQUATIONS = 10
+DEFAULT_TIMEOUT = 10.0
+_MAX_PARSED = 1024
+
+
+def canonicalize(line: str) -> Tuple[Tuple[str, ...], bool]:
+    """(canonical equations, truncated) for a comma-separated line of equations.
+
+    Keeps the parts containing '=', at most MAX_EQUATIONS of them, with
+    surrounding whitespace stripped and inner runs of whitespace collapsed.
+    """
+    eqs = [re.sub(r'\s+', ' ', eq.strip()) for eq in line.split(',') if '=' in eq]
+    truncated = len(eqs) > MAX_EQUATIONS
+    return tuple(eqs[:MAX_EQUATIONS]), truncated
+
+
+def _solve_equations(eqs, parsed: Dict) -> Tuple[str, object]:
+    """Solve canonical equations. Returns ('ok', [[(name, value), ...], ...]) or ('error', message)."""
+    try:
+        from sympy import Eq, solve, sympify
+
+        def parse(text):
+            expr = parsed.get(text)
+            if expr is None:
+                if len(parsed) >= _MAX_PARSED:
+                    parsed.clear()
+                expr = parsed[text] = sympify(text)
+            return expr
+
+        sympy_eqs = []
+        all_vars = set()
+        for eq in eqs:
+            left, right = eq.split('=', 1)
+            left_expr = parse(left)
+            right_expr = parse(right)
+            sympy_eqs.append(Eq(left_expr, right_expr))
+            all_vars.update(left_expr.free_symbols)
+            all_vars.update(right_expr.free_symbols)
+        if not sympy_eqs:
+            raise ValueError
+        sol = solve(sympy_eqs, list(all_vars), dict=True)
+        return 'ok', [[(str(k), str(v)) for k, v in s.items()] for s in sol]
+    except Exception as e:
+        return 'error', str(e)
+
+
+def _worker_main(conn):
+    parsed = {}
+    _solve_equations(('x = 1',), parsed)   # import and warm sympy before the first request
+    while True:
+        try:
+            eqs = conn.recv()
+        except (EOFError, OSError):
+            break
+        if eqs is None:
+            break
+        conn.send(_solve_equations(eqs, parsed))
+
+
+class EquationSolver:
+    """Cached, timeout-guarded equation solving backed by one sympy worker process."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, cache_size: int = 256, use_process: bool = True):
+        self.timeout = timeout
+        self.cache_size = cache_size
+        self.use_process = use_process
+        self._results: 'OrderedDict[Tuple[str, ...], Tuple[str, object]]' = OrderedDict()
+        self._parsed: Dict = {}
+        self._proc = None
+        self._conn = None
+        self._lock = threading.Lock()         # result cache and hit/miss counts
+        self._worker_lock = threading.Lock()  # the worker process and its pipe
+        self.stats = {'hits': 0, 'misses': 0, 'timeouts': 0, 'restarts': 0}
+
+    # -- worker process -----------------------------------------------------
+    def _start_worker(self) -> bool:
+        if self._proc is not None and self._proc.is_alive():
+            return True
+        self._stop_worker()
+        if not self.use_process:
+            return False
+        try:
+            import multiprocessing
+            parent, child = multiprocessing.Pipe()
+            proc = multiprocessing.Process(target=_worker_main, args=(child,), daemon=True)
+            proc.start()
+            child.close()
+        except Exception:
+            self.use_process = False
+            return False
+        self._proc, self._conn = proc, parent
+        return True
+
+    def _stop_worker(self, restart: bool = True) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.terminate()
+                self._proc.join(1.0)
+            except Exception:
+                pass
+            if restart:
+                self.stats['restarts'] += 1
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+        self._proc = self._conn = None
+
+    def prewarm(self) -> threading.Thread:
+        """Start the worker (and its sympy import) in a background thread."""
+        def warm():
+            with self._worker_lock:
+                if not self._start_worker():
+                    _solve_equations(('x = 1',), self._parsed)
+        th = threading.Thread(target=warm, daemon=True)
+        th.start()
+        return th
+
+    def close(self) -> None:
+        with self._worker_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.send(None)
+                except Exception:
+                    pass
+            self._stop_worker(restart=False)
+
+    def _run(self, eqs, timeout) -> Tuple[str, object]:
+        with self._worker_lock:
+            if not self._start_worker():
+                return _solve_equations(eqs, self._parsed)
+            try:
+                self._conn.send(eqs)
+                if self._conn.poll(timeout):
+                    return self._conn.recv()
+            except (EOFError, OSError) as e:
+                self._stop_worker()
+                return 'error', f'solver process failed: {e}'
+            self._stop_worker()
+            self.stats['timeouts'] += 1
+            return 'timeout', f'timed out after {timeout:g}s'
+
+    # -- public API ---------------------------------------------------------
+    def solve(self, line: str, timeout: Optional[float] = None) -> Dict:
+        """Solve the equations in `line`.
+
+        Returns {'equations', 'truncated', 'cached', 'solutions', 'error',
+        'timed_out'} where `solutions` is a list of [(variable, value), ...]
+        and `error` is the message when solving failed or timed out.
+        """
+        eqs, truncated = canonicalize(line)
+        with self._lock:
+            outcome = self._results.get(eqs)
+            cached = outcome is not None
+            if cached:
+                self._results.move_to_end(eqs)
+                self.stats['hits'] += 1
+            else:
+                self.stats['misses'] += 1
+        if not cached:
+            outcome = self._run(eqs, self.timeout if timeout is None else timeout)
+            # timeouts are not cached so the line can be retried with a longer limit
+            if outcome[0] != 'timeout':
+                with self._lock:
+                    self._results[eqs] = outcome
+                    self._results.move_to_end(eqs)
+                    while len(self._results) > self.cache_size:
+                        self._results.popitem(last=False)
+        status, payload = outcome
+        return {
+            'equations': list(eqs),
+            'truncated': truncated,
+            'cached': cached,
+            'solutions': payload if status == 'ok' else [],
+            'error': None if status == 'ok' else payload,
+            'timed_out': status == 'timeout',
+        }
+
+
+def format_solutions(result: Dict, max_vars: Optional[int] = 10) -> List[str]:
+    """Output lines for a `solve()` result, as the shell prints them.
+
+    Solutions with more than `max_vars` variables end in '...'; None prints
+    them all.
+    """
+    if result['error'] is not None:
+        return [f"Could not solve equation(s): {result['error']}"]
+    if not result['solutions']:
+        return ['No solution found.']
+    lines = []
+    for s in result['solutions']:
+        parts = [f'{k} = {v}' for k, v in s]
+        if max_vars is not None and len(parts) > max_vars:
+            parts = parts[:max_vars] + ['...']
+        lines.append(', '.join(parts))
+    return lines
+
+
+solver = EquationSolver()
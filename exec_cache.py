@@ -0,0 +1,153 @@
+"""Shared LRU cache of the callables built from `exec` lambda strings in the data files.
+
+`eng1neer.parse_math_exec` and `taxonomic_grammar._parse_exec_callable` used to
+`eval` the lambda source on every call. Both now go through `exec_cache`, keyed
+by (profile, source text). A profile fixes how the source is compiled:
+
+- 'safe':   eval with only `math` and no builtins (what `parse_math_exec` did)
+- 'lambda': the source must parse to a lambda; eval with `math` and the
+            normal builtins (what `_parse_exec_callable` did)
+
+Sources that fail to compile are cached too (as None), so a broken entry is not
+re-parsed on every lookup. `precompile_data()` compiles every `exec` field of a
+data directory once per change of its files, for the one profile the caller
+evaluates with; the loaders call it so the first evaluation is already a hit.
+Precompilation stops at the cache's `maxsize` so it never evicts the entries it
+just built; anything beyond that compiles lazily on first use.
+`exec_cache.info()` reports hit rates.
+"""
+import ast
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from knowledge_store import DATA_DIR, store
+
+DEFAULT_MAXSIZE = 4096
+PROFILES = ('safe', 'lambda')
+
+_SAFE_GLOBALS = {'math': math, '__builtins__': {}}
+_LAMBDA_GLOBALS = {'math': math}
+
+
+def compile_exec(source: str, profile: str = 'safe') -> Optional[Callable]:
+    """Build the callable for `source` without caching; None when it does not compile."""
+    if not source or not isinstance(source, str):
+        return None
+    try:
+        if profile == 'lambda':
+            node = ast.parse(source, mode='eval')
+            if not isinstance(node.body, ast.Lambda):
+                return None
+            return eval(compile(node, '<exec>', 'eval'), _LAMBDA_GLOBALS, {})
+        return eval(source, _SAFE_GLOBALS, {})
+    except Exception:
+        return None
+
+
+def iter_exec_sources(obj: Any) -> Iterable[str]:
+    """Every string stored under an 'exec' key anywhere inside `obj`."""
+    stack = [obj]
+    while stack:
+        cur = stack.pop()
+        if isinstance(cur, dict):
+            for k, v in cur.items():
+                if k == 'exec' and isinstance(v, str):
+                    yield v
+                elif isinstance(v, (dict, list)):
+                    stack.append(v)
+        elif isinstance(cur, list):
+            stack.extend(v for v in cur if isinstance(v, (dict, list)))
+
+
+class ExecCache:
+    """Bounded, thread-safe LRU of compiled exec callables with hit statistics."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[tuple, Optional[Callable]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'precompiled': 0, 'failures': 0, 'evictions': 0}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, source: str, profile: str = 'safe') -> Optional[Callable]:
+        """Compiled callable for `source` (None if it cannot be compiled)."""
+        key = (profile, source)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return self._entries[key]
+            self.stats['misses'] += 1
+        fn = compile_exec(source, profile)
+        self._store(key, fn)
+        return fn
+
+    def _store(self, key, fn):
+        with self._lock:
+            if fn is None:
+                self.stats['failures'] += 1
+            self._entries[key] = fn
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def precompile(self, sources: Iterable[str], profiles: Iterable[str] = PROFILES) -> int:
+        """Compile `sources` ahead of use for each profile. Returns the number newly compiled.
+
+        At most `maxsize` (profile, source) pairs are considered; the rest are
+        left to compile on first lookup.
+        """
+        profiles = tuple(profiles)
+        added = 0
+        budget = self.maxsize
+        for source in sources:
+            if not isinstance(source, str):
+                continue
+            for profile in profiles:
+                if budget <= 0:
+                    break
+                budget -= 1
+                key = (profile, source)
+                with self._lock:
+                    if key in self._entries:
+                        continue
+                self._store(key, compile_exec(source, profile))
+                added += 1
+        with self._lock:
+            self.stats['precompiled'] += added
+        return added
+
+    def precompile_data(self, data_dir: str = DATA_DIR, profile: str = 'lambda') -> int:
+        """Precompile every `exec` field in `data_dir` for `profile`; a no-op until one of its files changes.
+
+        Returns the number of distinct exec sources in the directory.
+        """
+        def build(files):
+            sources = sorted({s for data in files.values() for s in iter_exec_sources(data)})
+            self.precompile(sources, (profile,))
+            return sources
+        return len(store.view(f'exec_sources:{profile}:{id(self)}', build, data_dir))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for k in self.stats:
+                self.stats[k] = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Counters plus current size and hit rate (hits / lookups)."""
+        with self._lock:
+            out = dict(self.stats)
+            out['size'] = len(self._entries)
+            out['maxsize'] = self.maxsize
+        lookups = out['hits'] + out['misses']
+        out['hit_rate'] = out['hits'] / lookups if lookups else 0.0
+        return out
+
+
+exec_cache = ExecCache()
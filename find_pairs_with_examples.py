@@ -5,8 +5,8 @@ mentioning shared anchor nouns (i.e., not purely template output).
 Usage: python find_pairs_with_examples.py --top 20
 """
 import argparse
+import heapq
 import importlib.util
-import itertools
 import json
 import re
 from pathlib import Path
@@ -39,59 +39,120 @@ def sentences_with_term(text, term, max_n=2):
     return out
 
 
+def normalize_definition(x, name):
+    """Definition text cleaned the same way compare_subjects does it."""
+    if isinstance(x, dict):
+        if 'definition' in x and isinstance(x['definition'], str):
+            t = x['definition']
+        else:
+            t = ' '.join(str(v) for v in x.values())
+    elif isinstance(x, list):
+        t = ' '.join(str(i) for i in x)
+    else:
+        t = str(x or '')
+    t = _clean_definition_text(t)
+    t = _strip_leading_term(t, name)
+    t = _ensure_periods_in_text(t)
+    return t
+
+
+_worker_state = None
+
+
+def _init_worker(state):
+    global _worker_state
+    _worker_state = state
+
+
+def _top_rows(rows, top):
+    """Best `top` pairs (i, j > i) for i in `rows`, as a min-heap of ranking tuples.
+
+    Heap items are ((examples, shared, -i, -j), samples); the negated indexes make
+    ties rank in the combinations() order of the full scan.
+    """
+    texts, nouns, postings = _worker_state
+    sentence_cache = {}
+
+    def first_sentence(i, term):
+        key = (i, term)
+        if key not in sentence_cache:
+            sentence_cache[key] = sentences_with_term(texts[i], term, max_n=1)[:1]
+        return sentence_cache[key]
+
+    heap = []
+    for i in rows:
+        na = nouns[i]
+        cands = set()
+        for n in na:
+            cands.update(postings[n])
+        for j in sorted(cands):
+            if j <= i:
+                continue
+            shared = sorted(na & nouns[j])
+            # a pair can have at most min(6, len(shared)) examples
+            if len(heap) >= top and (min(6, len(shared)), len(shared), -i, -j) <= heap[0][0]:
+                continue
+            samples = []
+            for term in shared[:6]:
+                sa = first_sentence(i, term)
+                sb = first_sentence(j, term)
+                if sa or sb:
+                    samples.append((term, sa, sb))
+            if not samples:
+                continue
+            item = ((len(samples), len(shared), -i, -j), samples)
+            if len(heap) < top:
+                heapq.heappush(heap, item)
+            elif item[0] > heap[0][0]:
+                heapq.heapreplace(heap, item)
+    return heap
+
+
+def find_pairs(defs, top=20, workers=1):
+    """Top `top` subject pairs whose definitions have example sentences for shared nouns.
+
+    Returns (examples, shared_count, subject_a, subject_b, samples) tuples in the
+    order the full `itertools.combinations` scan reports them. Definitions are
+    cleaned and their nouns extracted once per subject, candidate pairs come from
+    an inverted noun index, and only a top-N heap is kept while scanning.
+    `workers` > 1 scans rows in a process pool and merges the per-worker heaps.
+    """
+    if top <= 0:
+        return []
+    keys = sorted(defs.keys())
+    texts = [normalize_definition(defs.get(k, ''), k) for k in keys]
+    nouns = [frozenset(extract_nouns_and_predicates(t)[0]) for t in texts]
+    postings = {}
+    for i, ns in enumerate(nouns):
+        for n in ns:
+            postings.setdefault(n, []).append(i)
+    state = (texts, nouns, postings)
+
+    rows = list(range(len(keys)))
+    if workers and workers > 1 and len(rows) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        chunks = [rows[w::workers * 4] for w in range(workers * 4)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as pool:
+            items = [it for heap in pool.map(_top_rows, chunks, [top] * len(chunks)) for it in heap]
+    else:
+        _init_worker(state)
+        try:
+            items = _top_rows(rows, top)
+        finally:
+            _init_worker(None)
+
+    best = heapq.nlargest(top, items, key=lambda it: it[0])
+    return [(rank[0], rank[1], keys[-rank[2]], keys[-rank[3]], samples) for rank, samples in best]
+
+
 def main():
     p = argparse.ArgumentParser()
     p.add_argument('--top', '-n', type=int, default=20)
+    p.add_argument('--workers', '-w', type=int, default=1, help='processes used to scan subject pairs')
     args = p.parse_args()
 
     defs = load_subject_definitions()
-    keys = sorted(defs.keys())
-
-    results = []
-    for a, b in itertools.combinations(keys, 2):
-        a_raw = defs.get(a, '')
-        b_raw = defs.get(b, '')
-        # normalize similar to compare_subjects
-        def norm(x, name):
-            if isinstance(x, dict):
-                if 'definition' in x and isinstance(x['definition'], str):
-                    t = x['definition']
-                else:
-                    t = ' '.join(str(v) for v in x.values())
-            elif isinstance(x, list):
-                t = ' '.join(str(i) for i in x)
-            else:
-                t = str(x or '')
-            t = _clean_definition_text(t)
-            t = _strip_leading_term(t, name)
-            t = _ensure_periods_in_text(t)
-            return t
-
-        a_def = norm(a_raw, a)
-        b_def = norm(b_raw, b)
-
-        a_nouns, _ = extract_nouns_and_predicates(a_def)
-        b_nouns, _ = extract_nouns_and_predicates(b_def)
-        shared = sorted(list(a_nouns & b_nouns))
-        if not shared:
-            continue
-
-        # Check for actual sentences in either def that mention shared nouns
-        sample_sentences = []
-        for term in shared[:6]:
-            sa = sentences_with_term(a_def, term, max_n=1)
-            sb = sentences_with_term(b_def, term, max_n=1)
-            if sa or sb:
-                sample_sentences.append((term, sa[:1], sb[:1]))
-        if not sample_sentences:
-            continue
-
-        results.append((len(sample_sentences), len(shared), a, b, sample_sentences))
-
-    # sort by number of sample sentences then shared nouns (desc)
-    results.sort(key=lambda x: (x[0], x[1]), reverse=True)
-
-    top = results[: args.top]
+    top = find_pairs(defs, top=args.top, workers=args.workers)
     for count_examples, shared_count, a, b, samples in top:
         print(f"{a} <-> {b}  | examples:{count_examples} shared:{shared_count}")
         for term, sa, sb in samples:
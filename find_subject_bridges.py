@@ -3,30 +3,24 @@
 Produces a ranked list of subject pairs with a percent similarity score and a
 candidate bridge word or shared term. Uses the same local heuristics as
 `compare_subjects.py` (nouns/predicates/participles/conjunctives).
+
+By default pairs are found with `find_bridges` (features extracted once, an
+inverted token index for candidates, optional `--workers` process pool);
+`--exhaustive` keeps the original score-every-pair scan for reference.
 """
 
+import bisect
 import json
 import os
 import re
 from itertools import combinations
 
+from knowledge_store import store
+
 
 def load_subject_definitions(data_dir='data'):
-    defs = {}
-    if not os.path.isdir(data_dir):
-        return defs
-    for fn in os.listdir(data_dir):
-        if not fn.endswith('.json'):
-            continue
-        try:
-            with open(os.path.join(data_dir, fn), 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    for k, v in data.items():
-                        defs[k.lower()] = v
-        except Exception:
-            continue
-    return defs
+    # merged view is cached by the knowledge store; copy so callers may mutate it
+    return dict(store.merged_terms(data_dir))
 
 
 STOPWORDS = {
@@ -119,6 +113,128 @@ def percent_similarity(a_def, b_def, thesaurus):
     return percent, shared, bridge
 
 
+def extract_features(text: str):
+    """The four feature sets `percent_similarity` compares, extracted once per subject."""
+    nouns, preds = extract_nouns_and_predicates(text)
+    partics, conjs = extract_participles_and_conjunctives(text)
+    return (frozenset(nouns), frozenset(preds), frozenset(partics), frozenset(conjs))
+
+
+def feature_percent(fa, fb):
+    """`percent_similarity` score computed from precomputed feature sets."""
+    sims = [jaccard(x, y) for x, y in zip(fa, fb)]
+    return (sims[0] * 0.50 + sims[1] * 0.30 + sims[2] * 0.15 + sims[3] * 0.05) * 100
+
+
+def _signature_percent(sig_a, sig_b):
+    """Score of a pair sharing no token, given which feature sets are non-empty.
+
+    Categories empty on both sides have Jaccard 1, all others 0.
+    """
+    sims = [0.0 if (x or y) else 1.0 for x, y in zip(sig_a, sig_b)]
+    return (sims[0] * 0.50 + sims[1] * 0.30 + sims[2] * 0.15 + sims[3] * 0.05) * 100
+
+
+_worker_state = None
+
+
+def _init_worker(state):
+    global _worker_state
+    _worker_state = state
+
+
+def _score_rows(rows, threshold):
+    """All pairs (i, j > i) at or above `threshold`, for i in `rows`.
+
+    Pairs sharing a token (found through the inverted index) are scored
+    exactly; every other pair scores its signature constant.
+    """
+    features, sigs, groups, postings = _worker_state
+    base = {}
+    out = []
+    for i in rows:
+        fa = features[i]
+        cands = set()
+        for c, feats in enumerate(fa):
+            for tok in feats:
+                cands.update(postings[(c, tok)])
+        a0, a1, a2, a3 = fa
+        for j in sorted(cands):
+            if j <= i:
+                continue
+            b0, b1, b2, b3 = features[j]
+            sims = []
+            for x, y in ((a0, b0), (a1, b1), (a2, b2), (a3, b3)):
+                if not x and not y:
+                    sims.append(1.0)
+                else:
+                    inter = len(x & y)
+                    sims.append(inter / (len(x) + len(y) - inter))
+            percent = (sims[0] * 0.50 + sims[1] * 0.30 + sims[2] * 0.15 + sims[3] * 0.05) * 100
+            if percent >= threshold:
+                out.append((percent, i, j, tuple(sorted(a0 & b0))))
+        for sig, members in groups:
+            key = (sigs[i], sig)
+            if key not in base:
+                base[key] = _signature_percent(*key)
+            percent = base[key]
+            if percent < threshold:
+                continue
+            for j in members[bisect.bisect_right(members, i):]:
+                if j not in cands:
+                    out.append((percent, i, j, ()))
+    return out
+
+
+def find_bridges(defs, thesaurus, threshold=20.0, workers=1):
+    """Every subject pair with percent similarity >= `threshold`, best first.
+
+    Same results and order as scoring every `itertools.combinations` pair with
+    `percent_similarity`, but feature sets are extracted once per subject and
+    only pairs that share a token (found through an inverted token index) are
+    scored. A pair sharing nothing scores a constant fixed by which of its
+    feature sets are empty, so those pairs are emitted per signature group.
+    `workers` > 1 scores rows in a process pool.
+    Returns (percent, subject_a, subject_b, shared_terms[:6], bridge) tuples.
+    """
+    keys = sorted(defs.keys())
+    features = [extract_features(normalize_value(defs[k])) for k in keys]
+    sigs = [tuple(bool(x) for x in fa) for fa in features]
+    postings = {}
+    for i, fa in enumerate(features):
+        for c, feats in enumerate(fa):
+            for tok in feats:
+                postings.setdefault((c, tok), []).append(i)
+    groups = {}
+    for i, sig in enumerate(sigs):
+        groups.setdefault(sig, []).append(i)
+    state = (features, sigs, list(groups.items()), postings)
+
+    rows = list(range(len(keys)))
+    if workers and workers > 1 and len(rows) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        # interleave rows so every worker gets a similar mix of long and short rows
+        chunks = [rows[w::workers * 4] for w in range(workers * 4)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(state,)) as pool:
+            scored = [hit for part in pool.map(_score_rows, chunks, [threshold] * len(chunks)) for hit in part]
+    else:
+        _init_worker(state)
+        try:
+            scored = _score_rows(rows, threshold)
+        finally:
+            _init_worker(None)
+
+    # best first; ties keep the combinations() order of the exhaustive scan
+    scored.sort(key=lambda x: (-x[0], x[1], x[2]))
+    bridges = {}
+    results = []
+    for percent, i, j, shared in scored:
+        if shared not in bridges:
+            bridges[shared] = find_bridge_word(list(shared), thesaurus, '', '')
+        results.append((percent, keys[i], keys[j], list(shared[:6]), bridges[shared]))
+    return results
+
+
 def load_thesaurus(path='thesaurus_assoc.json'):
     if not os.path.exists(path):
         return {}
@@ -142,18 +258,23 @@ def main(argv=None):
     parser.add_argument('-n', '--top', type=int, default=50, help='number of top results to show')
     parser.add_argument('-t', '--threshold', type=float, default=20.0, help='minimum percent similarity to report')
     parser.add_argument('--data-dir', default='data', help='data directory')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='processes used to score candidate pairs')
+    parser.add_argument('--exhaustive', action='store_true', help='score every pair from the raw text (slow reference mode)')
     args = parser.parse_args(argv)
 
     defs = load_subject_definitions(data_dir=args.data_dir)
     thes = load_thesaurus()
-    keys = sorted(defs.keys())
-    results = []
-    for a, b in combinations(keys, 2):
-        a_def = normalize_value(defs[a])
-        b_def = normalize_value(defs[b])
-        percent, shared, bridge = percent_similarity(a_def, b_def, thes)
-        if percent >= args.threshold:  # candidate threshold
-            results.append((percent, a, b, shared[:6], bridge))
+    if args.exhaustive:
+        keys = sorted(defs.keys())
+        results = []
+        for a, b in combinations(keys, 2):
+            a_def = normalize_value(defs[a])
+            b_def = normalize_value(defs[b])
+            percent, shared, bridge = percent_similarity(a_def, b_def, thes)
+            if percent >= args.threshold:  # candidate threshold
+                results.append((percent, a, b, shared[:6], bridge))
+    else:
+        results = find_bridges(defs, thes, threshold=args.threshold, workers=args.workers)
 
     results.sort(reverse=True, key=lambda x: x[0])
     top = results[:args.top]
@@ -0,0 +1,229 @@
+"""Streaming fragment -> normalize -> sympy-parse pipeline over JSONL.
+
+Input is JSONL with one `{"key": ..., "fragment": ...}` record per line (the
+shape of `data/extracted_formulas.jsonl`; extra fields are ignored). Records
+are read lazily, fragments are normalized with `formula_utils.normalize_fragment`
+and deduplicated by a hash of the normalized text, and parsing runs in batches,
+optionally in a process pool. Each output line is
+
+    {"key", "fragment", "normalized", "hash", "parsed", "parse_error"}
+
+written in input order as soon as its batch is done. After every batch a
+checkpoint (`<output>.ckpt`) records how far the input and the output got, so
+an interrupted run resumes where it stopped: the output is truncated to the
+last checkpoint and the dedup set is rebuilt from it. Memory use is bounded by
+the in-flight batches plus one 64-bit hash per distinct fragment.
+
+    python formula_pipeline.py data/extracted_formulas.jsonl parsed.jsonl --workers 4
+"""
+import hashlib
+import json
+import os
+import sys
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from formula_utils import normalize_fragment
+
+DEFAULT_BATCH_SIZE = 256
+MAX_FRAGMENT_LENGTH = 500
+
+
+def fragment_hash(text: str) -> str:
+    """Content hash used for deduplication (16 hex chars)."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def iter_jsonl(path: str, offset: int = 0) -> Iterator[Tuple[int, Dict]]:
+    """Yield (byte offset after the line, record) for each JSON object line from `offset` on.
+
+    Blank, broken and non-object lines are skipped (their offsets still advance).
+    """
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        pos = offset
+        for raw in f:
+            pos += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(rec, dict):
+                yield pos, rec
+
+
+def parse_fragment(normalized: str) -> Tuple[Optional[str], Optional[str]]:
+    """Parse a normalized fragment with sympy. Returns (parsed, parse_error).
+
+    A single top-level '=' is parsed as an equation. Expressions are parsed
+    with `evaluate=False` so a fragment like `9**9**9` is not computed.
+    """
+    if not normalized:
+        return None, 'empty after normalization'
+    if len(normalized) > MAX_FRAGMENT_LENGTH:
+        return None, 'fragment too long'
+    try:
+        import sympy
+        from sympy.parsing.sympy_parser import parse_expr
+    except ImportError:
+        return None, 'sympy not available'
+    try:
+        if normalized.count('=') == 1 and not any(op in normalized for op in ('<=', '>=', '!=', '~=')):
+            lhs, rhs = normalized.split('=')
+            expr = sympy.Eq(parse_expr(lhs, evaluate=False), parse_expr(rhs, evaluate=False), evaluate=False)
+        else:
+            expr = parse_expr(normalized, evaluate=False)
+        return str(expr), None
+    except Exception as e:
+        return None, f'{type(e).__name__}: {e}'[:200]
+
+
+def parse_batch(batch: List[Dict]) -> List[Dict]:
+    """Fill in `parsed` / `parse_error` for a batch of output records (runs in pool workers)."""
+    for rec in batch:
+        rec['parsed'], rec['parse_error'] = parse_fragment(rec['normalized'])
+    return batch
+
+
+def _checkpoint_path(output: str) -> str:
+    return output + '.ckpt'
+
+
+def read_checkpoint(output: str) -> Optional[Dict]:
+    try:
+        with open(_checkpoint_path(output), 'r', encoding='utf-8') as f:
+            ckpt = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return ckpt if isinstance(ckpt, dict) else None
+
+
+def _write_checkpoint(output: str, ckpt: Dict) -> None:
+    path = _checkpoint_path(output)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(ckpt, f)
+    os.replace(tmp, path)
+
+
+def _seen_hashes(output: str) -> set:
+    seen = set()
+    for _, rec in iter_jsonl(output):
+        if isinstance(rec.get('hash'), str):
+            seen.add(int(rec['hash'], 16))
+    return seen
+
+
+def run_pipeline(input_path: str, output_path: str, workers: int = 1, batch_size: int = DEFAULT_BATCH_SIZE,
+                 resume: bool = True, limit: Optional[int] = None) -> Dict:
+    """Stream `input_path` through the pipeline into `output_path`.
+
+    `workers` > 1 parses in a process pool. With `resume` a matching checkpoint
+    continues the previous run; otherwise the output is started afresh.
+    `limit` stops after that many input records (counted across resumes).
+    Returns the final checkpoint dict (counters and offsets).
+    """
+    ckpt = read_checkpoint(output_path) if resume else None
+    if ckpt and ckpt.get('input') == os.path.abspath(input_path) and os.path.exists(output_path):
+        with open(output_path, 'r+b') as f:
+            f.truncate(ckpt['output_bytes'])
+        seen = _seen_hashes(output_path)
+    else:
+        ckpt = {'input': os.path.abspath(input_path), 'input_offset': 0, 'output_bytes': 0,
+                'records_in': 0, 'records_out': 0, 'duplicates': 0, 'done': False}
+        open(output_path, 'wb').close()
+        seen = set()
+    if ckpt.get('done'):
+        return ckpt
+
+    pool = None
+    if workers and workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=workers)
+    # (future or parsed batch, input offset after the batch, records read, duplicates)
+    pending = deque()
+    max_pending = max(2, (workers or 1) * 2)
+
+    out = open(output_path, 'ab')
+
+    def drain(keep):
+        while len(pending) > keep:
+            job, offset, read, dups = pending.popleft()
+            batch = job.result() if pool is not None else job
+            for rec in batch:
+                out.write((json.dumps(rec, ensure_ascii=False) + '\n').encode('utf-8'))
+            out.flush()
+            ckpt['input_offset'] = offset
+            ckpt['output_bytes'] = out.tell()
+            ckpt['records_in'] += read
+            ckpt['records_out'] += len(batch)
+            ckpt['duplicates'] += dups
+            _write_checkpoint(output_path, ckpt)
+
+    def submit(batch, offset, read, dups):
+        job = pool.submit(parse_batch, batch) if pool is not None else parse_batch(batch)
+        pending.append((job, offset, read, dups))
+        drain(max_pending)
+
+    try:
+        batch, read, dups, consumed = [], 0, 0, ckpt['input_offset']
+        total = ckpt['records_in']
+        stopped = False
+        for offset, rec in iter_jsonl(input_path, ckpt['input_offset']):
+            if limit is not None and total >= limit:
+                stopped = True
+                break
+            consumed = offset
+            total += 1
+            read += 1
+            fragment = rec.get('fragment')
+            if not isinstance(fragment, str):
+                continue
+            normalized = normalize_fragment(fragment)
+            h = fragment_hash(normalized)
+            hv = int(h, 16)
+            if hv in seen:
+                dups += 1
+            else:
+                seen.add(hv)
+                batch.append({'key': rec.get('key'), 'fragment': fragment, 'normalized': normalized, 'hash': h,
+                              'parsed': None, 'parse_error': None})
+            if len(batch) >= batch_size:
+                submit(batch, consumed, read, dups)
+                batch, read, dups = [], 0, 0
+        if batch or read:
+            submit(batch, consumed, read, dups)
+        drain(0)
+        if not stopped:
+            ckpt['done'] = True
+            _write_checkpoint(output_path, ckpt)
+    finally:
+        out.close()
+        if pool is not None:
+            # drop batches that have not started (shutdown(cancel_futures=) needs Python 3.9)
+            for job, _, _, _ in pending:
+                job.cancel()
+            pool.shutdown()
+    return ckpt
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Normalize, deduplicate and parse formula fragments from JSONL')
+    parser.add_argument('input', help='JSONL file with "key" and "fragment" fields')
+    parser.add_argument('output', help='JSONL file to write parsed records to')
+    parser.add_argument('-w', '--workers', type=int, default=1, help='parser processes (default 1: in-process)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='records per parse batch')
+    parser.add_argument('--restart', action='store_true', help='ignore any checkpoint and start over')
+    args = parser.parse_args(argv)
+
+    ckpt = run_pipeline(args.input, args.output, workers=args.workers, batch_size=args.batch_size, resume=not args.restart)
+    print(f"{ckpt['records_in']} records read, {ckpt['records_out']} written, {ckpt['duplicates']} duplicates")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main(sys.argv[1:]))
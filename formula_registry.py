@@ -0,0 +1,89 @@
+"""Lazy namespace of the wiki-derived formula functions.
+
+Importing `generated/formulas_from_wiki.py` defines every function up front.
+This module reads only the manifest (`generated/generation_summary.json`) and
+builds a function the first time it is looked up, from the same source
+`formula_runtime.emit_function` writes into the generated module:
+
+    import formula_registry as formulas
+    formulas.albert_einstein_1_eq(c, m)          # built on first access
+    formulas.registry.get('add_1_eq')            # or None when unknown
+    formulas.registry.names()                    # everything available
+"""
+import threading
+from typing import Callable, Dict, List, Optional
+
+from formula_runtime import SUMMARY_PATH, constant_value, emit_function, evaluate_expression, formula_manifest
+
+
+class FormulaRegistry:
+    """Manifest-backed registry that materializes formula functions on demand."""
+
+    def __init__(self, summary_path: str = SUMMARY_PATH):
+        self.summary_path = summary_path
+        self._functions: Dict[str, Callable] = {}
+        self._manifest = None
+        self._lock = threading.Lock()
+
+    def manifest(self) -> Dict[str, Dict]:
+        manifest = formula_manifest(self.summary_path)
+        if manifest is not self._manifest:
+            # summary changed on disk: drop functions built from the old one
+            with self._lock:
+                self._functions.clear()
+                self._manifest = manifest
+        return manifest
+
+    def names(self) -> List[str]:
+        return list(self.manifest())
+
+    def __contains__(self, name) -> bool:
+        return name in self.manifest()
+
+    def __len__(self) -> int:
+        return len(self.manifest())
+
+    def get(self, name: str) -> Optional[Callable]:
+        """The function called `name`, built if needed, or None when the manifest has no such formula."""
+        meta = self.manifest().get(name)
+        if meta is None:
+            return None
+        fn = self._functions.get(name)
+        if fn is None:
+            with self._lock:
+                fn = self._functions.get(name)
+                if fn is None:
+                    fn = self._build(name, meta)
+                    self._functions[name] = fn
+        return fn
+
+    def __getitem__(self, name: str) -> Callable:
+        fn = self.get(name)
+        if fn is None:
+            raise KeyError(name)
+        return fn
+
+    def _build(self, name: str, meta: Dict) -> Callable:
+        namespace = {'_evaluate': evaluate_expression, '_constant': constant_value, '__name__': __name__}
+        exec(compile(emit_function(name, meta['params'], meta['expr']), f'<formula {name}>', 'exec'), namespace)
+        return namespace[name]
+
+    def loaded(self) -> List[str]:
+        """Names of the functions built so far."""
+        return list(self._functions)
+
+
+registry = FormulaRegistry()
+
+
+def __getattr__(name):
+    if name.startswith('__'):
+        raise AttributeError(name)
+    fn = registry.get(name)
+    if fn is None:
+        raise AttributeError(f"module {__name__!r} has no formula {name!r}")
+    return fn
+
+
+def __dir__():
+    return sorted(set(globals()) | set(registry.names()))
@@ -0,0 +1,226 @@
+"""Runtime shared by the generated formula functions (`generated/formulas_from_wiki.py`).
+
+The generated functions used to import sympy, `sympify` their expression and
+`lambdify` it on every call, which costs milliseconds per evaluation. They now
+delegate here: each expression is compiled once, on first use, and the callable
+is cached by (expression string, parameter names), so the many entries sharing
+an expression such as `c**2*m` share one compiled function. Constant
+expressions are evaluated once and their value cached.
+
+`evaluate_many` evaluates a generated formula over whole NumPy arrays, using
+the `params`/`expr` metadata recorded in `generated/generation_summary.json`.
+
+`emit_function` / `emit_module` produce the generated module in this form.
+"""
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, Sequence, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SUMMARY_PATH = os.path.join(ROOT, 'generated', 'generation_summary.json')
+COMPLEX_ROUND_DECIMALS = 6
+
+_compiled: Dict[Tuple[str, Tuple[str, ...]], Callable] = {}
+_compiled_numpy: Dict[Tuple[str, Tuple[str, ...]], Callable] = {}
+_manifests: Dict[str, Tuple[Any, Dict[str, Dict]]] = {}
+_constants: Dict[str, Any] = {}
+_lock = threading.Lock()
+
+
+def finish_result(res):
+    """Round complex results and coerce real ones to float, as the generated code always did."""
+    try:
+        _c = complex(res)
+    except Exception:
+        return res
+    if _c.imag != 0:
+        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
+    return float(_c.real)
+
+
+def compile_expression(expr: str, params: Sequence[str] = (), backend: str = 'math') -> Callable:
+    """Cached `lambdify(params, sympify(expr), backend)` keyed by expression and parameter names.
+
+    `backend` is 'math' (scalar calls) or 'numpy' (array calls).
+    """
+    cache = _compiled_numpy if backend == 'numpy' else _compiled
+    key = (expr, tuple(params))
+    f = cache.get(key)
+    if f is None:
+        with _lock:
+            f = cache.get(key)
+            if f is None:
+                import sympy as sp
+                symbols = [sp.Symbol(p) for p in key[1]]
+                f = sp.lambdify(symbols, sp.sympify(expr), backend)
+                cache[key] = f
+    return f
+
+
+def evaluate_expression(expr: str, params: Sequence[str], args: Sequence) -> Any:
+    """Evaluate `expr` with `args` bound to `params` using the cached compiled callable."""
+    return finish_result(compile_expression(expr, params)(*args))
+
+
+def constant_value(expr: str) -> Any:
+    """Numeric value of a parameterless expression, computed once per expression string."""
+    try:
+        return _constants[expr]
+    except KeyError:
+        pass
+    import sympy as sp
+    _val = sp.N(sp.sympify(expr))
+    try:
+        _c = complex(_val)
+    except Exception:
+        value = float(_val)
+    else:
+        if _c.imag != 0:
+            value = complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
+        else:
+            value = float(_c.real)
+    _constants[expr] = value
+    return value
+
+
+# -- batch evaluation ------------------------------------------------------
+def formula_manifest(path: str = SUMMARY_PATH) -> Dict[str, Dict]:
+    """Function name -> {'params', 'expr', 'group'} from a generation summary file.
+
+    Entries that only record a parse error are skipped; the first entry wins
+    for repeated names. Rebuilt when the summary file changes.
+    """
+    from knowledge_store import store
+
+    key = os.path.abspath(path)
+    summary = store.load_json(key)
+    cached = _manifests.get(key)
+    if cached is not None and cached[0] is summary:
+        return cached[1]
+    manifest = {}
+    for group, entries in summary.items():
+        for ent in entries if isinstance(entries, list) else ():
+            name = ent.get('function') if isinstance(ent, dict) else None
+            if name and name not in manifest:
+                manifest[name] = {'params': list(ent.get('params', [])), 'expr': ent['expr'], 'group': group}
+    _manifests[key] = (summary, manifest)
+    return manifest
+
+
+def finish_array(res):
+    """Array version of `finish_result`.
+
+    Returns a float array when every element is real; otherwise a complex array
+    whose non-real elements are rounded to `COMPLEX_ROUND_DECIMALS` (real ones
+    are left as they are, like the scalar path).
+    """
+    import numpy as np
+
+    out = np.asarray(res)
+    if not np.iscomplexobj(out):
+        return out.astype(float)
+    nonreal = out.imag != 0
+    if not nonreal.any():
+        return out.real.astype(float)
+    out = out.astype(complex)
+    out[nonreal] = np.round(out[nonreal], COMPLEX_ROUND_DECIMALS)
+    return out
+
+
+def evaluate_many(function_name: str, summary_path: str = SUMMARY_PATH, **arrays):
+    """Evaluate a generated formula over arrays of parameter values in one call.
+
+    `arrays` maps each parameter of the formula to a scalar or array; they are
+    broadcast together, so a grid is `evaluate_many('f', x=xs[:, None], y=ys)`.
+    The expression is lambdified once with the NumPy backend. Elements whose
+    real evaluation is undefined (e.g. a negative base under a fractional
+    power) are recomputed in the complex domain, matching the complex results
+    the scalar functions return. Raises KeyError for an unknown formula and
+    TypeError for missing or unexpected parameters.
+    """
+    import numpy as np
+
+    meta = formula_manifest(summary_path).get(function_name)
+    if meta is None:
+        raise KeyError(function_name)
+    params = meta['params']
+    missing = [p for p in params if p not in arrays]
+    extra = [k for k in arrays if k not in params]
+    if missing or extra:
+        raise TypeError(f"{function_name}() expects parameters {params}; missing {missing}, unexpected {extra}")
+
+    values = np.broadcast_arrays(*[np.asarray(arrays[p]) for p in params]) if params else []
+    values = [v.astype(np.result_type(v, float)) for v in values]
+    shape = values[0].shape if values else ()
+    f = compile_expression(meta['expr'], params, backend='numpy')
+    with np.errstate(all='ignore'):
+        res = np.broadcast_to(np.asarray(f(*values)), shape)
+        if values and not np.iscomplexobj(res):
+            finite_inputs = np.logical_and.reduce([np.isfinite(v) for v in values])
+            retry = np.isnan(res) & finite_inputs
+            if retry.any():
+                cres = np.broadcast_to(np.asarray(f(*[v[retry].astype(complex) for v in values])), (int(retry.sum()),))
+                res = res.astype(complex)
+                res[retry] = cres
+    return finish_array(res)
+
+
+def cache_info() -> Dict[str, int]:
+    """Number of distinct compiled expressions and cached constants."""
+    return {'compiled': len(_compiled), 'compiled_numpy': len(_compiled_numpy), 'constants': len(_constants)}
+
+
+def clear_cache() -> None:
+    with _lock:
+        _compiled.clear()
+        _compiled_numpy.clear()
+        _constants.clear()
+        _manifests.clear()
+
+
+# -- code generation -------------------------------------------------------
+MODULE_HEADER = '''# Auto-generated formula functions
+#
+# Expressions are compiled once and cached by formula_runtime; see that module.
+
+import os
+import sys
+
+try:
+    from formula_runtime import COMPLEX_ROUND_DECIMALS, constant_value as _constant, evaluate_expression as _evaluate
+except ImportError:
+    # imported with only generated/ on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from formula_runtime import COMPLEX_ROUND_DECIMALS, constant_value as _constant, evaluate_expression as _evaluate
+'''
+
+
+def emit_function(name: str, params: Sequence[str], expr: str, fragment: str = None) -> str:
+    """Source of one generated formula function."""
+    params = list(params)
+    lines = [f"def {name}({', '.join(params)}):",
+             f"    # Auto-generated from fragment: {(expr if fragment is None else fragment)!r}"]
+    if params:
+        names = '(' + ', '.join(repr(p) for p in params) + (',)' if len(params) == 1 else ')')
+        args = '(' + ', '.join(params) + (',)' if len(params) == 1 else ')')
+        lines.append(f"    return _evaluate({expr!r}, {names}, {args})")
+    else:
+        lines.append(f"    return _constant({expr!r})")
+    return '\n'.join(lines) + '\n'
+
+
+def emit_module(entries: Iterable[Dict]) -> str:
+    """Source of a generated module from `{'function', 'params', 'expr'[, 'fragment']}` entries.
+
+    Entries without a function (e.g. recorded parse errors) and repeated
+    function names are skipped.
+    """
+    seen = set()
+    parts = [MODULE_HEADER]
+    for ent in entries:
+        name = ent.get('function')
+        if not name or name in seen:
+            continue
+        seen.add(name)
+        parts.append(emit_function(name, ent.get('params', []), ent['expr'], ent.get('fragment')))
+    return '\n'.join(parts)
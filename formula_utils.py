@@ -25,12 +25,46 @@ UNICODE_MATH_MAP = {
 }
 
 
+# single-character replacements applied in one `str.translate` pass; every
+# replacement is ASCII, so no replacement can feed another mapping
+SUPERSCRIPT_TABLE = str.maketrans(SUPERSCRIPT_MAP)
+UNICODE_TABLE = str.maketrans({'–': '-', '\u2212': '-', **SUPERSCRIPT_MAP, **UNICODE_MATH_MAP})
+
+# map common LaTeX commands to ascii equivalents SymPy understands
+LATEX_COMMANDS = ('pi', 'theta', 'Delta', 'delta', 'phi', 'lambda', 'mu', 'sigma', 'sin', 'cos', 'tan')
+
+_TRAILING_QUOTES_RE = re.compile(r"[\"']+$")
+_REPEATED_OPS_RE = re.compile(r'([=+\-*/]{2,})')
+_TRAILING_PAREN_RE = re.compile(r"\s*\([^)]*\)\s*$")
+_IN_WORDS_RE = re.compile(r"\bin\b\s+[a-zA-Z]{3,}")
+_IN_CLAUSE_RE = re.compile(r"\bin\b\s+(.+)$")
+_MATHY_RE = re.compile(r"[0-9=+\-*/()^]")
+_DATE_RE = re.compile(r"\b\d{4}/\d{2}\b")
+_CHEMICAL_RE = re.compile(r"^[A-Z][A-Za-z0-9]*(?:[=\-][A-Z][A-Za-z0-9]*)+$")
+_COLON_RATIO_RE = re.compile(r"^\s*[A-Za-z0-9_.]+\s*:\s*[A-Za-z0-9_.]+\s*$")
+_COLON_RE = re.compile(r"\s*:\s*")
+_CARET_RE = re.compile(r"\^\s*\{?\s*([0-9]+)\s*\}?")
+_FRAC_RE = re.compile(r"\\frac\{([^}]+)\}\{([^}]+)\}")
+_LATEX_RE = re.compile(r"\\(" + "|".join(LATEX_COMMANDS) + ")")
+# insert multiplication where implied: letters and digits, closing parenthesis
+# and identifier, number and identifier, etc. (avoid overly-greedy pattern
+# that turned `n(n+1)` into `n*n+1)`); then * between number/identifier and
+# opening parenthesis: 2(a+b) -> 2*(a+b). Order matters.
+_IMPLIED_MUL = (
+    (re.compile(r"\b([A-Za-z])([A-Za-z])([0-9]+)\b"), r"\1*\2**\3"),
+    (re.compile(r"\b([A-Za-z])([0-9]+)\b"), r"\1**\2"),
+    (re.compile(r"\)\s*([A-Za-z0-9_])"), r")*\1"),
+    (re.compile(r"([0-9])\s*([A-Za-z])"), r"\1*\2"),
+    (re.compile(r'(\d)\s*\('), r'\1*('),
+    (re.compile(r'([A-Za-z0-9_])\s*\('), r'\1*('),
+)
+_SPACES_RE = re.compile(r'\s+')
+
+
 def replace_superscripts(s: str) -> str:
     if not s:
         return s
-    for k, v in SUPERSCRIPT_MAP.items():
-        s = s.replace(k, v)
-    return s
+    return s.translate(SUPERSCRIPT_TABLE)
 
 
 def normalize_fragment(fragment: str) -> str:
@@ -49,41 +83,36 @@ def normalize_fragment(fragment: str) -> str:
         parts = s.split('=')
         s = parts[-1].strip()
     # collapse stray repeated punctuation at end
-    s = re.sub(r"[\"']+$", "", s)
+    s = _TRAILING_QUOTES_RE.sub("", s)
 
     # collapse repeated operator sequences (e.g. 'N=N+=N−' -> 'N=N=N-')
-    s = re.sub(r'([=+\-*/]{2,})', lambda m: m.group(1)[0], s)
+    s = _REPEATED_OPS_RE.sub(lambda m: m.group(1)[0], s)
 
     # strip trailing parenthetical descriptors/dates: remove final '(...)'
-    s = re.sub(r"\s*\([^)]*\)\s*$", "", s)
+    if '(' in s:
+        s = _TRAILING_PAREN_RE.sub("", s)
 
     # remove trailing ' in <words>' descriptors when they look non-mathematical
-    if re.search(r"\bin\b\s+[a-zA-Z]{3,}", s):
+    if 'in' in s and _IN_WORDS_RE.search(s):
         # only strip if the trailing clause contains no digits or math operators
-        m = re.search(r"\bin\b\s+(.+)$", s)
-        if m and not re.search(r"[0-9=+\-*/()^]", m.group(1)):
+        m = _IN_CLAUSE_RE.search(s)
+        if m and not _MATHY_RE.search(m.group(1)):
             s = s[:m.start()].strip()
 
     # drop obvious date-like fragments (e.g., '1905/06') which are not math
-    if re.search(r"\b\d{4}/\d{2}\b", s):
+    if '/' in s and _DATE_RE.search(s):
         return ""
 
     # drop chemical formula style fragments like 'CH=O' or 'C4H10' with '=' or '-' between element symbols
-    nospace = s.replace(' ', '')
-    if re.match(r"^[A-Z][A-Za-z0-9]*(?:[=\-][A-Z][A-Za-z0-9]*)+$", nospace):
+    if _CHEMICAL_RE.match(s.replace(' ', '')):
         return ""
 
-    # normalize unicode characters
-    s = s.replace('–', '-').replace('\u2212', '-')
-    s = replace_superscripts(s)
-
-    # replace common unicode math symbols with sympy-friendly names
-    for k, v in UNICODE_MATH_MAP.items():
-        s = s.replace(k, v)
+    # normalize unicode characters (dashes, superscripts, math symbols) in one pass
+    s = s.translate(UNICODE_TABLE)
 
     # treat explicit colon ratio 'A:B' as division when standalone
-    if re.match(r"^\s*[A-Za-z0-9_.]+\s*:\s*[A-Za-z0-9_.]+\s*$", s):
-        s = re.sub(r"\s*:\s*", "/", s)
+    if ':' in s and _COLON_RATIO_RE.match(s):
+        s = _COLON_RE.sub("/", s)
 
     # balance parentheses: remove excessive trailing ')' or add closing ')' if open remains
     open_paren = s.count('(')
@@ -96,48 +125,37 @@ def normalize_fragment(fragment: str) -> str:
         s = s + (')' * (open_paren - close_paren))
 
     # normalize common LaTeX caret to python exponent
-    s = re.sub(r"\^\s*\{?\s*([0-9]+)\s*\}?", r"**\1", s)
-    s = s.replace('^', '**')
-
-    # handle simple LaTeX \frac{a}{b} -> (a)/(b)
-    s = re.sub(r"\\frac\{([^}]+)\}\{([^}]+)\}", r"(\1)/(\2)", s)
-
-    # map common LaTeX commands to ascii equivalents SymPy understands
-    latex_map = {
-        r"\\pi": "pi",
-        r"\\theta": "theta",
-        r"\\Delta": "Delta",
-        r"\\delta": "delta",
-        r"\\phi": "phi",
-        r"\\lambda": "lambda",
-        r"\\mu": "mu",
-        r"\\sigma": "sigma",
-        r"\\sin": "sin",
-        r"\\cos": "cos",
-        r"\\tan": "tan",
-    }
-    for k, v in latex_map.items():
-        s = re.sub(k, v, s)
-
-    # insert multiplication where implied: letters and digits, closing parenthesis
-    # and identifier, number and identifier, etc. (avoid overly-greedy pattern
-    # that turned `n(n+1)` into `n*n+1)`)
-    s = re.sub(r"\b([A-Za-z])([A-Za-z])([0-9]+)\b", r"\1*\2**\3", s)
-    s = re.sub(r"\b([A-Za-z])([0-9]+)\b", r"\1**\2", s)
-    s = re.sub(r"\)\s*([A-Za-z0-9_])", r")*\1", s)
-    s = re.sub(r"([0-9])\s*([A-Za-z])", r"\1*\2", s)
-
-    # add * between number/identifier and opening parenthesis: 2(a+b) -> 2*(a+b)
-    s = re.sub(r'(\d)\s*\(', r'\1*(', s)
-    s = re.sub(r'([A-Za-z0-9_])\s*\(', r'\1*(', s)
+    if '^' in s:
+        s = _CARET_RE.sub(r"**\1", s)
+        s = s.replace('^', '**')
+
+    if '\\' in s:
+        # handle simple LaTeX \frac{a}{b} -> (a)/(b)
+        s = _FRAC_RE.sub(r"(\1)/(\2)", s)
+        s = _LATEX_RE.sub(r"\1", s)
+
+    for pattern, repl in _IMPLIED_MUL:
+        s = pattern.sub(repl, s)
 
     # remove multiple spaces
-    s = re.sub(r'\s+', ' ', s)
+    s = _SPACES_RE.sub(' ', s)
 
     # trim again
     return s.strip()
 
 
+def normalize_many(fragments) -> list:
+    """`normalize_fragment` over an iterable of fragments, computing each distinct fragment once."""
+    seen = {}
+    out = []
+    for frag in fragments:
+        norm = seen.get(frag)
+        if norm is None:
+            norm = seen[frag] = normalize_fragment(frag)
+        out.append(norm)
+    return out
+
+
 def _is_number_literal(s: str) -> bool:
     try:
         float(s)
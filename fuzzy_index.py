@@ -0,0 +1,123 @@
+"""Fuzzy word lookup over `word_freq.txt` without scanning the whole list.
+
+`respond_subject_specific` and `util_word_topic_lookup.lookup_word_topics` used
+to re-read the word list and run `difflib.SequenceMatcher` against every word
+for each unmatched term. `FuzzyIndex` keeps the list in memory with a padded
+bigram index and only scores words that share a bigram with the query and
+whose length can still reach the threshold.
+
+Scores are the same `SequenceMatcher(None, a, b).ratio()` used before. For
+thresholds above 2/3 the bigram filter cannot drop a qualifying word (a match
+with no shared bigram, boundary markers included, has more unmatched than
+matched characters), so results are identical to the linear scan; lower
+thresholds fall back to scoring every word of a compatible length.
+"""
+import difflib
+import heapq
+import os
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from knowledge_store import file_stamp
+
+WORD_FREQ_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'word_freq.txt')
+DEFAULT_MIN_SIMILARITY = 0.8
+_EXACT_FILTER_THRESHOLD = 2.0 / 3.0
+
+
+def _bigrams(word: str) -> set:
+    padded = '\x02' + word + '\x03'
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+class FuzzyIndex:
+    """In-memory fuzzy matcher over a word list (order is kept for tie-breaking)."""
+
+    def __init__(self, words: Iterable[str]):
+        seen = set()
+        self.words: List[str] = []
+        for w in words:
+            if w and w not in seen:
+                seen.add(w)
+                self.words.append(w)
+        self._position = {w: i for i, w in enumerate(self.words)}
+        self._postings: Dict[str, List[int]] = {}
+        self._by_length: Dict[int, List[int]] = {}
+        for i, w in enumerate(self.words):
+            for g in _bigrams(w):
+                self._postings.setdefault(g, []).append(i)
+            self._by_length.setdefault(len(w), []).append(i)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __contains__(self, word):
+        return word in self._position
+
+    def _length_ok(self, n: int, m: int, min_similarity: float) -> bool:
+        # ratio = 2*matches / (n + m) and matches <= min(n, m)
+        return n + m > 0 and 2.0 * min(n, m) / (n + m) >= min_similarity
+
+    def _candidates(self, term: str, min_similarity: float) -> Iterable[int]:
+        n = len(term)
+        if min_similarity > _EXACT_FILTER_THRESHOLD:
+            ids = set()
+            for g in _bigrams(term):
+                ids.update(self._postings.get(g, ()))
+            return (i for i in ids if self._length_ok(n, len(self.words[i]), min_similarity))
+        lengths = [m for m in self._by_length if self._length_ok(n, m, min_similarity)]
+        return (i for m in lengths for i in self._by_length[m])
+
+    def top_k(self, term: str, min_similarity: float = DEFAULT_MIN_SIMILARITY, k: int = 1) -> List[Tuple[str, float]]:
+        """Best `k` words with similarity >= `min_similarity`, as (word, score).
+
+        Sorted by score, then by position in the word list, so `top_k(t)[0]` is
+        the word the old first-best linear scan would have picked.
+        """
+        term = term.lower().strip()
+        if not term or not self.words:
+            return []
+        if k == 1 and term in self._position:
+            return [(term, 1.0)]
+        # ratio() is not symmetric: score SequenceMatcher(None, term, word) as the linear
+        # scan did. The word is seq2, whose lookup tables are rebuilt per candidate.
+        matcher = difflib.SequenceMatcher(None)
+        matcher.set_seq1(term)
+        scored = []
+        for i in self._candidates(term, min_similarity):
+            matcher.set_seq2(self.words[i])
+            if matcher.real_quick_ratio() < min_similarity or matcher.quick_ratio() < min_similarity:
+                continue
+            score = matcher.ratio()
+            if score >= min_similarity:
+                scored.append((-score, i))
+        return [(self.words[i], -neg) for neg, i in heapq.nsmallest(k, scored)]
+
+    def best_match(self, term: str, min_similarity: float = DEFAULT_MIN_SIMILARITY) -> Optional[str]:
+        """The single best word at or above `min_similarity`, or None."""
+        hits = self.top_k(term, min_similarity, k=1)
+        return hits[0][0] if hits else None
+
+
+_cache: Dict[str, Tuple[Optional[Tuple[int, int]], FuzzyIndex]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_word_index(path: str = WORD_FREQ_PATH) -> FuzzyIndex:
+    """Shared `FuzzyIndex` for a word-per-line file, rebuilt only when the file changes.
+
+    A missing file gives an empty index (no fuzzy matches) instead of an error.
+    """
+    key = os.path.abspath(path)
+    stamp = file_stamp(key)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        words = []
+        if stamp is not None:
+            with open(key, 'r', encoding='utf-8') as f:
+                words = [line.strip().lower() for line in f if line.strip()]
+        index = FuzzyIndex(words)
+        _cache[key] = (stamp, index)
+        return index
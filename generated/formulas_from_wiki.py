@@ -1,5450 +1,1573 @@
 # Auto-generated formula functions
+#
+# Expressions are compiled once and cached by formula_runtime; see that module.
 
-import math
+import os
+import sys
 
-COMPLEX_ROUND_DECIMALS = 6
+try:
+    from formula_runtime import COMPLEX_ROUND_DECIMALS, constant_value as _constant, evaluate_expression as _evaluate
+except ImportError:
+    # imported with only generated/ on sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from formula_runtime import COMPLEX_ROUND_DECIMALS, constant_value as _constant, evaluate_expression as _evaluate
 
 def albert_einstein_1_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def albert_einstein_2_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def albert_einstein_3_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def add_1_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def add_2_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def add_3_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def addition_1_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def addition_2_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def addition_3_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def binomial_distribution_1_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def binomial_distribution_2_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def binomial_distribution_3_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def cancel_out_1_eq(a, c):
     # Auto-generated from fragment: 'a*c'
-    import sympy as sp
-    expr = sp.sympify('a*c')
-    f = sp.lambdify((a, c), expr, 'math')
-    _res = f(a, c)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('a*c', ('a', 'c'), (a, c))
 
 def cancel_out_2_eq(c):
     # Auto-generated from fragment: 'c'
-    import sympy as sp
-    expr = sp.sympify('c')
-    f = sp.lambdify((c), expr, 'math')
-    _res = f(c)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c', ('c',), (c,))
 
 def cancel_out_3_eq(a, c):
     # Auto-generated from fragment: 'a*c'
-    import sympy as sp
-    expr = sp.sympify('a*c')
-    f = sp.lambdify((a, c), expr, 'math')
-    _res = f(a, c)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('a*c', ('a', 'c'), (a, c))
 
 def cancel_out_4_eq(c):
     # Auto-generated from fragment: 'c'
-    import sympy as sp
-    expr = sp.sympify('c')
-    f = sp.lambdify((c), expr, 'math')
-    _res = f(c)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c', ('c',), (c,))
 
 def cancel_out_5_eq(a, c):
     # Auto-generated from fragment: 'a*c'
-    import sympy as sp
-    expr = sp.sympify('a*c')
-    f = sp.lambdify((a, c), expr, 'math')
-    _res = f(a, c)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('a*c', ('a', 'c'), (a, c))
 
 def cancel_out_6_eq(c):
     # Auto-generated from fragment: 'c'
-    import sympy as sp
-    expr = sp.sympify('c')
-    f = sp.lambdify((c), expr, 'math')
-    _res = f(c)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c', ('c',), (c,))
 
 def catastrophe_1_eq(down):
     # Auto-generated from fragment: 'down'
-    import sympy as sp
-    expr = sp.sympify('down')
-    f = sp.lambdify((down), expr, 'math')
-    _res = f(down)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('down', ('down',), (down,))
 
 def catastrophe_2_eq(turning):
     # Auto-generated from fragment: 'turning'
-    import sympy as sp
-    expr = sp.sympify('turning')
-    f = sp.lambdify((turning), expr, 'math')
-    _res = f(turning)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('turning', ('turning',), (turning,))
 
 def catastrophe_3_eq(down):
     # Auto-generated from fragment: 'down'
-    import sympy as sp
-    expr = sp.sympify('down')
-    f = sp.lambdify((down), expr, 'math')
-    _res = f(down)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('down', ('down',), (down,))
 
 def catastrophe_4_eq(turning):
     # Auto-generated from fragment: 'turning'
-    import sympy as sp
-    expr = sp.sympify('turning')
-    f = sp.lambdify((turning), expr, 'math')
-    _res = f(turning)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('turning', ('turning',), (turning,))
 
 def catastrophe_5_eq(down):
     # Auto-generated from fragment: 'down'
-    import sympy as sp
-    expr = sp.sympify('down')
-    f = sp.lambdify((down), expr, 'math')
-    _res = f(down)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('down', ('down',), (down,))
 
 def catastrophe_6_eq(turning):
     # Auto-generated from fragment: 'turning'
-    import sympy as sp
-    expr = sp.sympify('turning')
-    f = sp.lambdify((turning), expr, 'math')
-    _res = f(turning)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('turning', ('turning',), (turning,))
 
 def centimeter_1():
     # Auto-generated from fragment: '1/100'
-    import sympy as sp
-    expr = sp.sympify('1/100')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/100')
 
 def centimeter_2():
     # Auto-generated from fragment: '1/100'
-    import sympy as sp
-    expr = sp.sympify('1/100')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/100')
 
 def centimeter_3():
     # Auto-generated from fragment: '1/100'
-    import sympy as sp
-    expr = sp.sympify('1/100')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/100')
 
 def coarse_1():
     # Auto-generated from fragment: '1/4'
-    import sympy as sp
-    expr = sp.sympify('1/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/4')
 
 def coarse_2():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def coarse_3():
     # Auto-generated from fragment: '1/4'
-    import sympy as sp
-    expr = sp.sympify('1/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/4')
 
 def coarse_4():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def coarse_5():
     # Auto-generated from fragment: '1/4'
-    import sympy as sp
-    expr = sp.sympify('1/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/4')
 
 def coarse_6():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def desperation_1():
     # Auto-generated from fragment: '1899/1900'
-    import sympy as sp
-    expr = sp.sympify('1899/1900')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1899/1900')
 
 def desperation_2():
     # Auto-generated from fragment: '1899/1900'
-    import sympy as sp
-    expr = sp.sympify('1899/1900')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1899/1900')
 
 def desperation_3():
     # Auto-generated from fragment: '1899/1900'
-    import sympy as sp
-    expr = sp.sympify('1899/1900')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1899/1900')
 
 def fraction_1():
     # Auto-generated from fragment: '3/4'
-    import sympy as sp
-    expr = sp.sympify('3/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3/4')
 
 def fraction_2():
     # Auto-generated from fragment: '3/4'
-    import sympy as sp
-    expr = sp.sympify('3/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3/4')
 
 def fraction_3():
     # Auto-generated from fragment: '3/4'
-    import sympy as sp
-    expr = sp.sympify('3/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3/4')
 
 def inch_1():
     # Auto-generated from fragment: '1/36'
-    import sympy as sp
-    expr = sp.sympify('1/36')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/36')
 
 def inch_2():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def inch_3():
     # Auto-generated from fragment: '1/36'
-    import sympy as sp
-    expr = sp.sympify('1/36')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/36')
 
 def inch_4():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def inch_5():
     # Auto-generated from fragment: '1/36'
-    import sympy as sp
-    expr = sp.sympify('1/36')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/36')
 
 def inch_6():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def look_out_1():
     # Auto-generated from fragment: '20/20'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def look_out_2():
     # Auto-generated from fragment: '20/20'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def look_out_3():
     # Auto-generated from fragment: '20/20'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def lukewarm_1_eq():
     # Auto-generated from fragment: '5"'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def lukewarm_2_eq():
     # Auto-generated from fragment: '5"'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def lukewarm_3_eq():
     # Auto-generated from fragment: '5"'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def meter_1():
     # Auto-generated from fragment: '1/299792458'
-    import sympy as sp
-    expr = sp.sympify('1/299792458')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/299792458')
 
 def meter_2():
     # Auto-generated from fragment: '1/299792458'
-    import sympy as sp
-    expr = sp.sympify('1/299792458')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/299792458')
 
 def meter_3():
     # Auto-generated from fragment: '1/299792458'
-    import sympy as sp
-    expr = sp.sympify('1/299792458')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/299792458')
 
 def molecular_weight_1_eq(m, n):
     # Auto-generated from fragment: 'm/n'
-    import sympy as sp
-    expr = sp.sympify('m/n')
-    f = sp.lambdify((m, n), expr, 'math')
-    _res = f(m, n)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('m/n', ('m', 'n'), (m, n))
 
 def molecular_weight_2_eq(m, n):
     # Auto-generated from fragment: 'm/n'
-    import sympy as sp
-    expr = sp.sympify('m/n')
-    f = sp.lambdify((m, n), expr, 'math')
-    _res = f(m, n)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('m/n', ('m', 'n'), (m, n))
 
 def molecular_weight_3_eq(m, n):
     # Auto-generated from fragment: 'm/n'
-    import sympy as sp
-    expr = sp.sympify('m/n')
-    f = sp.lambdify((m, n), expr, 'math')
-    _res = f(m, n)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('m/n', ('m', 'n'), (m, n))
 
 def null_space_1_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def null_space_2_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def null_space_3_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def one_third_1():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def one_third_2():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def one_third_3():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def order_of_magnitude_1():
     # Auto-generated from fragment: '1/10'
-    import sympy as sp
-    expr = sp.sympify('1/10')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/10')
 
 def order_of_magnitude_2():
     # Auto-generated from fragment: '1/10'
-    import sympy as sp
-    expr = sp.sympify('1/10')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/10')
 
 def order_of_magnitude_3():
     # Auto-generated from fragment: '1/10'
-    import sympy as sp
-    expr = sp.sympify('1/10')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/10')
 
 def portrait_1():
     # Auto-generated from fragment: '3/4'
-    import sympy as sp
-    expr = sp.sympify('3/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3/4')
 
 def portrait_2():
     # Auto-generated from fragment: '3/4'
-    import sympy as sp
-    expr = sp.sympify('3/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3/4')
 
 def portrait_3():
     # Auto-generated from fragment: '3/4'
-    import sympy as sp
-    expr = sp.sympify('3/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3/4')
 
 def probability_1():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def probability_2():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def probability_3():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def probable_1():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def probable_2():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def probable_3():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def rpm_1():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def rpm_2():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def rpm_3():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def second_1_eq():
     # Auto-generated from fragment: '86'
-    import sympy as sp
-    expr = sp.sympify('86')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('86')
 
 def second_2_eq():
     # Auto-generated from fragment: '86'
-    import sympy as sp
-    expr = sp.sympify('86')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('86')
 
 def second_3_eq():
     # Auto-generated from fragment: '86'
-    import sympy as sp
-    expr = sp.sympify('86')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('86')
 
 def subtract_1_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def subtract_2_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def subtract_3_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def two_thirds_1():
     # Auto-generated from fragment: '2/3'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def two_thirds_2():
     # Auto-generated from fragment: '2/3'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def two_thirds_3():
     # Auto-generated from fragment: '2/3'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def artaxerxes_ii_1():
     # Auto-generated from fragment: '405/4'
-    import sympy as sp
-    expr = sp.sympify('405/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('405/4')
 
 def artaxerxes_ii_2():
     # Auto-generated from fragment: '359/8'
-    import sympy as sp
-    expr = sp.sympify('359/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('359/8')
 
 def artaxerxes_ii_3():
     # Auto-generated from fragment: '405/4'
-    import sympy as sp
-    expr = sp.sympify('405/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('405/4')
 
 def artaxerxes_ii_4():
     # Auto-generated from fragment: '359/8'
-    import sympy as sp
-    expr = sp.sympify('359/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('359/8')
 
 def artaxerxes_ii_5():
     # Auto-generated from fragment: '405/4'
-    import sympy as sp
-    expr = sp.sympify('405/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('405/4')
 
 def artaxerxes_ii_6():
     # Auto-generated from fragment: '359/8'
-    import sympy as sp
-    expr = sp.sympify('359/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('359/8')
 
 def austrian_schilling_1_eq():
     # Auto-generated from fragment: '13'
-    import sympy as sp
-    expr = sp.sympify('13')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('13')
 
 def austrian_schilling_2_eq():
     # Auto-generated from fragment: '13'
-    import sympy as sp
-    expr = sp.sympify('13')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('13')
 
 def austrian_schilling_3_eq():
     # Auto-generated from fragment: '13'
-    import sympy as sp
-    expr = sp.sympify('13')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('13')
 
 def avena_barbata_1():
     # Auto-generated from fragment: '(2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('28')
 
 def avena_barbata_2():
     # Auto-generated from fragment: '(2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('14')
 
 def avena_barbata_3():
     # Auto-generated from fragment: '2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('28')
 
 def avena_barbata_4():
     # Auto-generated from fragment: '2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('14')
 
 def avena_barbata_5():
     # Auto-generated from fragment: '(2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('28')
 
 def avena_barbata_6():
     # Auto-generated from fragment: '2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('28')
 
 def avena_barbata_7():
     # Auto-generated from fragment: '(2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('14')
 
 def avena_barbata_8():
     # Auto-generated from fragment: '2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('14')
 
 def avena_barbata_9():
     # Auto-generated from fragment: '(2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('28')
 
 def avena_barbata_10():
     # Auto-generated from fragment: '(2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('14')
 
 def avena_barbata_11():
     # Auto-generated from fragment: '2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('28')
 
 def avena_barbata_12():
     # Auto-generated from fragment: '2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('14')
 
 def cub_scout_1():
     # Auto-generated from fragment: '7/8'
-    import sympy as sp
-    expr = sp.sympify('7/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('7/8')
 
 def cub_scout_2():
     # Auto-generated from fragment: '7/8'
-    import sympy as sp
-    expr = sp.sympify('7/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('7/8')
 
 def cub_scout_3():
     # Auto-generated from fragment: '7/8'
-    import sympy as sp
-    expr = sp.sympify('7/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('7/8')
 
 def dano_norwegian_2():
     # Auto-generated from fragment: '1536/1537'
-    import sympy as sp
-    expr = sp.sympify('1536/1537')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1536/1537')
 
 def dano_norwegian_4():
     # Auto-generated from fragment: '1536/1537'
-    import sympy as sp
-    expr = sp.sympify('1536/1537')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1536/1537')
 
 def dano_norwegian_6():
     # Auto-generated from fragment: '1536/1537'
-    import sympy as sp
-    expr = sp.sympify('1536/1537')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1536/1537')
 
 def einstein_1_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def einstein_2_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def einstein_3_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def einsteinian_1_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def einsteinian_2_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def einsteinian_3_eq(c, m):
     # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('c**2*m', ('c', 'm'), (c, m))
 
 def finnish_mark_1_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def finnish_mark_2_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def finnish_mark_3_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def frederick_i_2():
     # Auto-generated from fragment: '815/16'
-    import sympy as sp
-    expr = sp.sympify('815/16')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('815/16')
 
 def frederick_i_3():
     # Auto-generated from fragment: '834/38'
-    import sympy as sp
-    expr = sp.sympify('417/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('417/19')
 
 def frederick_i_5():
     # Auto-generated from fragment: '815/16'
-    import sympy as sp
-    expr = sp.sympify('815/16')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('815/16')
 
 def frederick_i_6():
     # Auto-generated from fragment: '834/38'
-    import sympy as sp
-    expr = sp.sympify('417/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('417/19')
 
 def frederick_i_8():
     # Auto-generated from fragment: '815/16'
-    import sympy as sp
-    expr = sp.sympify('815/16')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('815/16')
 
 def frederick_i_9():
     # Auto-generated from fragment: '834/38'
-    import sympy as sp
-    expr = sp.sympify('417/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('417/19')
 
 def hamilton_2():
     # Auto-generated from fragment: '1755/1757'
-    import sympy as sp
-    expr = sp.sympify('1755/1757')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1755/1757')
 
 def hamilton_4():
     # Auto-generated from fragment: '1755/1757'
-    import sympy as sp
-    expr = sp.sympify('1755/1757')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1755/1757')
 
 def hamilton_6():
     # Auto-generated from fragment: '1755/1757'
-    import sympy as sp
-    expr = sp.sympify('1755/1757')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1755/1757')
 
 def hooke_s_law_1_eq(kx):
     # Auto-generated from fragment: 'kx'
-    import sympy as sp
-    expr = sp.sympify('kx')
-    f = sp.lambdify((kx), expr, 'math')
-    _res = f(kx)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('kx', ('kx',), (kx,))
 
 def hooke_s_law_2_eq(kx):
     # Auto-generated from fragment: 'kx'
-    import sympy as sp
-    expr = sp.sympify('kx')
-    f = sp.lambdify((kx), expr, 'math')
-    _res = f(kx)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('kx', ('kx',), (kx,))
 
 def hooke_s_law_3_eq(kx):
     # Auto-generated from fragment: 'kx'
-    import sympy as sp
-    expr = sp.sympify('kx')
-    f = sp.lambdify((kx), expr, 'math')
-    _res = f(kx)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('kx', ('kx',), (kx,))
 
 def iraqi_dinar_1_eq(dinars):
     # Auto-generated from fragment: '1418*dinars'
-    import sympy as sp
-    expr = sp.sympify('1418*dinars')
-    f = sp.lambdify((dinars), expr, 'math')
-    _res = f(dinars)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1418*dinars', ('dinars',), (dinars,))
 
 def iraqi_dinar_2_eq(dinars):
     # Auto-generated from fragment: '1418*dinars'
-    import sympy as sp
-    expr = sp.sympify('1418*dinars')
-    f = sp.lambdify((dinars), expr, 'math')
-    _res = f(dinars)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1418*dinars', ('dinars',), (dinars,))
 
 def iraqi_dinar_4_eq(dinars):
     # Auto-generated from fragment: '1418*dinars'
-    import sympy as sp
-    expr = sp.sympify('1418*dinars')
-    f = sp.lambdify((dinars), expr, 'math')
-    _res = f(dinars)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1418*dinars', ('dinars',), (dinars,))
 
 def larrea_tridentata_1_eq(smelly):
     # Auto-generated from fragment: 'smelly'
-    import sympy as sp
-    expr = sp.sympify('smelly')
-    f = sp.lambdify((smelly), expr, 'math')
-    _res = f(smelly)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('smelly', ('smelly',), (smelly,))
 
 def larrea_tridentata_2_eq(smelly):
     # Auto-generated from fragment: 'smelly'
-    import sympy as sp
-    expr = sp.sympify('smelly')
-    f = sp.lambdify((smelly), expr, 'math')
-    _res = f(smelly)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('smelly', ('smelly',), (smelly,))
 
 def larrea_tridentata_3_eq(smelly):
     # Auto-generated from fragment: 'smelly'
-    import sympy as sp
-    expr = sp.sympify('smelly')
-    f = sp.lambdify((smelly), expr, 'math')
-    _res = f(smelly)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('smelly', ('smelly',), (smelly,))
 
 def mogen_david_1():
     # Auto-generated from fragment: '20/20'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def mogen_david_2():
     # Auto-generated from fragment: '20/20'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def mogen_david_3():
     # Auto-generated from fragment: '20/20'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def newton_2():
     # Auto-generated from fragment: '1726/1727'
-    import sympy as sp
-    expr = sp.sympify('1726/1727')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1726/1727')
 
 def newton_4():
     # Auto-generated from fragment: '1726/1727'
-    import sympy as sp
-    expr = sp.sympify('1726/1727')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1726/1727')
 
 def newton_6():
     # Auto-generated from fragment: '1726/1727'
-    import sympy as sp
-    expr = sp.sympify('1726/1727')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1726/1727')
 
 def old_high_german_1():
     # Auto-generated from fragment: '500/750'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def old_high_german_2():
     # Auto-generated from fragment: '500/750'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def old_high_german_3():
     # Auto-generated from fragment: '500/750'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def palestine_authority_1():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def palestine_authority_2():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def palestine_authority_3():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def palestine_national_authority_1():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def palestine_national_authority_2():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def palestine_national_authority_3():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def palestinian_national_authority_1():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def palestinian_national_authority_2():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def palestinian_national_authority_3():
     # Auto-generated from fragment: '67/19'
-    import sympy as sp
-    expr = sp.sympify('67/19')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('67/19')
 
 def pilate_1():
     # Auto-generated from fragment: '26/27'
-    import sympy as sp
-    expr = sp.sympify('26/27')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('26/27')
 
 def pilate_2():
     # Auto-generated from fragment: '36/37'
-    import sympy as sp
-    expr = sp.sympify('36/37')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('36/37')
 
 def pilate_3():
     # Auto-generated from fragment: '26/27'
-    import sympy as sp
-    expr = sp.sympify('26/27')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('26/27')
 
 def pilate_4():
     # Auto-generated from fragment: '36/37'
-    import sympy as sp
-    expr = sp.sympify('36/37')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('36/37')
 
 def pilate_5():
     # Auto-generated from fragment: '26/27'
-    import sympy as sp
-    expr = sp.sympify('26/27')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('26/27')
 
 def pilate_6():
     # Auto-generated from fragment: '36/37'
-    import sympy as sp
-    expr = sp.sympify('36/37')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('36/37')
 
 def pontius_pilate_1():
     # Auto-generated from fragment: '26/27'
-    import sympy as sp
-    expr = sp.sympify('26/27')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('26/27')
 
 def pontius_pilate_2():
     # Auto-generated from fragment: '36/37'
-    import sympy as sp
-    expr = sp.sympify('36/37')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('36/37')
 
 def pontius_pilate_3():
     # Auto-generated from fragment: '26/27'
-    import sympy as sp
-    expr = sp.sympify('26/27')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('26/27')
 
 def pontius_pilate_4():
     # Auto-generated from fragment: '36/37'
-    import sympy as sp
-    expr = sp.sympify('36/37')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('36/37')
 
 def pontius_pilate_5():
     # Auto-generated from fragment: '26/27'
-    import sympy as sp
-    expr = sp.sympify('26/27')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('26/27')
 
 def pontius_pilate_6():
     # Auto-generated from fragment: '36/37'
-    import sympy as sp
-    expr = sp.sympify('36/37')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('36/37')
 
 def ptolemy_i_1():
     # Auto-generated from fragment: '305/304'
-    import sympy as sp
-    expr = sp.sympify('305/304')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('305/304')
 
 def ptolemy_i_2():
     # Auto-generated from fragment: '305/304'
-    import sympy as sp
-    expr = sp.sympify('305/304')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('305/304')
 
 def ptolemy_i_3():
     # Auto-generated from fragment: '305/304'
-    import sympy as sp
-    expr = sp.sympify('305/304')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('305/304')
 
 def rankine_scale_1():
     # Auto-generated from fragment: '5/9'
-    import sympy as sp
-    expr = sp.sympify('5/9')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5/9')
 
 def rankine_scale_2():
     # Auto-generated from fragment: 'R = 5/9 K or 1 K = 1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def rankine_scale_3():
     # Auto-generated from fragment: '5/9'
-    import sympy as sp
-    expr = sp.sympify('5/9')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5/9')
 
 def rankine_scale_4():
     # Auto-generated from fragment: 'R = 5/9 K or 1 K = 1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def rankine_scale_5():
     # Auto-generated from fragment: '5/9'
-    import sympy as sp
-    expr = sp.sympify('5/9')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5/9')
 
 def rankine_scale_6():
     # Auto-generated from fragment: 'R = 5/9 K or 1 K = 1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def sids_1():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def sids_2():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def sids_3():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def sarcocystis_1(bladder):
     # Auto-generated from fragment: 'sarx = flesh and kystis = bladder'
-    import sympy as sp
-    expr = sp.sympify('bladder')
-    f = sp.lambdify((bladder), expr, 'math')
-    _res = f(bladder)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('bladder', ('bladder',), (bladder,))
 
 def sarcocystis_2(bladder):
     # Auto-generated from fragment: 'sarx = flesh and kystis = bladder'
-    import sympy as sp
-    expr = sp.sympify('bladder')
-    f = sp.lambdify((bladder), expr, 'math')
-    _res = f(bladder)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('bladder', ('bladder',), (bladder,))
 
 def sarcocystis_3(bladder):
     # Auto-generated from fragment: 'sarx = flesh and kystis = bladder'
-    import sympy as sp
-    expr = sp.sympify('bladder')
-    f = sp.lambdify((bladder), expr, 'math')
-    _res = f(bladder)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('bladder', ('bladder',), (bladder,))
 
 def schnabel_2():
     # Auto-generated from fragment: '1751/8'
-    import sympy as sp
-    expr = sp.sympify('1751/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1751/8')
 
 def schnabel_4():
     # Auto-generated from fragment: '1751/8'
-    import sympy as sp
-    expr = sp.sympify('1751/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1751/8')
 
 def schnabel_6():
     # Auto-generated from fragment: '1751/8'
-    import sympy as sp
-    expr = sp.sympify('1751/8')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1751/8')
 
 def sergei_eisenstein_2():
     # Auto-generated from fragment: '1945/1958'
-    import sympy as sp
-    expr = sp.sympify('1945/1958')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1945/1958')
 
 def sergei_eisenstein_4():
     # Auto-generated from fragment: '1945/1958'
-    import sympy as sp
-    expr = sp.sympify('1945/1958')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1945/1958')
 
 def sergei_eisenstein_6():
     # Auto-generated from fragment: '1945/1958'
-    import sympy as sp
-    expr = sp.sympify('1945/1958')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1945/1958')
 
 def sergei_mikhailovich_eisenstein_2():
     # Auto-generated from fragment: '1945/1958'
-    import sympy as sp
-    expr = sp.sympify('1945/1958')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1945/1958')
 
 def sergei_mikhailovich_eisenstein_4():
     # Auto-generated from fragment: '1945/1958'
-    import sympy as sp
-    expr = sp.sympify('1945/1958')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1945/1958')
 
 def sergei_mikhailovich_eisenstein_6():
     # Auto-generated from fragment: '1945/1958'
-    import sympy as sp
-    expr = sp.sympify('1945/1958')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1945/1958')
 
 def stephenson_2():
     # Auto-generated from fragment: '1881/2'
-    import sympy as sp
-    expr = sp.sympify('1881/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1881/2')
 
 def stephenson_4():
     # Auto-generated from fragment: '1881/2'
-    import sympy as sp
-    expr = sp.sympify('1881/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1881/2')
 
 def stephenson_6():
     # Auto-generated from fragment: '1881/2'
-    import sympy as sp
-    expr = sp.sympify('1881/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1881/2')
 
 def zannichellia_palustris_1_eq():
     # Auto-generated from fragment: '24'
-    import sympy as sp
-    expr = sp.sympify('24')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('24')
 
 def zannichellia_palustris_2_eq():
     # Auto-generated from fragment: '24'
-    import sympy as sp
-    expr = sp.sympify('24')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('24')
 
 def zannichellia_palustris_3_eq():
     # Auto-generated from fragment: '24'
-    import sympy as sp
-    expr = sp.sympify('24')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('24')
 
 def acrylate_1_eq(CHCO):
     # Auto-generated from fragment: 'CHCO-2'
-    import sympy as sp
-    expr = sp.sympify('CHCO - 2')
-    f = sp.lambdify((CHCO), expr, 'math')
-    _res = f(CHCO)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('CHCO - 2', ('CHCO',), (CHCO,))
 
 def acrylate_2_eq(CHCO):
     # Auto-generated from fragment: 'CHCO-2'
-    import sympy as sp
-    expr = sp.sympify('CHCO - 2')
-    f = sp.lambdify((CHCO), expr, 'math')
-    _res = f(CHCO)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('CHCO - 2', ('CHCO',), (CHCO,))
 
 def acrylate_3_eq(CHCO):
     # Auto-generated from fragment: 'CHCO-2'
-    import sympy as sp
-    expr = sp.sympify('CHCO - 2')
-    f = sp.lambdify((CHCO), expr, 'math')
-    _res = f(CHCO)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('CHCO - 2', ('CHCO',), (CHCO,))
 
 def addend_1_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def addend_2_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def addend_3_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def adjunction_1_eq(x):
     # Auto-generated from fragment: '(x)'
-    import sympy as sp
-    expr = sp.sympify('x')
-    f = sp.lambdify((x), expr, 'math')
-    _res = f(x)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('x', ('x',), (x,))
 
 def adjunction_2_eq(x):
     # Auto-generated from fragment: '(x)'
-    import sympy as sp
-    expr = sp.sympify('x')
-    f = sp.lambdify((x), expr, 'math')
-    _res = f(x)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('x', ('x',), (x,))
 
 def adjunction_3_eq(x):
     # Auto-generated from fragment: '(x)'
-    import sympy as sp
-    expr = sp.sympify('x')
-    f = sp.lambdify((x), expr, 'math')
-    _res = f(x)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def albert_einstein_1_eq(c, m):
-    # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def albert_einstein_2_eq(c, m):
-    # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def albert_einstein_3_eq(c, m):
-    # Auto-generated from fragment: 'm*c**2'
-    import sympy as sp
-    expr = sp.sympify('c**2*m')
-    f = sp.lambdify((c, m), expr, 'math')
-    _res = f(c, m)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('x', ('x',), (x,))
 
 def alkane_1_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def alkane_2_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def alkane_3_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def alkane_series_1_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def alkane_series_2_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def alkane_series_3_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def allyl_2_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allyl_4_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allyl_6_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allyl_group_2_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allyl_group_4_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allyl_group_6_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allyl_radical_2_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allyl_radical_4_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allyl_radical_6_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allylic_2_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allylic_4_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def allylic_6_eq(C, CH, H):
     # Auto-generated from fragment: 'CH-C*H**2'
-    import sympy as sp
-    expr = sp.sympify('-C*H**2 + CH')
-    f = sp.lambdify((C, CH, H), expr, 'math')
-    _res = f(C, CH, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('-C*H**2 + CH', ('C', 'CH', 'H'), (C, CH, H))
 
 def amicable_1(a):
     # Auto-generated from fragment: 'a)=b and s(b)=a'
-    import sympy as sp
-    expr = sp.sympify('a')
-    f = sp.lambdify((a), expr, 'math')
-    _res = f(a)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('a', ('a',), (a,))
 
 def amicable_3(a):
     # Auto-generated from fragment: 'a)=b and s(b)=a'
-    import sympy as sp
-    expr = sp.sympify('a')
-    f = sp.lambdify((a), expr, 'math')
-    _res = f(a)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('a', ('a',), (a,))
 
 def amicable_5(a):
     # Auto-generated from fragment: 'a)=b and s(b)=a'
-    import sympy as sp
-    expr = sp.sympify('a')
-    f = sp.lambdify((a), expr, 'math')
-    _res = f(a)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('a', ('a',), (a,))
 
 def androsterone_1():
     # Auto-generated from fragment: '1/7'
-    import sympy as sp
-    expr = sp.sympify('1/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/7')
 
 def androsterone_2():
     # Auto-generated from fragment: '1/7'
-    import sympy as sp
-    expr = sp.sympify('1/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/7')
 
 def androsterone_3():
     # Auto-generated from fragment: '1/7'
-    import sympy as sp
-    expr = sp.sympify('1/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/7')
 
 def antielectron_1():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def antielectron_2():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def antielectron_3():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def antilog_1():
     # Auto-generated from fragment: '1000 = 103 = 10 × 10 × 10'
-    import sympy as sp
-    expr = sp.sympify('1000')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1000')
 
 def antilog_2_eq(by):
     # Auto-generated from fragment: 'by'
-    import sympy as sp
-    expr = sp.sympify('by')
-    f = sp.lambdify((by), expr, 'math')
-    _res = f(by)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('by', ('by',), (by,))
 
 def antilog_3_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def antilog_4():
     # Auto-generated from fragment: '1000 = 103 = 10 × 10 × 10'
-    import sympy as sp
-    expr = sp.sympify('1000')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1000')
 
 def antilog_5_eq(by):
     # Auto-generated from fragment: 'by'
-    import sympy as sp
-    expr = sp.sympify('by')
-    f = sp.lambdify((by), expr, 'math')
-    _res = f(by)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('by', ('by',), (by,))
 
 def antilog_6_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def antilog_7():
     # Auto-generated from fragment: '1000 = 103 = 10 × 10 × 10'
-    import sympy as sp
-    expr = sp.sympify('1000')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1000')
 
 def antilog_8_eq(by):
     # Auto-generated from fragment: 'by'
-    import sympy as sp
-    expr = sp.sympify('by')
-    f = sp.lambdify((by), expr, 'math')
-    _res = f(by)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('by', ('by',), (by,))
 
 def antilog_9_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def antilogarithm_1():
     # Auto-generated from fragment: '1000 = 103 = 10 × 10 × 10'
-    import sympy as sp
-    expr = sp.sympify('1000')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1000')
 
 def antilogarithm_2_eq(by):
     # Auto-generated from fragment: 'by'
-    import sympy as sp
-    expr = sp.sympify('by')
-    f = sp.lambdify((by), expr, 'math')
-    _res = f(by)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('by', ('by',), (by,))
 
 def antilogarithm_3_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def antilogarithm_4():
     # Auto-generated from fragment: '1000 = 103 = 10 × 10 × 10'
-    import sympy as sp
-    expr = sp.sympify('1000')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1000')
 
 def antilogarithm_5_eq(by):
     # Auto-generated from fragment: 'by'
-    import sympy as sp
-    expr = sp.sympify('by')
-    f = sp.lambdify((by), expr, 'math')
-    _res = f(by)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('by', ('by',), (by,))
 
 def antilogarithm_6_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def antilogarithm_7():
     # Auto-generated from fragment: '1000 = 103 = 10 × 10 × 10'
-    import sympy as sp
-    expr = sp.sympify('1000')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1000')
 
 def antilogarithm_8_eq(by):
     # Auto-generated from fragment: 'by'
-    import sympy as sp
-    expr = sp.sympify('by')
-    f = sp.lambdify((by), expr, 'math')
-    _res = f(by)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('by', ('by',), (by,))
 
 def antilogarithm_9_eq():
     # Auto-generated from fragment: '3'
-    import sympy as sp
-    expr = sp.sympify('3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('3')
 
 def antimuon_1():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def antimuon_2():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def antimuon_3():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def antitauon_1():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def antitauon_2():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def antitauon_3():
     # Auto-generated from fragment: '1/2'
-    import sympy as sp
-    expr = sp.sympify('1/2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/2')
 
 def arcminute_1():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcminute_2():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcminute_3():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def arcminute_4():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcminute_5():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcminute_6():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def arcminute_7():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcminute_8():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcminute_9():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def arcsec_1():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcsec_2():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcsec_3():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def arcsec_4():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcsec_5():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcsec_6():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def arcsec_7():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcsec_8():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcsec_9():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def arcsecond_1():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcsecond_2():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcsecond_3():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def arcsecond_4():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcsecond_5():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcsecond_6():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def arcsecond_7():
     # Auto-generated from fragment: '1/60'
-    import sympy as sp
-    expr = sp.sympify('1/60')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/60')
 
 def arcsecond_8():
     # Auto-generated from fragment: '1/360'
-    import sympy as sp
-    expr = sp.sympify('1/360')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/360')
 
 def arcsecond_9():
     # Auto-generated from fragment: '1/21600'
-    import sympy as sp
-    expr = sp.sympify('1/21600')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def around_the_clock_1():
-    # Auto-generated from fragment: '24/7'
-    import sympy as sp
-    expr = sp.sympify('24/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def around_the_clock_2():
-    # Auto-generated from fragment: '24/7'
-    import sympy as sp
-    expr = sp.sympify('24/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def around_the_clock_3():
-    # Auto-generated from fragment: '24/7'
-    import sympy as sp
-    expr = sp.sympify('24/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/21600')
 
 def around_the_clock_1():
     # Auto-generated from fragment: '24/7'
-    import sympy as sp
-    expr = sp.sympify('24/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('24/7')
 
 def around_the_clock_2():
     # Auto-generated from fragment: '24/7'
-    import sympy as sp
-    expr = sp.sympify('24/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('24/7')
 
 def around_the_clock_3():
     # Auto-generated from fragment: '24/7'
-    import sympy as sp
-    expr = sp.sympify('24/7')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('24/7')
 
 def arsine_1_eq(aryl):
     # Auto-generated from fragment: 'aryl or alkyl'
-    import sympy as sp
-    expr = sp.sympify('aryl')
-    f = sp.lambdify((aryl), expr, 'math')
-    _res = f(aryl)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('aryl', ('aryl',), (aryl,))
 
 def arsine_2_eq(aryl):
     # Auto-generated from fragment: 'aryl or alkyl'
-    import sympy as sp
-    expr = sp.sympify('aryl')
-    f = sp.lambdify((aryl), expr, 'math')
-    _res = f(aryl)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('aryl', ('aryl',), (aryl,))
 
 def arsine_3_eq(aryl):
     # Auto-generated from fragment: 'aryl or alkyl'
-    import sympy as sp
-    expr = sp.sympify('aryl')
-    f = sp.lambdify((aryl), expr, 'math')
-    _res = f(aryl)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('aryl', ('aryl',), (aryl,))
 
 def atomic_mass_unit_1():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def atomic_mass_unit_2(Da):
     # Auto-generated from fragment: 'mu = ma(12C)/12 = 1 Da'
-    import sympy as sp
-    expr = sp.sympify('Da')
-    f = sp.lambdify((Da), expr, 'math')
-    _res = f(Da)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('Da', ('Da',), (Da,))
 
 def atomic_mass_unit_3_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def atomic_mass_unit_4():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def atomic_mass_unit_5(Da):
     # Auto-generated from fragment: 'mu = ma(12C)/12 = 1 Da'
-    import sympy as sp
-    expr = sp.sympify('Da')
-    f = sp.lambdify((Da), expr, 'math')
-    _res = f(Da)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('Da', ('Da',), (Da,))
 
 def atomic_mass_unit_6_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def atomic_mass_unit_7():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def atomic_mass_unit_8(Da):
     # Auto-generated from fragment: 'mu = ma(12C)/12 = 1 Da'
-    import sympy as sp
-    expr = sp.sympify('Da')
-    f = sp.lambdify((Da), expr, 'math')
-    _res = f(Da)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('Da', ('Da',), (Da,))
 
 def atomic_mass_unit_9_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def atomic_weight_1():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def atomic_weight_2():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def atomic_weight_3():
     # Auto-generated from fragment: '1/12'
-    import sympy as sp
-    expr = sp.sympify('1/12')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/12')
 
 def augend_1_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def augend_2_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def augend_3_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def austrian_schilling_1_eq():
-    # Auto-generated from fragment: '13'
-    import sympy as sp
-    expr = sp.sympify('13')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def austrian_schilling_2_eq():
-    # Auto-generated from fragment: '13'
-    import sympy as sp
-    expr = sp.sympify('13')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def austrian_schilling_3_eq():
-    # Auto-generated from fragment: '13'
-    import sympy as sp
-    expr = sp.sympify('13')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_1():
-    # Auto-generated from fragment: '(2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_2():
-    # Auto-generated from fragment: '(2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_3():
-    # Auto-generated from fragment: '2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_4():
-    # Auto-generated from fragment: '2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_5():
-    # Auto-generated from fragment: '(2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_6():
-    # Auto-generated from fragment: '2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_7():
-    # Auto-generated from fragment: '(2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_8():
-    # Auto-generated from fragment: '2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_9():
-    # Auto-generated from fragment: '(2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_10():
-    # Auto-generated from fragment: '(2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_11():
-    # Auto-generated from fragment: '2n=4x=28)'
-    import sympy as sp
-    expr = sp.sympify('28')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
-
-def avena_barbata_12():
-    # Auto-generated from fragment: '2n=2x=14)'
-    import sympy as sp
-    expr = sp.sympify('14')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def ball_valve_1():
     # Auto-generated from fragment: '1/4'
-    import sympy as sp
-    expr = sp.sympify('1/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/4')
 
 def ball_valve_2():
     # Auto-generated from fragment: '1/4'
-    import sympy as sp
-    expr = sp.sympify('1/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/4')
 
 def ball_valve_3():
     # Auto-generated from fragment: '1/4'
-    import sympy as sp
-    expr = sp.sympify('1/4')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/4')
 
 def barium_hydroxide_1_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def barium_hydroxide_2_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def barium_hydroxide_3_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def barye_1_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def barye_2_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def barye_4_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def barye_5_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def barye_7_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def barye_8_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def baryon_number_1_eq():
     # Auto-generated from fragment: '+1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def baryon_number_2_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def baryon_number_3_eq():
     # Auto-generated from fragment: '-1'
-    import sympy as sp
-    expr = sp.sympify('-1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('-1')
 
 def baryon_number_4_eq():
     # Auto-generated from fragment: '+1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def baryon_number_5_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def baryon_number_6_eq():
     # Auto-generated from fragment: '-1'
-    import sympy as sp
-    expr = sp.sympify('-1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('-1')
 
 def baryon_number_7_eq():
     # Auto-generated from fragment: '+1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def baryon_number_8_eq():
     # Auto-generated from fragment: '0'
-    import sympy as sp
-    expr = sp.sympify('0')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('0')
 
 def baryon_number_9_eq():
     # Auto-generated from fragment: '-1'
-    import sympy as sp
-    expr = sp.sympify('-1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('-1')
 
 def bavaria_1():
     # Auto-generated from fragment: '1/5'
-    import sympy as sp
-    expr = sp.sympify('1/5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/5')
 
 def bavaria_2():
     # Auto-generated from fragment: '1/5'
-    import sympy as sp
-    expr = sp.sympify('1/5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/5')
 
 def bavaria_3():
     # Auto-generated from fragment: '1/5'
-    import sympy as sp
-    expr = sp.sympify('1/5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/5')
 
 def beauty_quark_1():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def beauty_quark_2():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def beauty_quark_3():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def bigram_1_eq():
     # Auto-generated from fragment: '2'
-    import sympy as sp
-    expr = sp.sympify('2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2')
 
 def bigram_2_eq():
     # Auto-generated from fragment: '2'
-    import sympy as sp
-    expr = sp.sympify('2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2')
 
 def bigram_3_eq():
     # Auto-generated from fragment: '2'
-    import sympy as sp
-    expr = sp.sympify('2')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2')
 
 def binding_energy_1_eq(DeltaE):
     # Auto-generated from fragment: 'DeltaE'
-    import sympy as sp
-    expr = sp.sympify('DeltaE')
-    f = sp.lambdify((DeltaE), expr, 'math')
-    _res = f(DeltaE)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('DeltaE', ('DeltaE',), (DeltaE,))
 
 def binding_energy_2_eq(DeltaE):
     # Auto-generated from fragment: 'DeltaE'
-    import sympy as sp
-    expr = sp.sympify('DeltaE')
-    f = sp.lambdify((DeltaE), expr, 'math')
-    _res = f(DeltaE)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('DeltaE', ('DeltaE',), (DeltaE,))
 
 def binding_energy_3_eq(DeltaE):
     # Auto-generated from fragment: 'DeltaE'
-    import sympy as sp
-    expr = sp.sympify('DeltaE')
-    f = sp.lambdify((DeltaE), expr, 'math')
-    _res = f(DeltaE)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('DeltaE', ('DeltaE',), (DeltaE,))
 
 def binomial_probability_1_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def binomial_probability_2_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def binomial_probability_3_eq():
     # Auto-generated from fragment: '1'
-    import sympy as sp
-    expr = sp.sympify('1')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1')
 
 def biquadrate_1_eq(n):
     # Auto-generated from fragment: 'n * n * n * n'
-    import sympy as sp
-    expr = sp.sympify('n**4')
-    f = sp.lambdify((n), expr, 'math')
-    _res = f(n)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('n**4', ('n',), (n,))
 
 def biquadrate_2_eq(n):
     # Auto-generated from fragment: 'n * n * n * n'
-    import sympy as sp
-    expr = sp.sympify('n**4')
-    f = sp.lambdify((n), expr, 'math')
-    _res = f(n)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('n**4', ('n',), (n,))
 
 def biquadrate_3_eq(n):
     # Auto-generated from fragment: 'n * n * n * n'
-    import sympy as sp
-    expr = sp.sympify('n**4')
-    f = sp.lambdify((n), expr, 'math')
-    _res = f(n)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('n**4', ('n',), (n,))
 
 def blue_copperas_1_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def blue_copperas_2_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def blue_copperas_3_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def blue_vitriol_1_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def blue_vitriol_2_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def blue_vitriol_3_eq():
     # Auto-generated from fragment: '5'
-    import sympy as sp
-    expr = sp.sympify('5')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('5')
 
 def bottom_quark_1():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def bottom_quark_2():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def bottom_quark_3():
     # Auto-generated from fragment: '1/3'
-    import sympy as sp
-    expr = sp.sympify('1/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/3')
 
 def butadiene_1(C, H):
     # Auto-generated from fragment: 'CH2=CH-CH=CH2'
-    import sympy as sp
-    expr = sp.sympify('C*H**2')
-    f = sp.lambdify((C, H), expr, 'math')
-    _res = f(C, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('C*H**2', ('C', 'H'), (C, H))
 
 def butadiene_2(C, H):
     # Auto-generated from fragment: 'CH2=CH-CH=CH2'
-    import sympy as sp
-    expr = sp.sympify('C*H**2')
-    f = sp.lambdify((C, H), expr, 'math')
-    _res = f(C, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('C*H**2', ('C', 'H'), (C, H))
 
 def butadiene_3(C, H):
     # Auto-generated from fragment: 'CH2=CH-CH=CH2'
-    import sympy as sp
-    expr = sp.sympify('C*H**2')
-    f = sp.lambdify((C, H), expr, 'math')
-    _res = f(C, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('C*H**2', ('C', 'H'), (C, H))
 
 def calorie_1_eq(cal):
     # Auto-generated from fragment: '1000*cal'
-    import sympy as sp
-    expr = sp.sympify('1000*cal')
-    f = sp.lambdify((cal), expr, 'math')
-    _res = f(cal)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1000*cal', ('cal',), (cal,))
 
 def calorie_2_eq(cal):
     # Auto-generated from fragment: '1000*cal'
-    import sympy as sp
-    expr = sp.sympify('1000*cal')
-    f = sp.lambdify((cal), expr, 'math')
-    _res = f(cal)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1000*cal', ('cal',), (cal,))
 
 def calorie_3_eq(cal):
     # Auto-generated from fragment: '1000*cal'
-    import sympy as sp
-    expr = sp.sympify('1000*cal')
-    f = sp.lambdify((cal), expr, 'math')
-    _res = f(cal)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1000*cal', ('cal',), (cal,))
 
 def calorific_1_eq(cal):
     # Auto-generated from fragment: '1000*cal'
-    import sympy as sp
-    expr = sp.sympify('1000*cal')
-    f = sp.lambdify((cal), expr, 'math')
-    _res = f(cal)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1000*cal', ('cal',), (cal,))
 
 def calorific_2_eq(cal):
     # Auto-generated from fragment: '1000*cal'
-    import sympy as sp
-    expr = sp.sympify('1000*cal')
-    f = sp.lambdify((cal), expr, 'math')
-    _res = f(cal)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1000*cal', ('cal',), (cal,))
 
 def calorific_3_eq(cal):
     # Auto-generated from fragment: '1000*cal'
-    import sympy as sp
-    expr = sp.sympify('1000*cal')
-    f = sp.lambdify((cal), expr, 'math')
-    _res = f(cal)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('1000*cal', ('cal',), (cal,))
 
 def cash_flow_1_eq(CF, t):
     # Auto-generated from fragment: 'CF*(t)'
-    import sympy as sp
-    expr = sp.sympify('CF*t')
-    f = sp.lambdify((CF, t), expr, 'math')
-    _res = f(CF, t)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('CF*t', ('CF', 't'), (CF, t))
 
 def cash_flow_2_eq(CF, t):
     # Auto-generated from fragment: 'CF*(t)'
-    import sympy as sp
-    expr = sp.sympify('CF*t')
-    f = sp.lambdify((CF, t), expr, 'math')
-    _res = f(CF, t)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('CF*t', ('CF', 't'), (CF, t))
 
 def cash_flow_3_eq(CF, t):
     # Auto-generated from fragment: 'CF*(t)'
-    import sympy as sp
-    expr = sp.sympify('CF*t')
-    f = sp.lambdify((CF, t), expr, 'math')
-    _res = f(CF, t)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('CF*t', ('CF', 't'), (CF, t))
 
 def catastrophic_1_eq(down):
     # Auto-generated from fragment: 'down'
-    import sympy as sp
-    expr = sp.sympify('down')
-    f = sp.lambdify((down), expr, 'math')
-    _res = f(down)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('down', ('down',), (down,))
 
 def catastrophic_2_eq(turning):
     # Auto-generated from fragment: 'turning'
-    import sympy as sp
-    expr = sp.sympify('turning')
-    f = sp.lambdify((turning), expr, 'math')
-    _res = f(turning)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('turning', ('turning',), (turning,))
 
 def catastrophic_3_eq(down):
     # Auto-generated from fragment: 'down'
-    import sympy as sp
-    expr = sp.sympify('down')
-    f = sp.lambdify((down), expr, 'math')
-    _res = f(down)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('down', ('down',), (down,))
 
 def catastrophic_4_eq(turning):
     # Auto-generated from fragment: 'turning'
-    import sympy as sp
-    expr = sp.sympify('turning')
-    f = sp.lambdify((turning), expr, 'math')
-    _res = f(turning)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('turning', ('turning',), (turning,))
 
 def catastrophic_5_eq(down):
     # Auto-generated from fragment: 'down'
-    import sympy as sp
-    expr = sp.sympify('down')
-    f = sp.lambdify((down), expr, 'math')
-    _res = f(down)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('down', ('down',), (down,))
 
 def catastrophic_6_eq(turning):
     # Auto-generated from fragment: 'turning'
-    import sympy as sp
-    expr = sp.sympify('turning')
-    f = sp.lambdify((turning), expr, 'math')
-    _res = f(turning)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('turning', ('turning',), (turning,))
 
 def centimetre_1():
     # Auto-generated from fragment: '1/100'
-    import sympy as sp
-    expr = sp.sympify('1/100')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/100')
 
 def centimetre_2():
     # Auto-generated from fragment: '1/100'
-    import sympy as sp
-    expr = sp.sympify('1/100')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/100')
 
 def centimetre_3():
     # Auto-generated from fragment: '1/100'
-    import sympy as sp
-    expr = sp.sympify('1/100')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('1/100')
 
 def centner_1_eq(kg):
     # Auto-generated from fragment: '100*kg'
-    import sympy as sp
-    expr = sp.sympify('100*kg')
-    f = sp.lambdify((kg), expr, 'math')
-    _res = f(kg)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('100*kg', ('kg',), (kg,))
 
 def centner_2_eq(kg):
     # Auto-generated from fragment: '100*kg'
-    import sympy as sp
-    expr = sp.sympify('100*kg')
-    f = sp.lambdify((kg), expr, 'math')
-    _res = f(kg)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('100*kg', ('kg',), (kg,))
 
 def centner_3_eq(kg):
     # Auto-generated from fragment: '100*kg'
-    import sympy as sp
-    expr = sp.sympify('100*kg')
-    f = sp.lambdify((kg), expr, 'math')
-    _res = f(kg)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('100*kg', ('kg',), (kg,))
 
 def charm_quark_1():
     # Auto-generated from fragment: '2/3'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def charm_quark_2():
     # Auto-generated from fragment: '2/3'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def charm_quark_3():
     # Auto-generated from fragment: '2/3'
-    import sympy as sp
-    expr = sp.sympify('2/3')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('2/3')
 
 def chloroprene_1(C, H):
     # Auto-generated from fragment: 'CH2=CCl−CH=CH2'
-    import sympy as sp
-    expr = sp.sympify('C*H**2')
-    f = sp.lambdify((C, H), expr, 'math')
-    _res = f(C, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('C*H**2', ('C', 'H'), (C, H))
 
 def chloroprene_2(C, H):
     # Auto-generated from fragment: 'CH2=CCl−CH=CH2'
-    import sympy as sp
-    expr = sp.sympify('C*H**2')
-    f = sp.lambdify((C, H), expr, 'math')
-    _res = f(C, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('C*H**2', ('C', 'H'), (C, H))
 
 def chloroprene_3(C, H):
     # Auto-generated from fragment: 'CH2=CCl−CH=CH2'
-    import sympy as sp
-    expr = sp.sympify('C*H**2')
-    f = sp.lambdify((C, H), expr, 'math')
-    _res = f(C, H)
-    try:
-        _c = complex(_res)
-    except Exception:
-        return _res
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _evaluate('C*H**2', ('C', 'H'), (C, H))
 
 def chump_change_1():
     # Auto-generated from fragment: '2000/2004'
-    import sympy as sp
-    expr = sp.sympify('500/501')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('500/501')
 
 def chump_change_2():
     # Auto-generated from fragment: '2000/2004'
-    import sympy as sp
-    expr = sp.sympify('500/501')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('500/501')
 
 def chump_change_3():
     # Auto-generated from fragment: '2000/2004'
-    import sympy as sp
-    expr = sp.sympify('500/501')
-    _val = sp.N(expr)
-    try:
-        _c = complex(_val)
-    except Exception:
-        return float(_val)
-    if _c.imag != 0:
-        return complex(round(_c.real, COMPLEX_ROUND_DECIMALS), round(_c.imag, COMPLEX_ROUND_DECIMALS))
-    return float(_c.real)
+    return _constant('500/501')
@@ -1,16 +1,16 @@
-import json
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from knowledge_store import store
 
 ROOT = os.path.dirname(__file__)
 HISTORY_PATH = os.path.join(ROOT, 'data', 'history.json')
 
 
 def load_history(path: str = None) -> Dict:
-    """Load history JSON and return as dict."""
+    """Load history JSON and return as dict (shared via the knowledge store; do not mutate)."""
     p = path or HISTORY_PATH
-    with open(p, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return store.load_json(p)
 
 
 def _entry_year_range(entry: Dict) -> Tuple[int, int]:
@@ -40,11 +40,9 @@ def _entry_year_range(entry: Dict) -> Tuple[int, int]:
     return int(s), int(e)
 
 
-def find_entries_covering_year(year: int, history: Dict = None) -> List[Tuple[str, Dict]]:
-    """Return list of (key, entry_dict) where the entry covers the given year."""
-    h = history or load_history()
-    matches = []
-    for key, records in h.items():
+def _iter_records(history: Dict):
+    """Yield (key, record) in scan order; dict values holding lists are flattened."""
+    for key, records in history.items():
         # normalize records: some keys map to dicts of lists (e.g., timeline_examples)
         record_list = []
         if isinstance(records, dict):
@@ -55,14 +53,114 @@ def find_entries_covering_year(year: int, history: Dict = None) -> List[Tuple[st
             record_list = records
         else:
             continue
-
         for rec in record_list:
-            if not isinstance(rec, dict):
+            if isinstance(rec, dict):
+                yield key, rec
+
+
+class _Node:
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+    def __init__(self, center, by_start, by_end, left, right):
+        self.center = center
+        self.by_start = by_start
+        self.by_end = by_end
+        self.left = left
+        self.right = right
+
+
+class YearIndex:
+    """Centered interval tree over the (start_year, end_year) of every history record.
+
+    Built once per history dict; `stabbing` and `overlapping` cost O(log n + hits)
+    instead of re-parsing every record's year range on each query. Results come
+    back in the same order as a linear scan of the history file.
+    """
+
+    def __init__(self, history: Dict):
+        self.history = history
+        # (scan order, key, record, start, end)
+        self.items = []
+        for key, rec in _iter_records(history):
+            try:
+                s, e = _entry_year_range(rec)
+            except (TypeError, ValueError):
+                # no usable year information
+                continue
+            if s <= e:
+                self.items.append((len(self.items), key, rec, s, e))
+        self.root = self._build(self.items)
+
+    def _build(self, items):
+        if not items:
+            return None
+        points = sorted(p for it in items for p in (it[3], it[4]))
+        center = points[len(points) // 2]
+        left, right, here = [], [], []
+        for it in items:
+            if it[4] < center:
+                left.append(it)
+            elif it[3] > center:
+                right.append(it)
+            else:
+                here.append(it)
+        return _Node(center,
+                     sorted(here, key=lambda it: it[3]),
+                     sorted(here, key=lambda it: -it[4]),
+                     self._build(left), self._build(right))
+
+    def stabbing(self, year: int) -> List[Tuple[str, Dict, int, int]]:
+        """Records whose range contains `year`, as (key, record, start, end)."""
+        return self.overlapping(year, year)
+
+    def overlapping(self, start: int, end: int) -> List[Tuple[str, Dict, int, int]]:
+        """Records whose range intersects [start, end], as (key, record, start, end)."""
+        if start > end:
+            start, end = end, start
+        hits = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
                 continue
-            s, e = _entry_year_range(rec)
-            if s <= year <= e:
-                matches.append((key, rec))
-    return matches
+            if end < node.center:
+                for it in node.by_start:
+                    if it[3] > end:
+                        break
+                    hits.append(it)
+                stack.append(node.left)
+            elif start > node.center:
+                for it in node.by_end:
+                    if it[4] < start:
+                        break
+                    hits.append(it)
+                stack.append(node.right)
+            else:
+                hits.extend(node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+        hits.sort(key=lambda it: it[0])
+        return [(key, rec, s, e) for _, key, rec, s, e in hits]
+
+
+_index_cache: Dict[int, YearIndex] = {}
+
+
+def history_index(history: Optional[Dict] = None) -> YearIndex:
+    """`YearIndex` for `history` (default: data/history.json), rebuilt only when it changes."""
+    h = history or load_history()
+    index = _index_cache.get(id(h))
+    if index is None or index.history is not h:
+        index = YearIndex(h)
+        # the knowledge store returns the same dict until the file changes
+        _index_cache.clear()
+        _index_cache[id(h)] = index
+    return index
+
+
+def find_entries_covering_year(year: int, history: Dict = None) -> List[Tuple[str, Dict]]:
+    """Return list of (key, entry_dict) where the entry covers the given year."""
+    return [(key, rec) for key, rec, _, _ in history_index(history).stabbing(year)]
 
 
 def _overlap_fraction(a_start: int, a_end: int, b_start: int, b_end: int) -> float:
@@ -82,26 +180,11 @@ def find_entries_within_range(start_year: int, end_year: int, history: Dict = No
     """
     if start_year > end_year:
         start_year, end_year = end_year, start_year
-    h = history or load_history()
     results = []
-    for key, records in h.items():
-        record_list = []
-        if isinstance(records, dict):
-            for v in records.values():
-                if isinstance(v, list):
-                    record_list.extend(v)
-        elif isinstance(records, list):
-            record_list = records
-        else:
-            continue
-
-        for rec in record_list:
-            if not isinstance(rec, dict):
-                continue
-            s, e = _entry_year_range(rec)
-            overlap = _overlap_fraction(start_year, end_year, s, e)
-            if overlap > 0.0:
-                results.append({'key': key, 'entry': rec, 'overlap': overlap, 'entry_start': s, 'entry_end': e})
+    for key, rec, s, e in history_index(history).overlapping(start_year, end_year):
+        overlap = _overlap_fraction(start_year, end_year, s, e)
+        if overlap > 0.0:
+            results.append({'key': key, 'entry': rec, 'overlap': overlap, 'entry_start': s, 'entry_end': e})
     # sort by overlap descending then by entry span
     results.sort(key=lambda r: (-r['overlap'], (r['entry_end'] - r['entry_start'])))
     return results
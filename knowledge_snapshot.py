@@ -0,0 +1,160 @@
+"""Precompiled binary snapshot of the knowledge JSON files for fast cold start.
+
+`build_snapshot()` compiles `thesaurus_assoc.json`, `cross_glossary_sections.json`
+and every `data/*.json` file into one versioned file. Each source is stored as
+its own marshalled blob. The file starts with a small length-prefixed header
+holding the version and an index (mtime/size, content hash, blob offset and
+length per source), so `install_snapshot()` reads only the header at startup;
+a blob is read and decoded the first time the knowledge store asks for it.
+
+Entries whose source changed (different stamp *and* different hash) are ignored
+and the store falls back to parsing the JSON, so a stale snapshot is never wrong,
+only slower. Rebuild with:
+
+    python knowledge_snapshot.py build
+"""
+import marshal
+import os
+import struct
+import sys
+from functools import partial
+from typing import Dict, List, Optional
+
+from knowledge_store import file_stamp, file_digest, store
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(ROOT, 'knowledge_snapshot.bin')
+SNAPSHOT_FORMAT = 2
+SNAPSHOT_MAGIC = b'KSNP'
+_HEADER_SIZE = struct.Struct('<I')
+# marshal output is only guaranteed stable within one Python minor version
+SNAPSHOT_VERSION = (SNAPSHOT_FORMAT, sys.version_info[0], sys.version_info[1])
+SOURCE_FILES = ('thesaurus_assoc.json', 'cross_glossary_sections.json')
+
+
+def source_paths(root: str = ROOT, data_dir: str = 'data') -> List[str]:
+    """Paths (relative to `root`) of every file compiled into the snapshot."""
+    paths = [f for f in SOURCE_FILES if os.path.exists(os.path.join(root, f))]
+    full_data_dir = os.path.join(root, data_dir)
+    if os.path.isdir(full_data_dir):
+        for fname in sorted(os.listdir(full_data_dir)):
+            if fname.endswith('.json'):
+                paths.append(os.path.join(data_dir, fname))
+    return paths
+
+
+def build_snapshot(path: str = SNAPSHOT_PATH, root: str = ROOT, data_dir: str = 'data') -> Dict:
+    """Compile the knowledge sources into `path`. Returns a small summary dict."""
+    import json
+
+    files = {}
+    blobs = []
+    offset = 0
+    skipped = []
+    for rel in source_paths(root, data_dir):
+        full = os.path.join(root, rel)
+        try:
+            with open(full, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            blob = marshal.dumps(data)
+        except Exception:
+            skipped.append(rel)
+            continue
+        files[rel] = {'stamp': file_stamp(full), 'digest': file_digest(full), 'offset': offset, 'size': len(blob)}
+        blobs.append(blob)
+        offset += len(blob)
+
+    # magic, header length, header (version + index), then the blobs back to back
+    header = marshal.dumps({'version': SNAPSHOT_VERSION, 'files': files})
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(SNAPSHOT_MAGIC + _HEADER_SIZE.pack(len(header)) + header)
+        for blob in blobs:
+            f.write(blob)
+        size = f.tell()
+    os.replace(tmp, path)
+    return {'path': path, 'files': len(files), 'skipped': skipped, 'bytes': size}
+
+
+def read_snapshot(path: str = SNAPSHOT_PATH) -> Optional[Dict]:
+    """Return the snapshot header, or None when it is missing or from another version.
+
+    Only the header is read: {'version', 'files': {rel: {'stamp', 'digest',
+    'offset', 'size'}}, 'data_start', 'stamp'}, where blob offsets are relative
+    to `data_start` and `stamp` is that of the snapshot file itself.
+    """
+    try:
+        with open(path, 'rb') as f:
+            prefix = f.read(len(SNAPSHOT_MAGIC) + _HEADER_SIZE.size)
+            if len(prefix) != len(SNAPSHOT_MAGIC) + _HEADER_SIZE.size or not prefix.startswith(SNAPSHOT_MAGIC):
+                return None
+            (length,) = _HEADER_SIZE.unpack(prefix[len(SNAPSHOT_MAGIC):])
+            snap = marshal.loads(f.read(length))
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(snap, dict) or snap.get('version') != SNAPSHOT_VERSION:
+        return None
+    snap['data_start'] = len(prefix) + length
+    snap['stamp'] = file_stamp(path)
+    return snap
+
+
+def _read_blob(path: str, snapshot_stamp, start: int, size: int) -> bytes:
+    # a snapshot rebuilt since it was installed has different offsets
+    if file_stamp(path) != snapshot_stamp:
+        raise ValueError(f'snapshot {path} changed since it was installed')
+    with open(path, 'rb') as f:
+        f.seek(start)
+        blob = f.read(size)
+    if len(blob) != size:
+        raise EOFError(f'snapshot {path} is truncated')
+    return blob
+
+
+def install_snapshot(path: str = SNAPSHOT_PATH, root: str = ROOT, knowledge=None) -> int:
+    """Attach a snapshot to the knowledge store. Returns the number of entries attached.
+
+    Safe to call when no snapshot exists; the store simply keeps parsing JSON.
+    """
+    snap = read_snapshot(path)
+    if not snap:
+        return 0
+    entries = {}
+    for rel, ent in snap.get('files', {}).items():
+        stamp = ent.get('stamp')
+        blob = partial(_read_blob, path, snap['stamp'], snap['data_start'] + ent['offset'], ent['size'])
+        entries[os.path.abspath(os.path.join(root, rel))] = (tuple(stamp) if stamp else None, ent['digest'], blob)
+    (knowledge or store).attach_snapshot(entries)
+    return len(entries)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Build or inspect the precompiled knowledge snapshot')
+    parser.add_argument('command', choices=['build', 'info'], help='build the snapshot or show its status')
+    parser.add_argument('--out', default=SNAPSHOT_PATH, help='snapshot file path')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        summary = build_snapshot(args.out)
+        print(f"Wrote {summary['files']} files ({summary['bytes']} bytes) to {summary['path']}")
+        for rel in summary['skipped']:
+            print(f'Skipped unreadable source: {rel}')
+        return 0
+
+    snap = read_snapshot(args.out)
+    if not snap:
+        print(f'No usable snapshot at {args.out} (missing or built by another Python version).')
+        return 1
+    stale = 0
+    for rel, ent in sorted(snap['files'].items()):
+        full = os.path.join(ROOT, rel)
+        fresh = os.path.exists(full) and (tuple(ent['stamp'] or ()) == file_stamp(full) or file_digest(full) == ent['digest'])
+        stale += 0 if fresh else 1
+        print(f"{'ok   ' if fresh else 'STALE'} {rel}")
+    print(f"{len(snap['files'])} files, {stale} stale")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main(sys.argv[1:]))
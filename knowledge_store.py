@@ -0,0 +1,213 @@
+"""Process-wide, mtime-validated cache of the JSON knowledge files.
+
+Every loader in the engine (`eng1neer`, `taxonomic_grammar`, `equality_verifier`,
+`find_subject_bridges`, `compare_subjects`, `NaturalCodeEngine`) used to walk
+`data/` and `json.load` each file on its own, so a single chat turn could parse
+`chemistry.json` several times. They now read through the shared `store`
+instance defined at the bottom of this module.
+
+Files are parsed once and re-read only when their mtime or size changes.
+Derived views (the merged term map, indexes built by other modules) are cached
+against a signature of the directory and rebuilt when any file changes.
+The parsed objects are shared between callers: treat them as read-only and
+copy before mutating.
+
+A precompiled snapshot (see `knowledge_snapshot.py`) can be attached so cache
+misses are served from marshalled data instead of re-parsing JSON.
+"""
+import hashlib
+import json
+import marshal
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+DATA_DIR = 'data'
+_MISSING = object()
+
+
+def file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def normalize_term(term: str) -> str:
+    """Key used by the term index: lowercased with surrounding whitespace removed."""
+    return term.strip().lower()
+
+
+def file_digest(path: str) -> str:
+    """Content hash used to validate snapshot entries."""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+class KnowledgeStore:
+    """Thread-safe cache of parsed JSON files and views derived from them."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # abspath -> (stamp, parsed data)
+        self._files: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        # (abs data_dir, view name) -> (directory signature, view)
+        self._views: Dict[Tuple[str, str], Tuple[tuple, Any]] = {}
+        # abspath -> (stamp, digest, marshalled data or a function reading it) from an attached snapshot
+        self._snapshot: Dict[str, Tuple[Tuple[int, int], str, Any]] = {}
+        self.stats = {'hits': 0, 'loads': 0, 'snapshot_loads': 0}
+
+    # -- single files -------------------------------------------------------
+    def load_json(self, path: str) -> Any:
+        """Return the parsed contents of `path`, re-reading it only if it changed.
+
+        Raises the same exceptions as `open`/`json.load` for missing or broken files.
+        """
+        key = os.path.abspath(path)
+        stamp = file_stamp(key)
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None and stamp is not None and cached[0] == stamp:
+                self.stats['hits'] += 1
+                return cached[1]
+            data = self._from_snapshot(key, stamp)
+            if data is _MISSING:
+                with open(key, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.stats['loads'] += 1
+            if stamp is not None:
+                self._files[key] = (stamp, data)
+            return data
+
+    def attach_snapshot(self, entries: Dict[str, Tuple[Tuple[int, int], str, Any]]) -> None:
+        """Register snapshot entries (abspath -> (stamp, digest, marshalled data)).
+
+        The data may also be a no-argument callable returning the marshalled
+        bytes, so a snapshot's blobs are only read when their file is requested.
+        """
+        with self._lock:
+            self._snapshot.update(entries)
+
+    def _from_snapshot(self, key: str, stamp: Optional[Tuple[int, int]]) -> Any:
+        entry = self._snapshot.pop(key, None)
+        if entry is None or stamp is None:
+            return _MISSING
+        snap_stamp, digest, blob = entry
+        # a touched-but-unchanged file (e.g. after a checkout) still matches by hash
+        if snap_stamp != stamp and file_digest(key) != digest:
+            return _MISSING
+        try:
+            data = marshal.loads(blob() if callable(blob) else blob)
+        except (OSError, EOFError, ValueError, TypeError):
+            return _MISSING
+        self.stats['snapshot_loads'] += 1
+        return data
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop one cached file (or everything when `path` is None)."""
+        with self._lock:
+            if path is None:
+                self._files.clear()
+                self._views.clear()
+                return
+            self._files.pop(os.path.abspath(path), None)
+
+    # -- data directories ---------------------------------------------------
+    def json_files(self, data_dir: str = DATA_DIR) -> List[str]:
+        """Sorted names of the `.json` files directly inside `data_dir`."""
+        try:
+            return sorted(f for f in os.listdir(data_dir) if f.endswith('.json'))
+        except OSError:
+            return []
+
+    def signature(self, data_dir: str = DATA_DIR) -> tuple:
+        """Cheap fingerprint of `data_dir`: file names with their mtimes and sizes."""
+        return tuple((f, file_stamp(os.path.join(data_dir, f))) for f in self.json_files(data_dir))
+
+    def files(self, data_dir: str = DATA_DIR) -> Dict[str, Any]:
+        """Per-file view: file name -> parsed JSON (`{}` for unreadable files)."""
+        out = {}
+        for fname in self.json_files(data_dir):
+            out[fname] = self.get(fname, data_dir, default={})
+        return out
+
+    def get(self, fname: str, data_dir: str = DATA_DIR, default: Any = None) -> Any:
+        """Parsed contents of `data_dir/fname`, or `default` if it cannot be loaded."""
+        try:
+            return self.load_json(os.path.join(data_dir, fname))
+        except Exception:
+            return default
+
+    def view(self, name: str, builder: Callable[[Dict[str, Any]], Any], data_dir: str = DATA_DIR) -> Any:
+        """Return `builder(files(data_dir))`, cached until any file in `data_dir` changes.
+
+        `name` identifies the view; use a distinct name per builder.
+        """
+        key = (os.path.abspath(data_dir), name)
+        sig = self.signature(data_dir)
+        with self._lock:
+            cached = self._views.get(key)
+            if cached is not None and cached[0] == sig:
+                return cached[1]
+            value = builder(self.files(data_dir))
+            self._views[key] = (sig, value)
+            return value
+
+    def merged_terms(self, data_dir: str = DATA_DIR, include_lists: bool = False) -> Dict[str, Any]:
+        """Merged term view: lowercased key -> entry across every file in `data_dir`.
+
+        Later files (in sorted order) win on duplicate keys. With `include_lists`,
+        files whose top level is a list of dicts contribute their keys too.
+        """
+        def build(files):
+            merged = {}
+            for data in files.values():
+                if isinstance(data, dict):
+                    for k, v in data.items():
+                        merged[k.lower()] = v
+                elif include_lists and isinstance(data, list):
+                    for entry in data:
+                        if isinstance(entry, dict):
+                            for k, v in entry.items():
+                                merged[k.lower()] = v
+            return merged
+        name = 'merged_terms+lists' if include_lists else 'merged_terms'
+        return self.view(name, build, data_dir)
+
+    def term_index(self, data_dir: str = DATA_DIR) -> Dict[str, List[Tuple[str, str, Optional[int]]]]:
+        """Inverted index: normalized term -> [(file name, key, entry offset), ...].
+
+        Postings follow the sorted file order. The offset is the position of the
+        entry inside a top-level list, or None when the file is a dict (address
+        the entry by key).
+        """
+        def build(files):
+            index = {}
+            for fname, data in files.items():
+                if isinstance(data, dict):
+                    for k in data:
+                        index.setdefault(normalize_term(k), []).append((fname, k, None))
+                elif isinstance(data, list):
+                    for i, entry in enumerate(data):
+                        if isinstance(entry, dict):
+                            for k in entry:
+                                index.setdefault(normalize_term(k), []).append((fname, k, i))
+            return index
+        return self.view('term_index', build, data_dir)
+
+    def files_defining(self, term: str, data_dir: str = DATA_DIR) -> List[str]:
+        """Names of the dict-shaped files in `data_dir` that have `term` as an exact key."""
+        return self.files_defining_many([term], data_dir)[term]
+
+    def files_defining_many(self, terms: Iterable[str], data_dir: str = DATA_DIR) -> Dict[str, List[str]]:
+        """`files_defining` for several terms, checking `data_dir` for changes only once."""
+        index = self.term_index(data_dir)
+        out = {}
+        for term in terms:
+            postings = index.get(normalize_term(term), ())
+            out[term] = [fname for fname, key, offset in postings if offset is None and key == term]
+        return out
+
+
+store = KnowledgeStore()
@@ -10,7 +10,11 @@ from kivy.uix.scrollview import ScrollView
 import threading
 import os
 
-from eng1neer import load_all_definitions, respond_with_evidence, detailed_comparison, respond_subject_specific
+from eng1neer import load_all_definitions, respond_with_evidence, detailed_comparison, evidence_turn, respond_subject_specific
+from knowledge_snapshot import install_snapshot
+
+# serve data files from the precompiled snapshot when it matches the sources
+install_snapshot()
 
 
 def safe_format(text: str) -> str:
@@ -78,6 +82,7 @@ class ChatBox(BoxLayout):
             self.defs = {}
 
         self._last_prompt = None
+        self._last_turn = None
 
     def _update_height(self, instance, value):
         self.history.height = self.history.texture_size[1]
@@ -133,7 +138,10 @@ class ChatBox(BoxLayout):
         else:
             # Try the evidence-aware responder (verbose narrative)
             try:
-                resp = respond_with_evidence(self.defs, prompt, verbose=True)
+                # one evidence pass serves both this reply and a later 'Show Evidence'
+                turn = evidence_turn(self.defs, prompt)
+                self._last_turn = turn
+                resp = turn['narrative']
             except Exception:
                 try:
                     resp = respond_subject_specific(prompt, assoc_path='thesaurus_assoc.json', data_dir='data')
@@ -189,7 +197,11 @@ class ChatBox(BoxLayout):
     def _fetch_and_show_evidence(self, prompt: str):
         from kivy.clock import Clock
         try:
-            det = detailed_comparison(self.defs, prompt)
+            turn = self._last_turn
+            if turn is not None and turn.get('text') == prompt and turn.get('comparison') is not None:
+                det = turn['comparison']
+            else:
+                det = detailed_comparison(self.defs, prompt)
             if not isinstance(det, dict):
                 Clock.schedule_once(lambda dt: self.append_history('[color=ff0000]No evidence available.[/color]\n'))
                 return
@@ -244,6 +256,7 @@ from eng1neer import (
     load_all_definitions,
     respond_with_evidence,
     detailed_comparison,
+    evidence_turn,
     try_eval_expression,
     respond_subject_specific,
 )
@@ -311,6 +324,7 @@ class ChatBox(BoxLayout):
             self.defs = {}
 
         self._last_prompt = None
+        self._last_turn = None
 
     def _update_height(self, instance, value):
         self.history.height = self.history.texture_size[1]
@@ -340,7 +354,10 @@ class ChatBox(BoxLayout):
 
         # Try the evidence-aware responder (verbose narrative)
         try:
-            resp = respond_with_evidence(self.defs, prompt, verbose=True)
+            # one evidence pass serves both this reply and a later 'Show Evidence'
+            turn = evidence_turn(self.defs, prompt)
+            self._last_turn = turn
+            resp = turn['narrative']
         except Exception:
             try:
                 resp = respond_subject_specific(prompt, assoc_path='thesaurus_assoc.json', data_dir='data')
@@ -397,7 +414,11 @@ class ChatBox(BoxLayout):
     def _fetch_and_show_evidence(self, prompt: str):
         from kivy.clock import Clock
         try:
-            det = detailed_comparison(self.defs, prompt)
+            turn = self._last_turn
+            if turn is not None and turn.get('text') == prompt and turn.get('comparison') is not None:
+                det = turn['comparison']
+            else:
+                det = detailed_comparison(self.defs, prompt)
             if not isinstance(det, dict):
                 Clock.schedule_once(lambda dt: self.append_history('[color=ff0000]No evidence available.[/color]\n'))
                 return
@@ -553,30 +574,8 @@ class ChatBox(BoxLayout):
                     return f'Code generation failed: {e}'
 
             if '=' in line:
-                try:
-                    from sympy import Eq, solve, sympify
-                    eqs = [eq.strip() for eq in line.split(',') if '=' in eq]
-                    if len(eqs) > 10:
-                        eqs = eqs[:10]
-                    sympy_eqs = []
-                    all_vars = set()
-                    for eq in eqs:
-                        left, right = eq.split('=', 1)
-                        left_expr = sympify(left)
-                        right_expr = sympify(right)
-                        sympy_eqs.append(Eq(left_expr, right_expr))
-                        all_vars.update(left_expr.free_symbols)
-                        all_vars.update(right_expr.free_symbols)
-                    sol = solve(sympy_eqs, list(all_vars), dict=True)
-                    if sol:
-                        outs = []
-                        for s in sol:
-                            out = ', '.join(f"{str(k)} = {v}" for k, v in s.items())
-                            outs.append(out)
-                        return '\n'.join(outs)
-                    return 'No solution found.'
-                except Exception as e:
-                    return f'Could not solve equation(s): {e}'
+                from equation_solver import solver as equation_solver, format_solutions
+                return '\n'.join(format_solutions(equation_solver.solve(line), max_vars=None))
 
             if any(c in line for c in '+-*/^()') and any(ch.isdigit() for ch in line):
                 try:
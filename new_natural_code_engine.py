@@ -8,6 +8,8 @@ import os
 import re
 import threading
 
+from knowledge_store import store
+
 
 class NaturalCodeEngine:
     # Mapping of common programming-related words to template names
@@ -219,30 +221,14 @@ class NaturalCodeEngine:
             return json.load(f)
 
     def _load_english_concepts(self):
-        concepts = {}
-        for fname in os.listdir(self.data_dir):
-            if fname.endswith('.json'):
-                with open(os.path.join(self.data_dir, fname), 'r', encoding='utf-8') as f:
-                    try:
-                        data = json.load(f)
-                        if isinstance(data, dict):
-                            for k, v in data.items():
-                                concepts[k.lower()] = v
-                        elif isinstance(data, list):
-                            for entry in data:
-                                if isinstance(entry, dict):
-                                    for k, v in entry.items():
-                                        concepts[k.lower()] = v
-                    except Exception:
-                        continue
-        return concepts
+        # shared, mtime-validated merged view; copied because the engine owns its dict
+        return dict(store.merged_terms(self.data_dir, include_lists=True))
 
     def _load_json_file(self, filename):
         path = os.path.join(self.data_dir, filename)
         if not os.path.exists(path):
             return {}
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return store.load_json(path)
 
     def generate_code(self, prompt: str):
         # DEBUG: Extract and print prompt pieces for analysis
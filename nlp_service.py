@@ -0,0 +1,151 @@
+"""Process-wide spaCy pipeline shared by the responders.
+
+`respond()` kept its own `en_core_web_sm` on the function object,
+`blend_fragments` loaded the model again on every call, and
+`detailed_comparison` ran the full pipeline once per token per fragment.
+They now go through the single `nlp_service` instance below:
+
+- the model is loaded once, on first use, with NER disabled (nothing reads
+  entities); a failed load is remembered so it is not retried on every call;
+- `analyze_many(texts)` runs uncached texts through `nlp.pipe` in batches;
+- per-text token analyses (text, POS, lemma) are cached, so noun checks such
+  as `is_noun_in(token, fragment)` become set lookups after the first pass;
+- `doc(text)` keeps the last few full parses for callers that need noun
+  chunks or the dependency tree.
+
+Everything degrades to "no analysis" (None / empty results) when spaCy or the
+model is not installed, so callers keep their heuristic fallbacks.
+"""
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Tuple
+
+MODEL = 'en_core_web_sm'
+DISABLE = ('ner',)
+NOUN_POS = ('NOUN', 'PROPN')
+
+# one analysed token: (text, pos, lemma)
+Analysis = Tuple[Tuple[str, str, str], ...]
+
+
+class NLPService:
+    """Lazily loaded spaCy model with batched, cached token analysis."""
+
+    def __init__(self, model: str = MODEL, disable: Iterable[str] = DISABLE, cache_size: int = 8192, doc_cache_size: int = 32):
+        self.model = model
+        self.disable = tuple(disable)
+        self.cache_size = cache_size
+        self.doc_cache_size = doc_cache_size
+        self._nlp = None
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._analyses: 'OrderedDict[str, Analysis]' = OrderedDict()
+        self._nouns = {}
+        self._docs: 'OrderedDict[str, object]' = OrderedDict()
+        self.stats = {'hits': 0, 'parsed': 0, 'batches': 0}
+
+    def get(self):
+        """The loaded pipeline, or None when spaCy / the model is unavailable."""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    try:
+                        import spacy
+                        self._nlp = spacy.load(self.model, disable=list(self.disable))
+                    except Exception:
+                        self._nlp = None
+                    self._loaded = True
+        return self._nlp
+
+    def available(self) -> bool:
+        return self.get() is not None
+
+    # -- full parses --------------------------------------------------------
+    def doc(self, text: str):
+        """Full spaCy Doc for `text` (recent ones cached), or None without a model."""
+        nlp = self.get()
+        if nlp is None or not isinstance(text, str):
+            return None
+        with self._lock:
+            d = self._docs.get(text)
+            if d is not None:
+                self._docs.move_to_end(text)
+                self.stats['hits'] += 1
+                return d
+        d = nlp(text)
+        with self._lock:
+            self.stats['parsed'] += 1
+            self._docs[text] = d
+            while len(self._docs) > self.doc_cache_size:
+                self._docs.popitem(last=False)
+            self._remember(text, d)
+        return d
+
+    # -- cached token analyses ----------------------------------------------
+    def _remember(self, text: str, doc) -> Analysis:
+        analysis = tuple((tk.text, tk.pos_, tk.lemma_) for tk in doc)
+        self._analyses[text] = analysis
+        self._analyses.move_to_end(text)
+        while len(self._analyses) > self.cache_size:
+            old, _ = self._analyses.popitem(last=False)
+            self._nouns.pop(old, None)
+        return analysis
+
+    def analyze_many(self, texts: Iterable[str], batch_size: int = 64) -> List[Analysis]:
+        """Token analyses for `texts`; uncached ones are parsed together with `nlp.pipe`."""
+        texts = [t if isinstance(t, str) else '' for t in texts]
+        nlp = self.get()
+        if nlp is None:
+            return [() for _ in texts]
+        # answers come from this call's lookups and parses, never from a re-read
+        # of the LRU, which a large batch or another caller may already have evicted
+        found = {}
+        with self._lock:
+            for t in texts:
+                if t not in found:
+                    analysis = self._analyses.get(t)
+                    if analysis is not None:
+                        self._analyses.move_to_end(t)
+                        found[t] = analysis
+            missing = [t for t in OrderedDict.fromkeys(texts) if t not in found]
+            self.stats['hits'] += len(texts) - len(missing)
+        if missing:
+            # POS and lemmas do not depend on the dependency parse
+            docs = list(nlp.pipe(missing, batch_size=batch_size, disable=['parser']))
+            with self._lock:
+                self.stats['parsed'] += len(missing)
+                self.stats['batches'] += 1
+                for text, d in zip(missing, docs):
+                    found[text] = self._remember(text, d)
+        return [found.get(t, ()) for t in texts]
+
+    def analyze(self, text: str) -> Analysis:
+        return self.analyze_many([text])[0]
+
+    def noun_tokens(self, text: str) -> frozenset:
+        """Lowercased texts of the tokens tagged NOUN/PROPN in `text`."""
+        nouns = self._nouns.get(text)
+        if nouns is None:
+            nouns = frozenset(tok.lower() for tok, pos, _ in self.analyze(text) if pos in NOUN_POS)
+            with self._lock:
+                if text in self._analyses:
+                    self._nouns[text] = nouns
+        return nouns
+
+    def is_noun_in(self, token: str, text: str) -> bool:
+        """Whether `token` (lowercase) is used as a noun somewhere in `text`."""
+        return token.lower() in self.noun_tokens(text)
+
+    def is_noun(self, word: str) -> bool:
+        """Whether a single word is tagged NOUN/PROPN when analysed on its own."""
+        analysis = self.analyze(word)
+        return bool(analysis) and analysis[0][1] in NOUN_POS
+
+    def clear(self) -> None:
+        with self._lock:
+            self._analyses.clear()
+            self._nouns.clear()
+            self._docs.clear()
+
+
+nlp_service = NLPService()
@@ -0,0 +1,213 @@
+"""Word -> POS tag lexicon shared by the noun/verb heuristics.
+
+`blend_fragments` used to run spaCy on each candidate word on its own, which
+costs a full pipeline call per token. The lexicon stores the tag spaCy gives
+each knowledge-base word in isolation (the same single-word analysis), built
+offline from the vocabulary of `data/*.json` and `thesaurus_assoc.json`:
+
+    python pos_lexicon.py build
+
+At run time lookups are dictionary hits. Words missing from the table are
+tagged together in one batched `nlp_service.analyze_many` call by
+`tag_many()` and added to the table; with `autosave` the file is rewritten at
+most every `save_interval` seconds and once more at exit.
+Without spaCy, or before the lexicon is built, unknown words simply have no
+tag and callers keep their suffix heuristics.
+
+`blend_fragments`, `is_participle` and
+`compare_subjects.extract_nouns_and_predicates` all read `pos_lexicon`.
+"""
+import atexit
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+from knowledge_store import DATA_DIR, store
+from nlp_service import MODEL, NOUN_POS, nlp_service
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LEXICON_PATH = os.path.join(ROOT, 'pos_lexicon.json')
+LEXICON_FORMAT = 1
+VOCABULARY_SOURCES = ('thesaurus_assoc.json',)
+VERB_POS = ('VERB', 'AUX')
+DEFAULT_SAVE_INTERVAL = 30.0
+_WORD_RE = re.compile(r'[A-Za-z]+')
+
+
+def _collect_words(obj, words: set) -> None:
+    if isinstance(obj, str):
+        words.update(w.lower() for w in _WORD_RE.findall(obj))
+    elif isinstance(obj, dict):
+        for k, v in obj.items():
+            _collect_words(k, words)
+            _collect_words(v, words)
+    elif isinstance(obj, list):
+        for v in obj:
+            _collect_words(v, words)
+
+
+def knowledge_vocabulary(data_dir: str = DATA_DIR, root: str = ROOT) -> List[str]:
+    """Sorted lowercase words appearing anywhere (keys or values) in the knowledge files."""
+    words = set()
+    for content in store.files(data_dir).values():
+        _collect_words(content, words)
+    for fname in VOCABULARY_SOURCES:
+        path = os.path.join(root, fname)
+        if os.path.exists(path):
+            _collect_words(store.load_json(path), words)
+    return sorted(words)
+
+
+class POSLexicon:
+    """Persistent word -> coarse POS table with batched tagging of misses.
+
+    New tags are merged under a lock. With `autosave` the table is written at
+    most once per `save_interval` seconds (and by `flush()`), each time to a
+    fresh temporary file that replaces the lexicon atomically.
+    """
+
+    def __init__(self, path: str = LEXICON_PATH, autosave: bool = True, save_interval: float = DEFAULT_SAVE_INTERVAL):
+        self.path = path
+        self.autosave = autosave
+        self.save_interval = save_interval
+        self._tags: Optional[Dict[str, str]] = None
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._last_save = 0.0
+        self.stats = {'hits': 0, 'misses': 0, 'tagged': 0, 'saves': 0}
+
+    def _load(self) -> Dict[str, str]:
+        if self._tags is None:
+            with self._lock:
+                if self._tags is None:
+                    tags = {}
+                    try:
+                        with open(self.path, 'r', encoding='utf-8') as f:
+                            doc = json.load(f)
+                        if isinstance(doc, dict) and doc.get('format') == LEXICON_FORMAT and isinstance(doc.get('tags'), dict):
+                            tags = doc['tags']
+                    except (OSError, ValueError):
+                        pass
+                    self._tags = tags
+        return self._tags
+
+    def save(self) -> None:
+        tags = self._load()
+        # one writer at a time, so an older snapshot never replaces a newer one
+        with self._save_lock:
+            with self._lock:
+                doc = {'format': LEXICON_FORMAT, 'model': MODEL, 'tags': dict(sorted(tags.items()))}
+                self._dirty = False
+            self._last_save = time.monotonic()
+            f = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(os.path.abspath(self.path)),
+                                            prefix=os.path.basename(self.path) + '.', suffix='.tmp', delete=False)
+            try:
+                with f:
+                    json.dump(doc, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(f.name, self.path)
+            except BaseException:
+                with self._lock:
+                    self._dirty = True
+                try:
+                    os.unlink(f.name)
+                except OSError:
+                    pass
+                raise
+            self.stats['saves'] += 1
+
+    def flush(self) -> None:
+        """Write the table if tags were added since the last save."""
+        if self._dirty:
+            try:
+                self.save()
+            except Exception:
+                pass
+
+    def __len__(self):
+        return len(self._load())
+
+    def __contains__(self, word):
+        return word.lower() in self._load()
+
+    def lookup(self, word: str) -> Optional[str]:
+        """Tag of `word` if it is in the table (never runs the tagger)."""
+        return self._load().get(word.lower())
+
+    def tag_many(self, words: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Tags for `words` (lowercased); unknown ones are tagged in one spaCy batch.
+
+        Words spaCy cannot tag (no model installed) map to None and are not stored.
+        """
+        words = {w.lower() for w in words if w}
+        tags = self._load()
+        missing = sorted(w for w in words if w not in tags)
+        with self._lock:
+            self.stats['hits'] += len(words) - len(missing)
+            self.stats['misses'] += len(missing)
+        if missing:
+            # tag outside the lock, then merge in one step
+            new = {w: analysis[0][1] for w, analysis in zip(missing, nlp_service.analyze_many(missing, batch_size=1000)) if analysis}
+            if new:
+                with self._lock:
+                    tags.update(new)
+                    self._dirty = True
+                    self.stats['tagged'] += len(new)
+                if self.autosave and time.monotonic() - self._last_save >= self.save_interval:
+                    self.flush()
+        with self._lock:
+            return {w: tags.get(w) for w in words}
+
+    def tag(self, word: str) -> Optional[str]:
+        return self.tag_many([word]).get(word.lower())
+
+    def is_noun(self, word: str) -> bool:
+        return self.tag(word) in NOUN_POS
+
+    def is_verb(self, word: str) -> bool:
+        return self.tag(word) in VERB_POS
+
+    def build(self, words: Iterable[str]) -> int:
+        """Tag every word not yet in the table and save. Returns the number added."""
+        if not nlp_service.available():
+            raise RuntimeError(f'spaCy model {MODEL!r} is not available')
+        before = len(self)
+        autosave, self.autosave = self.autosave, False
+        try:
+            self.tag_many(words)
+        finally:
+            self.autosave = autosave
+        self.save()
+        return len(self) - before
+
+
+pos_lexicon = POSLexicon()
+# tags added since the last autosave are written on exit
+atexit.register(pos_lexicon.flush)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Build the word -> POS lexicon from the knowledge base vocabulary')
+    parser.add_argument('command', choices=['build'])
+    parser.add_argument('--data-dir', default=DATA_DIR, help='knowledge JSON directory')
+    parser.add_argument('--path', default=LEXICON_PATH, help='lexicon file to write')
+    args = parser.parse_args(argv)
+
+    words = knowledge_vocabulary(args.data_dir)
+    try:
+        added = POSLexicon(args.path).build(words)
+    except RuntimeError as e:
+        print(f'Cannot build lexicon: {e}')
+        return 1
+    print(f'{len(words)} words in vocabulary, {added} newly tagged -> {args.path}')
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main(sys.argv[1:]))
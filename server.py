@@ -0,0 +1,297 @@
+"""ASGI server for the responders.
+
+    python server.py --port 8000 --workers 4
+    uvicorn server:app
+
+Endpoints (JSON bodies):
+
+    POST /respond      {"prompt", "session_id"?}             respond_subject_specific
+    POST /evidence     {"prompt", "session_id"?, "verbose"?}  respond_with_evidence
+    POST /compare      {"prompt", "session_id"?, "predicate"?} detailed_comparison
+    POST /pipeline     {"prompt", "settings"?}                taxonomic_grammar.pipeline_response
+    POST /code         {"prompt"}                             NaturalCodeEngine.generate_code
+    DELETE /sessions/{session_id}
+    GET /health
+
+The responders are CPU-bound and synchronous, so the event loop hands them to a
+bounded thread pool. Threads rather than processes: the knowledge snapshot,
+the definitions and the per-user `Session` objects are loaded once and shared
+by every request in the process. Requests that pass a `session_id` continue
+that conversation (one is created and returned when it is missing).
+
+- backpressure: at most `max_pending` calls may be queued or running; beyond
+  that requests get 503 with a Retry-After header instead of piling up;
+- timeouts: a call that takes longer than `timeout` seconds answers 504. The
+  worker thread cannot be interrupted, so its slot stays taken until it
+  finishes, and backpressure keeps accounting for it.
+"""
+import asyncio
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI, HTTPException
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from knowledge_store import DATA_DIR
+from session import SessionStore
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 32
+DEFAULT_TIMEOUT = 30.0
+RETRY_AFTER = '1'
+
+
+class PromptRequest(BaseModel):
+    prompt: str
+    session_id: Optional[str] = None
+
+
+class EvidenceRequest(PromptRequest):
+    verbose: bool = False
+
+
+class CompareRequest(PromptRequest):
+    predicate: Optional[str] = None
+
+
+class PipelineRequest(BaseModel):
+    prompt: str
+    settings: Optional[Dict[str, Any]] = None
+
+
+class CodeRequest(BaseModel):
+    prompt: str
+
+
+class Overloaded(Exception):
+    pass
+
+
+class WorkerPool:
+    """Thread pool with a bound on queued + running calls and a per-call timeout."""
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_pending: int = DEFAULT_MAX_PENDING, timeout: float = DEFAULT_TIMEOUT):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='responder')
+        self._pending = 0
+        self._futures = set()
+        self._lock = threading.Lock()
+        self.stats = {'completed': 0, 'rejected': 0, 'timeouts': 0, 'errors': 0}
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _release(self, future) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._futures.discard(future)
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """Run `fn` in the pool. Raises Overloaded when full, asyncio.TimeoutError on timeout."""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.stats['rejected'] += 1
+                raise Overloaded()
+            self._pending += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release(None)
+            raise
+        with self._lock:
+            self._futures.add(future)
+        # the slot is freed when the call really ends, not when the request gives up on it
+        future.add_done_callback(self._release)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.stats['timeouts'] += 1
+            raise
+        except Exception:
+            self.stats['errors'] += 1
+            raise
+        self.stats['completed'] += 1
+        return result
+
+    def shutdown(self) -> None:
+        # cancel queued calls by hand; shutdown(cancel_futures=) needs Python 3.9
+        with self._lock:
+            queued = list(self._futures)
+        for future in queued:
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+
+class Engine:
+    """Knowledge, definitions and code engine shared by all requests."""
+
+    def __init__(self, data_dir: str = DATA_DIR, snapshot_path: Optional[str] = None):
+        # relative paths are taken from the repository, not the server's working directory
+        self.data_dir = os.path.join(ROOT, data_dir)
+        self.snapshot_path = snapshot_path
+        self.defs = None
+        self._code_engine = None
+        # generate_code reloads helper modules into sys.modules; keep it to one caller at a time
+        self._code_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def preload(self) -> None:
+        """Install the knowledge snapshot and load the definitions (once).
+
+        Raises FileNotFoundError when the data directory is missing and
+        RuntimeError when it holds no definitions, so a misconfigured server
+        fails at startup instead of answering from an empty knowledge base.
+        """
+        with self._load_lock:
+            if self.defs is not None:
+                return
+            if not os.path.isdir(self.data_dir):
+                raise FileNotFoundError(f'data directory not found: {self.data_dir}')
+            from knowledge_snapshot import SNAPSHOT_PATH, install_snapshot
+            install_snapshot(self.snapshot_path or SNAPSHOT_PATH)
+            from eng1neer import load_all_definitions
+            defs = load_all_definitions(self.data_dir)
+            if not defs:
+                raise RuntimeError(f'no definitions found in {self.data_dir}')
+            self.defs = defs
+
+    def code_engine(self):
+        if self._code_engine is None:
+            from new_natural_code_engine import NaturalCodeEngine
+            self._code_engine = NaturalCodeEngine(self.data_dir)
+        return self._code_engine
+
+    def generate_code(self, prompt: str) -> str:
+        with self._code_lock:
+            return self.code_engine().generate_code(prompt)
+
+
+def create_app(workers: int = DEFAULT_WORKERS, max_pending: int = DEFAULT_MAX_PENDING, timeout: float = DEFAULT_TIMEOUT,
+               data_dir: str = DATA_DIR, snapshot_path: Optional[str] = None, preload: bool = True) -> FastAPI:
+    """Build the ASGI app. With `preload` the knowledge is loaded at startup rather than on the first request."""
+    engine = Engine(data_dir, snapshot_path)
+    sessions = SessionStore()
+    state = {}
+
+    @asynccontextmanager
+    async def lifespan(app):
+        state['pool'] = WorkerPool(workers, max_pending, timeout)
+        try:
+            if preload:
+                # a load failure aborts startup rather than serving an empty knowledge base
+                await asyncio.get_running_loop().run_in_executor(None, engine.preload)
+            yield
+        finally:
+            state.pop('pool').shutdown()
+
+    app = FastAPI(title='Responder server', lifespan=lifespan)
+    app.state.engine = engine
+    app.state.sessions = sessions
+
+    async def call(fn: Callable, *args, **kwargs):
+        try:
+            result = await state['pool'].run(fn, *args, **kwargs)
+        except Overloaded:
+            raise HTTPException(status_code=503, detail='server busy, retry later', headers={'Retry-After': RETRY_AFTER})
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail=f'timed out after {timeout:g}s')
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f'{type(e).__name__}: {e}')
+        return jsonable_encoder(result)
+
+    def with_defs(fn: Callable) -> Callable:
+        # loads lazily when the app was built without preload
+        def run(*args, **kwargs):
+            engine.preload()
+            return fn(engine.defs, *args, **kwargs)
+        return run
+
+    @app.get('/health')
+    async def health():
+        pool = state.get('pool')
+        return {
+            'status': 'ok',
+            'loaded': engine.defs is not None,
+            'definitions': len(engine.defs or ()),
+            'data_dir': engine.data_dir,
+            'workers': workers,
+            'pending': pool.pending if pool else 0,
+            'max_pending': max_pending,
+            'sessions': len(sessions),
+            'stats': dict(pool.stats) if pool else {},
+        }
+
+    @app.post('/respond')
+    async def respond(req: PromptRequest):
+        from eng1neer import respond_subject_specific
+        session = sessions.get(req.session_id)
+        assoc_path = os.path.join(ROOT, 'thesaurus_assoc.json')
+        answer = await call(respond_subject_specific, req.prompt, assoc_path, engine.data_dir, session=session)
+        return {'session_id': session.id, 'answer': answer}
+
+    @app.post('/evidence')
+    async def evidence(req: EvidenceRequest):
+        from eng1neer import respond_with_evidence
+        session = sessions.get(req.session_id)
+        result = await call(with_defs(respond_with_evidence), req.prompt, req.verbose, session=session)
+        if req.verbose:
+            return {'session_id': session.id, 'response': result, 'evidence': None}
+        return {'session_id': session.id, 'response': result.get('response'), 'evidence': result.get('evidence')}
+
+    @app.post('/compare')
+    async def compare(req: CompareRequest):
+        from eng1neer import detailed_comparison
+        session = sessions.get(req.session_id)
+        result = await call(with_defs(detailed_comparison), req.prompt, req.predicate, session=session)
+        return {'session_id': session.id, 'comparison': result}
+
+    @app.post('/pipeline')
+    async def pipeline(req: PipelineRequest):
+        from taxonomic_grammar import pipeline_response
+        return await call(pipeline_response, req.prompt, engine.data_dir, req.settings)
+
+    @app.post('/code')
+    async def code(req: CodeRequest):
+        return {'code': await call(engine.generate_code, req.prompt)}
+
+    @app.delete('/sessions/{session_id}')
+    async def end_session(session_id: str):
+        if not sessions.drop(session_id):
+            raise HTTPException(status_code=404, detail='unknown session')
+        return {'session_id': session_id, 'ended': True}
+
+    return app
+
+
+app = create_app()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description='Serve the responders over HTTP')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('-w', '--workers', type=int, default=DEFAULT_WORKERS, help='responder threads')
+    parser.add_argument('--max-pending', type=int, default=DEFAULT_MAX_PENDING, help='queued + running calls before 503')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT, help='seconds per call before 504')
+    parser.add_argument('--data-dir', default=DATA_DIR)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+    uvicorn.run(create_app(args.workers, args.max_pending, args.timeout, args.data_dir), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main(sys.argv[1:]))
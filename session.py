@@ -0,0 +1,130 @@
+"""Per-user conversational state for the responders.
+
+The responders used to keep the conversation on function attributes
+(`respond_subject_specific._last_answer`, `_last_subject`, `_pending_patch`,
+`respond._context`) and in the module global `_last_evidence`, so every caller
+in the process shared one conversation and threads raced on it. A `Session`
+carries that state instead; pass one as `session=` to `respond`,
+`respond_subject_specific`, `respond_with_evidence`, `detailed_comparison` or
+`evidence_turn`. Callers that pass nothing share `default_session`, which
+keeps the single-user behaviour.
+
+Each session has a re-entrant lock held for the duration of a turn, so
+concurrent messages of one user are answered one at a time while different
+sessions run in parallel. `SessionStore` maps session ids to sessions for
+servers and drops idle ones.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+MAX_CONTEXT = 10
+DEFAULT_MAX_SESSIONS = 10000
+DEFAULT_MAX_IDLE = 3600.0
+
+
+class Session:
+    """Conversation state of one user."""
+
+    def __init__(self, session_id: Optional[str] = None):
+        self.id = session_id or uuid.uuid4().hex
+        self.last_answer = ''
+        self.last_subject = None
+        self.pending_patch = None
+        self.context = []          # recent raw prompts, for pronoun resolution
+        self.last_evidence = None  # evidence left by the last respond() turn
+        self.lock = threading.RLock()
+        self.last_used = time.monotonic()
+        self._changes = None
+
+    def update(self, **state: Any) -> None:
+        """Set state attributes (recorded while inside `recording()`)."""
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self._changes is not None:
+            self._changes.update(state)
+
+    @contextmanager
+    def recording(self) -> Iterator[Dict[str, Any]]:
+        """Collect the attributes assigned through `update()` in the block."""
+        outer, self._changes = self._changes, {}
+        try:
+            yield self._changes
+        finally:
+            changes, self._changes = self._changes, outer
+            if outer is not None:
+                outer.update(changes)
+
+    def remember_prompt(self, raw: str) -> None:
+        self.context.append(raw)
+        if len(self.context) > MAX_CONTEXT:
+            self.context.pop(0)
+
+    def touch(self) -> None:
+        self.last_used = time.monotonic()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.last_answer = ''
+            self.last_subject = None
+            self.pending_patch = None
+            self.context = []
+            self.last_evidence = None
+
+
+default_session = Session('default')
+
+
+def resolve(session: Optional[Session]) -> Session:
+    """`session`, or the process-wide default session when None."""
+    return default_session if session is None else session
+
+
+class SessionStore:
+    """Sessions by id, least recently used first, with idle expiry."""
+
+    def __init__(self, max_sessions: int = DEFAULT_MAX_SESSIONS, max_idle: float = DEFAULT_MAX_IDLE):
+        self.max_sessions = max_sessions
+        self.max_idle = max_idle
+        self._sessions: 'OrderedDict[str, Session]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: Optional[str] = None) -> Session:
+        """The session for `session_id`, created if unknown (a new id when None)."""
+        with self._lock:
+            self._expire()
+            session = self._sessions.get(session_id) if session_id else None
+            if session is None:
+                session = Session(session_id)
+                self._sessions[session.id] = session
+                while len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session.id)
+            session.touch()
+            return session
+
+    def drop(self, session_id: str) -> bool:
+        with self._lock:
+            return self._sessions.pop(session_id, None) is not None
+
+    def _expire(self) -> None:
+        if not self.max_idle:
+            return
+        cutoff = time.monotonic() - self.max_idle
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            if oldest.last_used >= cutoff:
+                break
+            self._sessions.popitem(last=False)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sessions)
+
+    def __contains__(self, session_id):
+        with self._lock:
+            return session_id in self._sessions
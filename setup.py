@@ -19,6 +19,7 @@ setup(
             'patch-kingdom-json = scripts.patch_kingdom_json:main',
             'pending-patches = scripts.pending_patches_cli:main',
             'kingdom-editor = scripts.kingdom_editor:main',
+            'responder-server = server:main',
         ],
     },
     include_package_data=True,
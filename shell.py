@@ -4,11 +4,15 @@
 from eng1neer import respond_subject_specific
 
 if __name__ == "__main__":
-    # Only load the thesaurus association file at startup
-    import json
+    # Only load the thesaurus association file at startup (from the snapshot when fresh)
+    from knowledge_snapshot import install_snapshot
+    from knowledge_store import store
+    install_snapshot()
+    # start the sympy worker used for equation lines while the shell loads
+    from equation_solver import solver as equation_solver, format_solutions
+    equation_solver.prewarm()
     assoc_path = 'thesaurus_assoc.json'
-    with open(assoc_path, 'r', encoding='utf-8') as f:
-        thesaurus_assoc = json.load(f)
+    thesaurus_assoc = store.load_json(assoc_path)
     import re
 
     # lightweight terminal spinner to show progress during code generation
@@ -536,35 +540,11 @@ if __name__ == "__main__":
             continue
         # If the prompt looks like an algebraic equation, solve for variables
         elif '=' in line:
-            try:
-                from sympy import symbols, Eq, solve, sympify
-                # Split on '=' and build equations
-                eqs = [eq.strip() for eq in line.split(',') if '=' in eq]
-                if len(eqs) > 10:
-                    print("... (truncated to 10 equations)")
-                    eqs = eqs[:10]
-                sympy_eqs = []
-                all_vars = set()
-                for eq in eqs:
-                    left, right = eq.split('=', 1)
-                    left_expr = sympify(left)
-                    right_expr = sympify(right)
-                    sympy_eqs.append(Eq(left_expr, right_expr))
-                    all_vars.update(left_expr.free_symbols)
-                    all_vars.update(right_expr.free_symbols)
-                if not sympy_eqs:
-                    raise ValueError
-                sol = solve(sympy_eqs, list(all_vars), dict=True)
-                if sol:
-                    for s in sol:
-                        out = ', '.join(f"{str(k)} = {v}" for k, v in s.items())
-                        if len(s) > 10:
-                            out = ', '.join(list(out.split(', ')[:10])) + ', ...'
-                        print(out)
-                else:
-                    print("No solution found.")
-            except Exception as e:
-                print(f"Could not solve equation(s): {e}")
+            result = equation_solver.solve(line)
+            if result['truncated']:
+                print("... (truncated to 10 equations)")
+            for out in format_solutions(result):
+                print(out)
         # If the prompt looks like a math expression, evaluate it
         elif any(c in line for c in '+-*/^()') and any(ch.isdigit() for ch in line):
             from eng1neer import try_eval_expression
@@ -1,9 +1,12 @@
 import os
 import re
 import json
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict
 import math
-import ast
+
+from knowledge_store import store
+from exec_cache import exec_cache
 
 STOPWORDS = {
     'the','and','or','is','a','an','of','in','on','for','to','with','by','as','at','from','that','which','who','whom','where','when','why','how','be','been','are','was','were','it','its','this','these','those','but','if','then','so'
@@ -36,58 +39,131 @@ def extract_keywords(fragment, top_n=6):
     return [w for w,_ in counts.most_common(top_n)]
 
 def load_data(data_dir='data'):
-    data_map = {}
-    for fname in os.listdir(data_dir):
-        if not fname.endswith('.json'):
-            continue
-        path = os.path.join(data_dir, fname)
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data_map[fname] = json.load(f)
-        except Exception:
-            data_map[fname] = {}
-    return data_map
+    # parsed once per process and shared via the knowledge store
+    files = store.files(data_dir)
+    # only the profile _parse_exec_callable evaluates with
+    exec_cache.precompile_data(data_dir, 'lambda')
+    return files
+
+class KeywordIndex:
+    """Trigram index over the normalized keys, synonyms and glosses of a data map.
+
+    `find_matches` tests `normalize(keyword) in normalize(field)` for every field;
+    here every field is normalized once and a keyword only has to be checked
+    against the fields that contain all of its trigrams.
+    """
 
-def find_matches(keywords, data_map):
-    matches = []
-    for kw in keywords:
-        nk = normalize(kw)
-        for fname, data in data_map.items():
-            # support files that load as dicts or as lists
+    def __init__(self, data_map):
+        # keep the parsed files alive so the id()-based cache key stays unique
+        self.sources = list(data_map.items())
+        self.entries = []   # entry number -> (fname, entry_key)
+        self.fields = []    # field id -> (entry number, slot, kind, matched object)
+        self.texts = []     # field id -> normalized text
+        self.grams = {}     # trigram -> set of field ids
+        for fname, data in self.sources:
             if isinstance(data, dict):
                 iterator = data.items()
             elif isinstance(data, list):
                 iterator = ((str(i), v) for i, v in enumerate(data))
             else:
-                # unsupported structure
                 continue
             for entry_key, entry_val in iterator:
-                ne = normalize(entry_key)
-                # match against entry key
-                if nk and nk in ne:
-                    matches.append((kw, fname, entry_key, entry_val, 'key'))
-                    continue
-                # match against synonyms and gloss
+                n = len(self.entries)
+                self.entries.append((fname, entry_key))
+                self._add(normalize(entry_key), n, -1, 'key', entry_val)
                 if isinstance(entry_val, list):
-                    for obj in entry_val:
+                    for i, obj in enumerate(entry_val):
                         if isinstance(obj, dict):
-                            syns = obj.get('synonyms', [])
-                            gloss = obj.get('gloss', '')
-                            for s in syns:
-                                if nk and nk in normalize(s):
-                                    matches.append((kw, fname, entry_key, obj, 'synonym'))
-                                    break
-                            if nk and nk in normalize(gloss):
-                                matches.append((kw, fname, entry_key, obj, 'gloss'))
+                            self._add_subfields(obj, n, 2 * i)
                 elif isinstance(entry_val, dict):
-                    syns = entry_val.get('synonyms', [])
-                    gloss = entry_val.get('gloss', '')
-                    for s in syns:
-                        if nk and nk in normalize(s):
-                            matches.append((kw, fname, entry_key, entry_val, 'synonym'))
-                            break
-                    if nk and nk in normalize(gloss):
-                        matches.append((kw, fname, entry_key, entry_val, 'gloss'))
+                    self._add_subfields(entry_val, n, 0)
+
+    def _add_subfields(self, obj, n, slot):
+        for s in obj.get('synonyms', []):
+            if isinstance(s, str):
+                self._add(normalize(s), n, slot, 'synonym', obj)
+        gloss = obj.get('gloss', '')
+        if isinstance(gloss, str):
+            self._add(normalize(gloss), n, slot + 1, 'gloss', obj)
+
+    def _add(self, text, n, slot, kind, obj):
+        if not text:
+            return
+        fid = len(self.texts)
+        self.texts.append(text)
+        self.fields.append((n, slot, kind, obj))
+        for i in range(len(text) - 2):
+            self.grams.setdefault(text[i:i + 3], set()).add(fid)
+
+    def _field_hits(self, nk):
+        if len(nk) < 3:
+            return [fid for fid, text in enumerate(self.texts) if nk in text]
+        postings = sorted((self.grams.get(nk[i:i + 3], ()) for i in range(len(nk) - 2)), key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for p in postings[1:]:
+            candidates &= p
+            if not candidates:
+                return []
+        return [fid for fid in candidates if nk in self.texts[fid]]
+
+    def matches(self, kw):
+        """Matches for one keyword, in the same order the full scan produces them."""
+        nk = normalize(kw)
+        if not nk:
+            return []
+        hits = {}
+        for fid in self._field_hits(nk):
+            n, slot, kind, obj = self.fields[fid]
+            hits.setdefault(n, {})[slot] = (kind, obj)
+        out = []
+        for n in sorted(hits):
+            fname, entry_key = self.entries[n]
+            slots = hits[n]
+            if -1 in slots:
+                # a key match skips the entry's synonyms and gloss
+                out.append((kw, fname, entry_key, slots[-1][1], 'key'))
+                continue
+            for slot in sorted(slots):
+                kind, obj = slots[slot]
+                out.append((kw, fname, entry_key, obj, kind))
+        return out
+
+
+KEYWORD_INDEX_CACHE_SIZE = 4
+# (file name, id(parsed data)) per file -> (index, the data objects); holding
+# the objects keeps their ids from being reused while the entry is cached
+_keyword_index_cache = OrderedDict()
+_keyword_index_lock = threading.Lock()
+
+
+def keyword_index(data_map):
+    """`KeywordIndex` for `data_map`, reused while its files are the same parsed objects.
+
+    Indexes are keyed by object identity, so the maps and the parsed files in
+    them must be treated as immutable: edit a copy (or reload the file), never
+    the objects in place. The last few maps are kept, so callers alternating
+    between directories or subsets do not rebuild on every call.
+    """
+    key = tuple((fname, id(data)) for fname, data in data_map.items())
+    with _keyword_index_lock:
+        cached = _keyword_index_cache.get(key)
+        if cached is not None:
+            _keyword_index_cache.move_to_end(key)
+            return cached[0]
+    index = KeywordIndex(data_map)
+    with _keyword_index_lock:
+        _keyword_index_cache[key] = (index, tuple(data_map.values()))
+        while len(_keyword_index_cache) > KEYWORD_INDEX_CACHE_SIZE:
+            _keyword_index_cache.popitem(last=False)
+    return index
+
+def find_matches(keywords, data_map):
+    index = keyword_index(data_map)
+    matches = []
+    for kw in keywords:
+        matches.extend(index.matches(kw))
     return matches
 
 def classify_family(gloss_or_entry):
@@ -873,17 +949,119 @@ def _parse_exec_callable(exec_str):
 
     Accepts simple lambda strings like "lambda a, b: a + b" and returns a Python callable.
     We restrict globals to provide only the math module to limit side effects.
+    Callables are compiled once per source text and shared through `exec_cache`.
     """
     if not exec_str or not isinstance(exec_str, str):
         return None
+    return exec_cache.get(exec_str, 'lambda')
+
+
+def _bind_args(argnames, variables):
+    """Positional arguments for an exec lambda: (args, name of the first missing variable or None).
+
+    `math` binds the math module; other names match `variables` exactly, then case-insensitively.
+    """
+    args = []
+    for name in argnames:
+        if name == 'math':
+            args.append(math)
+        elif name in variables:
+            args.append(variables[name])
+        else:
+            for k, v in variables.items():
+                if k.lower() == name.lower():
+                    args.append(v)
+                    break
+            else:
+                return args, name
+    return args, None
+
+
+def _evaluate_points(func, args, xi, xs):
+    """`func(*args)` with argument `xi` replaced by each of `xs`; None where the call fails.
+
+    Tries a single call with a NumPy array first. That is accepted only when it
+    yields one finite number per point (plain arithmetic lambdas do; anything
+    using `math.*`, branches or int() raises and falls back). Points that come
+    back non-finite are recomputed one by one so errors still give None.
+    """
+    n = len(xs)
+    ys = None
     try:
-        node = ast.parse(exec_str, mode='eval')
-        if not isinstance(node.body, ast.Lambda):
-            return None
-        func = eval(exec_str, {'math': math}, {})
-        return func
+        import numpy as np
+        vargs = list(args)
+        vargs[xi] = np.asarray(xs, dtype=float)
+        with np.errstate(all='ignore'):
+            arr = func(*vargs)
+        if isinstance(arr, np.ndarray) and arr.shape == (n,) and arr.dtype.kind in 'fc':
+            ys = arr.tolist()
+            bad = np.flatnonzero(~np.isfinite(arr)).tolist()
+        else:
+            ys = None
     except Exception:
-        return None
+        ys = None
+    if ys is None:
+        ys = [None] * n
+        bad = range(n)
+    call_args = list(args)
+    for i in bad:
+        call_args[xi] = xs[i]
+        try:
+            ys[i] = func(*call_args)
+        except Exception:
+            ys[i] = None
+    return ys
+
+
+def _refine_intervals(xs, ys, tolerance, min_width):
+    """Midpoints of the intervals (wider than `min_width`) where the curve jumps or breaks."""
+    finite = [y for y in ys if isinstance(y, (int, float)) and math.isfinite(y)]
+    span = (max(finite) - min(finite)) if finite else 0.0
+    limit = tolerance * (span or 1.0)
+    mids = []
+    for i in range(len(xs) - 1):
+        if xs[i + 1] - xs[i] <= min_width:
+            continue
+        y0, y1 = ys[i], ys[i + 1]
+        ok0 = isinstance(y0, (int, float)) and math.isfinite(y0)
+        ok1 = isinstance(y1, (int, float)) and math.isfinite(y1)
+        if ok0 != ok1 or (ok0 and abs(y1 - y0) > limit):
+            mids.append((xs[i] + xs[i + 1]) / 2.0)
+    return mids
+
+
+def sample_graph(func, args, xi, graph_spec, points=50):
+    """Sample `func` over `graph_spec['from']`..`graph_spec['to']` for argument position `xi`.
+
+    Returns [{'x', 'y'}, ...] in x order. By default `points` evenly spaced
+    samples; with `graph_spec['adaptive']` the grid is then refined where
+    neighbouring samples differ by more than `tolerance` (default 0.01) of the
+    y range, up to `max_points` samples (default 2000), each refinement round
+    evaluated in one batch.
+    """
+    start = graph_spec.get('from', 0)
+    end = graph_spec.get('to', 1)
+    pts = max(1, int(points))
+    if pts == 1:
+        xs = [start]
+    else:
+        xs = [start + (end - start) * (i / (pts - 1)) for i in range(pts)]
+    ys = _evaluate_points(func, args, xi, xs)
+
+    if graph_spec.get('adaptive') and len(xs) > 1:
+        max_points = int(graph_spec.get('max_points', 2000))
+        tolerance = float(graph_spec.get('tolerance', 0.01))
+        min_width = abs(end - start) * 1e-9
+        while len(xs) < max_points:
+            mids = _refine_intervals(xs, ys, tolerance, min_width)[:max_points - len(xs)]
+            if not mids:
+                break
+            mid_ys = _evaluate_points(func, args, xi, mids)
+            merged = sorted(zip(xs + mids, ys + mid_ys), key=lambda p: p[0])
+            xs = [p[0] for p in merged]
+            ys = [p[1] for p in merged]
+
+    return [{'x': x, 'y': y} for x, y in zip(xs, ys)]
 
 
 def evaluate_taxon_with_values(taxon, variables: dict, graph_spec: dict = None, points: int = 50):
@@ -918,22 +1096,10 @@ def evaluate_taxon_with_values(taxon, variables: dict, graph_spec: dict = None,
     except Exception:
         argnames = []
 
-    args = []
-    for name in argnames:
-        if name == 'math':
-            args.append(math)
-        elif name in variables:
-            args.append(variables[name])
-        else:
-            found = False
-            for k, v in variables.items():
-                if k.lower() == name.lower():
-                    args.append(v)
-                    found = True
-                    break
-            if not found:
-                result['detail'] = f"Missing variable: {name}"
-                return result
+    args, missing = _bind_args(argnames, variables)
+    if missing:
+        result['detail'] = f"Missing variable: {missing}"
+        return result
     try:
         val = func(*args)
         result['value'] = val
@@ -944,16 +1110,6 @@ def evaluate_taxon_with_values(taxon, variables: dict, graph_spec: dict = None,
     if graph_spec and isinstance(graph_spec, dict):
         xname = graph_spec.get('x')
         if xname and xname in argnames:
-            start = graph_spec.get('from', 0)
-            end = graph_spec.get('to', 1)
-            pts = points
-            xs = [start + (end - start) * (i / (pts - 1)) for i in range(pts)]
-            points_list = []
-            for x in xs:
-                vars_copy = dict(variables)
-                vars_copy[xname] = x
-                ev = evaluate_taxon_with_values(taxon, vars_copy, graph_spec=None, points=points)
-                points_list.append({'x': x, 'y': ev.get('value')})
-            result['graph'] = points_list
+            result['graph'] = sample_graph(func, args, argnames.index(xname), graph_spec, points)
 
     return result
@@ -0,0 +1,62 @@
+import json
+import os
+
+import eng1neer
+from session import Session
+
+
+def _ask(prompt, data_dir, assoc, session):
+    return eng1neer.respond_subject_specific(prompt, assoc_path=str(assoc), data_dir=str(data_dir), session=session)
+
+
+def test_cached_answers_match_fresh_ones_and_follow_data_changes(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    glossary = data_dir / 'gadgets.json'
+    glossary.write_text(json.dumps({'widget': {'gloss': 'a small mechanical device'}}), encoding='utf-8')
+    assoc = tmp_path / 'assoc.json'
+    assoc.write_text('{}', encoding='utf-8')
+    cache_path = str(tmp_path / 'answers.json')
+
+    cache = eng1neer.enable_answer_cache(cache_path, max_entries=2)
+    try:
+        fresh = _ask('what is widget', data_dir, assoc, Session())
+        assert "world of gadgets, 'widget'" in fresh
+        assert cache.stats['stores'] == 1
+
+        # a new process (new cache object) replays the answer and the conversation state
+        cache = eng1neer.enable_answer_cache(cache_path, max_entries=2)
+        session = Session()
+        assert _ask('  what   is widget ', data_dir, assoc, session) == fresh
+        assert cache.stats['hits'] == 1
+        assert session.last_answer == fresh and session.last_subject == 'is'
+
+        # deterministic mode: recomputing gives the same text as the cached copy
+        cache.clear()
+        assert _ask('what is widget', data_dir, assoc, Session()) == fresh
+
+        glossary.write_text(json.dumps({'widget': {'gloss': 'a small mechanical device', 'synonyms': ['gizmo']}}), encoding='utf-8')
+        os.utime(glossary, ns=(2_000_000_000, 2_000_000_000))
+        assert 'sometimes called gizmo' in _ask('what is widget', data_dir, assoc, Session())
+        assert cache.stats['purged'] == 1
+    finally:
+        eng1neer.disable_answer_cache()
+
+
+def test_saves_are_debounced_and_merge_other_writers(tmp_path):
+    from answer_cache import AnswerCache
+
+    path = str(tmp_path / 'answers.json')
+    a = AnswerCache(path, max_entries=3, save_interval=3600)
+    b = AnswerCache(path, max_entries=3, save_interval=3600)
+    a.put('k1', 'v1', {'answer': 'one'})
+    a.put('k2', 'v1', {'answer': 'two'})
+    assert a.stats['saves'] == 1  # the first store saves, the next waits for the interval
+    b.put('k3', 'v1', {'answer': 'three'})
+    a.flush()
+    b.flush()
+
+    # neither writer dropped the other's answers, and no temporary files are left
+    fresh = AnswerCache(path, max_entries=3)
+    assert [fresh.get(k, 'v1')['answer'] for k in ('k1', 'k2', 'k3')] == ['one', 'two', 'three']
+    assert [p.name for p in tmp_path.iterdir()] == ['answers.json']
@@ -0,0 +1,41 @@
+import equality_verifier as ev
+
+DATA = {
+    'a.json': {
+        'acid': [{'gloss': 'a proton donor', 'synonyms': ['acidic compound']}, {'gloss': 'sour substance'}],
+        'base': {'gloss': 'a proton acceptor', 'synonyms': ['alkali']},
+        'world war i': {'gloss': 'global war', 'start_year': 1914, 'end_year': 1918},
+    },
+    'b.json': [{'ignored': 'list-shaped files are skipped'}],
+}
+
+
+def test_find_entries_key_synonym_and_gloss_hits():
+    assert ev.find_entries('acid', DATA) == [('a.json', 'acid', DATA['a.json']['acid'])]
+    # gloss token hit on the second sub-object returns that object
+    assert ev.find_entries('sour', DATA) == [('a.json', 'acid', DATA['a.json']['acid'][1])]
+    assert [k for _, k, _ in ev.find_entries('proton', DATA)] == ['acid', 'base']
+    assert ev.find_entries('alkal', DATA)[0][2] is DATA['a.json']['base']
+    assert ev.find_entries('zzz', DATA) == []
+
+
+def test_entry_index_memoizes_keywords_and_ranges():
+    idx = ev.entry_index(DATA)
+    assert idx is ev.entry_index(dict(DATA))
+    war = DATA['a.json']['world war i']
+    assert idx.year_ranges(war) == [(1914, 1918)]
+    assert idx.keywords(war) is idx.keywords(war)
+    # a second map does not evict the first
+    part = ev.entry_index({'a.json': DATA['a.json']})
+    assert part is not idx and ev.entry_index(DATA) is idx
+
+
+def test_relations_for_pairs_matches_scalar(tmp_path):
+    import json
+    for fname, data in DATA.items():
+        (tmp_path / fname).write_text(json.dumps(data), encoding='utf-8')
+    terms = ['acid', 'base', 'proton', 'alkali', 'sour', 'world war i', '1914-1918', 'zzz']
+    pairs = [(a, b) for a in terms for b in terms]
+    expected = [ev.relation_between_terms(a, b, data_dir=str(tmp_path)) for a, b in pairs]
+    assert ev.relations_for_pairs(pairs, data_dir=str(tmp_path)) == expected
+    assert ev.relations_for_pairs(pairs, data_dir=str(tmp_path), max_entries_per_batch=1) == expected
@@ -0,0 +1,46 @@
+from equation_solver import EquationSolver, canonicalize, format_solutions
+
+
+def test_canonical_lines_share_cached_results():
+    solver = EquationSolver(use_process=False)
+    first = solver.solve('x + y = 10, x - y = 2')
+    assert format_solutions(first) == ['x = 6, y = 4']
+    again = solver.solve('  x + y  = 10 ,x -   y = 2')
+    assert again['cached'] and again['solutions'] == first['solutions']
+    assert solver.stats['hits'] == 1 and solver.stats['misses'] == 1
+
+    assert format_solutions(solver.solve('x**2 = 4')) == ['x = -2', 'x = 2']
+    assert format_solutions(solver.solve('x = x + 1')) == ['No solution found.']
+    assert format_solutions(solver.solve('x = '))[0].startswith('Could not solve equation(s): ')
+
+    eqs, truncated = canonicalize(','.join(f'x{i} = {i}' for i in range(12)))
+    assert len(eqs) == 10 and truncated
+
+
+def test_worker_process_solves_and_closes():
+    solver = EquationSolver(timeout=60)
+    solver.prewarm().join()
+    try:
+        assert format_solutions(solver.solve('2*a = 6')) == ['a = 3']
+    finally:
+        solver.close()
+    assert solver._proc is None
+
+
+def test_cache_hits_do_not_wait_for_a_running_solve():
+    import threading
+
+    solver = EquationSolver(use_process=False)
+    solver.solve('x = 1')
+    results = []
+    with solver._worker_lock:  # as if another line were being solved
+        th = threading.Thread(target=lambda: results.append(solver.solve('x = 1')), daemon=True)
+        th.start()
+        th.join(5)
+    assert results and results[0]['cached']
+
+
+def test_untruncated_solutions():
+    result = {'error': None, 'solutions': [[(f'x{i}', str(i)) for i in range(12)]]}
+    assert format_solutions(result)[0].endswith('x9 = 9, ...')
+    assert format_solutions(result, max_vars=None)[0].endswith('x11 = 11')
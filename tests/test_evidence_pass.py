@@ -0,0 +1,37 @@
+import eng1neer
+
+PROMPT = 'do vector and matrix both have magnitude'
+
+
+def _count_respond_calls(monkeypatch):
+    calls = []
+    original = eng1neer.respond
+
+    def counting(defs, text, session=None):
+        calls.append(text)
+        return original(defs, text, session=session)
+
+    monkeypatch.setattr(eng1neer, 'respond', counting)
+    return calls
+
+
+def test_verbose_answer_and_evidence_come_from_one_responder_pass(monkeypatch):
+    defs = eng1neer.load_all_definitions()
+    calls = _count_respond_calls(monkeypatch)
+    narrative = eng1neer.respond_with_evidence(defs, PROMPT, verbose=True)
+    assert calls == [PROMPT]
+
+    turn = eng1neer.evidence_turn(defs, PROMPT)
+    assert calls == [PROMPT, PROMPT]
+    assert turn['narrative'] == narrative
+    assert turn['evidence'] and turn['comparison']['terms'] == turn['evidence']['found_terms']
+    assert eng1neer.detailed_comparison(defs, PROMPT, evidence_result=turn) == turn['comparison']
+    assert len(calls) == 2
+
+
+def test_turn_without_evidence_does_not_reuse_the_previous_one():
+    defs = eng1neer.load_all_definitions()
+    assert eng1neer.evidence_turn(defs, PROMPT)['evidence']
+    turn = eng1neer.evidence_turn(defs, 'compare algebra and geometry')
+    assert turn['evidence'] is None
+    assert turn['narrative'] == turn['response']
@@ -0,0 +1,47 @@
+import json
+
+from exec_cache import ExecCache
+
+
+def test_lookups_are_cached_per_profile_and_bounded():
+    cache = ExecCache(maxsize=2)
+    f = cache.get('lambda x: abs(x)', 'lambda')
+    assert f(-2) == 2
+    assert cache.get('lambda x: abs(x)', 'lambda') is f
+    # the 'safe' profile has no builtins, and non-lambdas are rejected by 'lambda'
+    safe = cache.get('lambda x: abs(x)', 'safe')
+    assert safe is not f
+    assert cache.get('1 + 1', 'lambda') is None
+    assert cache.get('lambda x:', 'safe') is None
+
+    info = cache.info()
+    assert info['hits'] == 1 and info['misses'] == 4
+    assert info['failures'] == 2 and info['evictions'] == 2
+    assert info['size'] == 2 and info['hit_rate'] == 0.2
+
+
+def test_precompile_data_runs_once_per_change(tmp_path):
+    (tmp_path / 'a.json').write_text(json.dumps({
+        'square': {'exec': 'lambda x: x * x'},
+        'group': [{'exec': 'lambda a, b: a + b'}, {'gloss': 'no code'}],
+    }), encoding='utf-8')
+    cache = ExecCache()
+    assert cache.precompile_data(str(tmp_path)) == 2
+    assert cache.info()['precompiled'] == 2
+    assert cache.precompile_data(str(tmp_path)) == 2
+    assert cache.info()['precompiled'] == 2
+
+    assert cache.get('lambda x: x * x', 'lambda')(3) == 9
+    assert cache.get('lambda a, b: a + b', 'lambda')(1, 2) == 3
+    assert cache.info()['misses'] == 0
+    # other profiles are only compiled when asked for
+    assert cache.get('lambda a, b: a + b', 'safe')(1, 2) == 3
+    assert cache.info()['misses'] == 1
+
+
+def test_precompile_stops_at_maxsize():
+    cache = ExecCache(maxsize=3)
+    sources = [f'lambda x: x + {i}' for i in range(10)]
+    assert cache.precompile(sources, ('lambda',)) == 3
+    assert cache.info()['evictions'] == 0
+    assert all(cache.get(s, 'lambda') for s in sources[:3]) and cache.info()['misses'] == 0
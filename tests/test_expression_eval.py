@@ -0,0 +1,18 @@
+from eng1neer import compile_expression, evaluate_batch, try_eval_expression
+
+
+def test_compiled_expression_is_reused():
+    f = compile_expression('2*x + 3*y')
+    assert compile_expression('2*x + 3*y') is f
+    assert f({'x': 4, 'y': 5}) == 23
+    assert try_eval_expression('x^2 % 7', {'x': 4}) == 2
+    assert try_eval_expression('abs(x)', {'x': -1}) is None
+    assert try_eval_expression('z + 1', {'x': 1}) is None
+    assert compile_expression('1 +') is None
+
+
+def test_evaluate_batch_scalar_and_vectorized():
+    bindings = [{'x': 1, 'y': 2}, {'x': 3, 'y': 0}, {'x': 5}, {'x': 2, 'y': 4}]
+    assert evaluate_batch('x / y', bindings) == [0.5, None, None, 0.5]
+    assert evaluate_batch('x / y', bindings, vectorize=True) == [0.5, None, None, 0.5]
+    assert evaluate_batch('x +', bindings) == [None] * 4
@@ -0,0 +1,35 @@
+import itertools
+
+import find_pairs_with_examples as fpe
+
+DEFS = {
+    'acid': 'Acid is a compound. A proton donor in water.',
+    'base': 'Base is a compound. A proton acceptor in water.',
+    'salt': 'Salt is an ionic compound.',
+    'river': 'River is flowing water.',
+    'mountain': 'Mountain is a tall landform.',
+}
+
+
+def _full_scan(defs, top):
+    results = []
+    for a, b in itertools.combinations(sorted(defs), 2):
+        a_def = fpe.normalize_definition(defs[a], a)
+        b_def = fpe.normalize_definition(defs[b], b)
+        shared = sorted(fpe.extract_nouns_and_predicates(a_def)[0] & fpe.extract_nouns_and_predicates(b_def)[0])
+        samples = []
+        for term in shared[:6]:
+            sa = fpe.sentences_with_term(a_def, term, max_n=1)
+            sb = fpe.sentences_with_term(b_def, term, max_n=1)
+            if sa or sb:
+                samples.append((term, sa[:1], sb[:1]))
+        if samples:
+            results.append((len(samples), len(shared), a, b, samples))
+    results.sort(key=lambda x: (x[0], x[1]), reverse=True)
+    return results[:top]
+
+
+def test_find_pairs_matches_full_scan():
+    for top in (1, 2, 3, 50):
+        assert fpe.find_pairs(DEFS, top=top) == _full_scan(DEFS, top)
+    assert fpe.find_pairs(DEFS, top=3, workers=2) == _full_scan(DEFS, 3)
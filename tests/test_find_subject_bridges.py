@@ -0,0 +1,32 @@
+from itertools import combinations
+
+import find_subject_bridges as fsb
+
+DEFS = {
+    'acid': 'A compound donating protons while reacting, and therefore sour.',
+    'base': 'A compound accepting protons while reacting.',
+    'salt': 'Ionic compound formed from acid and base.',
+    'river': 'Flowing water',
+    'lake': 'Still water',
+    'mountain': 'Tall landform',
+    'measurement': 'Computation of size',
+}
+
+
+def _exhaustive(defs, threshold):
+    out = []
+    for a, b in combinations(sorted(defs), 2):
+        percent, shared, bridge = fsb.percent_similarity(fsb.normalize_value(defs[a]), fsb.normalize_value(defs[b]), {})
+        if percent >= threshold:
+            out.append((percent, a, b, shared[:6], bridge))
+    out.sort(reverse=True, key=lambda x: x[0])
+    return out
+
+
+def test_find_bridges_matches_exhaustive_scan():
+    for threshold in (0.0, 20.0, 50.0, 75.0):
+        assert fsb.find_bridges(DEFS, {}, threshold) == _exhaustive(DEFS, threshold)
+
+
+def test_find_bridges_with_workers():
+    assert fsb.find_bridges(DEFS, {}, 20.0, workers=2) == _exhaustive(DEFS, 20.0)
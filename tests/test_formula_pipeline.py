@@ -0,0 +1,32 @@
+import json
+
+from formula_pipeline import read_checkpoint, run_pipeline
+
+
+def _records(path):
+    return [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_pipeline_dedups_and_resumes(tmp_path):
+    src = tmp_path / 'in.jsonl'
+    frags = ['E = mc2', '"E = mc2"', 'x^2 + 1', 'not json', 'a+b', '300-', ' x^2 + 1 ', 'a + b']
+    lines = [json.dumps({'key': f'k{i}', 'fragment': f}) if f != 'not json' else '{broken' for i, f in enumerate(frags)]
+    src.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+    full = tmp_path / 'full.jsonl'
+    ckpt = run_pipeline(str(src), str(full), batch_size=2)
+    recs = _records(full)
+    assert ckpt['done'] and ckpt['records_in'] == 7 and ckpt['duplicates'] == 2
+    assert [r['normalized'] for r in recs] == ['E = m*c**2', 'x**2+ 1', 'a+b', '300-', 'a + b']
+    assert recs[0]['parsed'] == 'Eq(E, c**2*m)' and recs[0]['parse_error'] is None
+    assert recs[3]['parsed'] is None and recs[3]['parse_error']
+
+    part = tmp_path / 'part.jsonl'
+    ckpt = run_pipeline(str(src), str(part), batch_size=2, limit=3)
+    assert not ckpt['done'] and read_checkpoint(str(part))['records_in'] == 3
+    # simulate a crash after the checkpoint: a half-written line gets truncated on resume
+    with open(part, 'a', encoding='utf-8') as f:
+        f.write('{"partial"')
+    ckpt = run_pipeline(str(src), str(part), batch_size=2)
+    assert ckpt['done']
+    assert _records(part) == recs
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+import formula_registry
+from formula_registry import FormulaRegistry
+
+
+def test_functions_are_built_on_first_access(tmp_path):
+    summary = tmp_path / 'generation_summary.json'
+    summary.write_text(json.dumps({
+        'Einstein': [{'function': 'e_eq', 'params': ['c', 'm'], 'expr': 'c**2*m'}, {'error': 'x', 'fragment': '?'}],
+        'Add': [{'function': 'five', 'params': [], 'expr': '5'}],
+    }), encoding='utf-8')
+    reg = FormulaRegistry(str(summary))
+
+    assert reg.loaded() == []
+    assert sorted(reg.names()) == ['e_eq', 'five']
+    assert reg['e_eq'](3, 2) == 18.0
+    assert reg.get('e_eq') is reg['e_eq']
+    assert reg.loaded() == ['e_eq']
+    assert reg.get('missing') is None
+    with pytest.raises(KeyError):
+        reg['missing']
+
+
+def test_module_attributes_resolve_from_default_manifest():
+    assert formula_registry.albert_einstein_1_eq(2, 3) == 12.0
+    assert formula_registry.add_1_eq() == 5.0
+    assert 'add_1_eq' in dir(formula_registry)
+    with pytest.raises(AttributeError):
+        formula_registry.not_a_formula
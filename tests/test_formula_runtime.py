@@ -0,0 +1,57 @@
+import pytest
+
+import formula_runtime
+from formula_runtime import compile_expression, constant_value, emit_function, evaluate_expression
+
+
+def test_compiled_expressions_are_shared():
+    f = compile_expression('c**2*m', ('c', 'm'))
+    assert compile_expression('c**2*m', ['c', 'm']) is f
+    assert evaluate_expression('c**2*m', ('c', 'm'), (2, 3)) == 12.0
+    assert evaluate_expression('x**0.5', ('x',), (-4,)) == complex(0, 2)
+
+
+def test_constants_and_emitted_source():
+    assert constant_value('5') == 5.0
+    assert constant_value('I**2') == -1.0
+
+    namespace = {'_evaluate': evaluate_expression, '_constant': constant_value}
+    exec(emit_function('einstein', ['c', 'm'], 'c**2*m', 'm*c**2'), namespace)
+    exec(emit_function('five', [], '5'), namespace)
+    exec(emit_function('half', ['x'], 'x/2'), namespace)
+    assert namespace['einstein'](3, 2) == 18.0
+    assert namespace['five']() == 5.0
+    assert namespace['half'](3) == 1.5
+    assert formula_runtime.cache_info()['compiled'] >= 3
+
+
+def test_generated_module_imports():
+    from generated import formulas_from_wiki as fw
+    assert fw.albert_einstein_1_eq(2, 3) == 12.0
+    assert fw.add_1_eq() == 5.0
+
+
+def test_evaluate_many_matches_scalar_functions(tmp_path):
+    import json
+    import numpy as np
+    from formula_runtime import evaluate_many
+
+    summary = tmp_path / 'generation_summary.json'
+    summary.write_text(json.dumps({
+        'Einstein': [{'function': 'e_eq', 'params': ['c', 'm'], 'expr': 'c**2*m'}, {'error': 'x', 'fragment': '?'}],
+        'Roots': [{'function': 'root_eq', 'params': ['x'], 'expr': 'x**0.5'}, {'function': 'five', 'params': [], 'expr': '5'}],
+    }), encoding='utf-8')
+    path = str(summary)
+
+    grid = evaluate_many('e_eq', summary_path=path, c=np.arange(3)[:, None], m=[1, 2])
+    assert grid.shape == (3, 2) and grid.dtype == float
+    assert grid[2].tolist() == [4.0, 8.0]
+
+    roots = evaluate_many('root_eq', summary_path=path, x=[4, -4])
+    assert roots[0] == 2.0 and roots[1] == complex(0, 2)
+    assert evaluate_many('five', summary_path=path) == 5.0
+
+    with pytest.raises(KeyError):
+        evaluate_many('nope', summary_path=path)
+    with pytest.raises(TypeError):
+        evaluate_many('e_eq', summary_path=path, c=[1])
@@ -0,0 +1,16 @@
+from formula_utils import normalize_fragment, normalize_many, replace_superscripts
+
+
+def test_normalize_fragment_rewrites():
+    assert normalize_fragment('E = mc2') == 'E = m*c**2'
+    assert normalize_fragment('n(n+1)/2') == 'n*(n+1)/2'
+    assert normalize_fragment('2πr²') == '2*pir2'
+    assert normalize_fragment('\\frac{a}{b} + \\sin(x)^{2}') == '(a)/(b) + sin*(x)**2'
+    assert normalize_fragment('1905/06') == ''
+    assert normalize_fragment('CH=O') == ''
+    assert replace_superscripts('x²') == 'x2'
+
+
+def test_normalize_many_matches_single_calls():
+    frags = ['E = mc2', 'a:b', 'E = mc2', '', 'x × y']
+    assert normalize_many(frags) == [normalize_fragment(f) for f in frags]
@@ -0,0 +1,41 @@
+import difflib
+
+from fuzzy_index import FuzzyIndex, load_word_index
+
+WORDS = ['photosynthesis', 'polynomial', 'polynomials', 'binomial', 'monomial', 'acid', 'acids', 'vector', 'vectors', 'ab']
+
+
+def _linear_best(term, min_similarity=0.8):
+    best, best_score = None, 0.0
+    for w in WORDS:
+        score = difflib.SequenceMatcher(None, term, w).ratio()
+        if score > best_score:
+            best, best_score = w, score
+    return best if best_score >= min_similarity else None
+
+
+def test_best_match_agrees_with_linear_scan():
+    idx = FuzzyIndex(WORDS)
+    for term in ['polynomal', 'photosynthesys', 'vectr', 'acdi', 'binomail', 'xyz', 'a', 'ba', 'polynomial']:
+        assert idx.best_match(term) == _linear_best(term), term
+
+
+def test_top_k_orders_by_score_then_position():
+    idx = FuzzyIndex(WORDS)
+    hits = idx.top_k('vectors', min_similarity=0.5, k=3)
+    assert [w for w, _ in hits][:2] == ['vectors', 'vector']
+    assert all(score >= 0.5 for _, score in hits)
+
+
+def test_missing_word_file_gives_empty_index(tmp_path):
+    idx = load_word_index(str(tmp_path / 'missing.txt'))
+    assert len(idx) == 0 and idx.best_match('anything') is None
+    (tmp_path / 'words.txt').write_text('Alpha\nbeta\n', encoding='utf-8')
+    assert load_word_index(str(tmp_path / 'words.txt')).best_match('alpah', 0.7) == 'alpha'
+
+
+def test_scores_use_the_term_as_first_sequence():
+    # ratio() is asymmetric for this pair: 0.8 with the term first, 0.6 the other way round
+    assert difflib.SequenceMatcher(None, 'dade', 'adabde').ratio() == 0.8
+    assert FuzzyIndex(['adabde']).top_k('dade', 0.0) == [('adabde', 0.8)]
+    assert FuzzyIndex(['adabde']).best_match('dade', 0.7) == 'adabde'
@@ -0,0 +1,23 @@
+import history_lookup as hl
+
+HISTORY = {
+    'a': [{'start_year': 1900, 'end_year': 1950}, {'year': 1925}],
+    'b': {'timeline_examples': [{'period': '1800-1850'}, {'period': 'unknown'}]},
+    'c': [{'start_year': -100, 'end_year': 100}, {'start_year': 2000, 'end_year': 1990}],
+}
+
+
+def test_stabbing_and_overlapping_follow_scan_order():
+    idx = hl.history_index(HISTORY)
+    assert [(k, s, e) for k, _, s, e in idx.stabbing(1925)] == [('a', 1900, 1950), ('a', 1925, 1925)]
+    assert [k for k, _, _, _ in idx.stabbing(0)] == ['c']
+    assert idx.stabbing(1995) == []
+    assert [(k, s) for k, _, s, _ in idx.overlapping(1850, 1900)] == [('a', 1900), ('b', 1800)]
+    assert idx.overlapping(1900, 1850) == idx.overlapping(1850, 1900)
+
+
+def test_public_helpers_use_the_index():
+    assert [k for k, _ in hl.find_entries_covering_year(1820, HISTORY)] == ['b']
+    ranked = hl.find_entries_within_range(1920, 1930, HISTORY)
+    assert [(r['entry_start'], r['entry_end']) for r in ranked] == [(1900, 1950), (1925, 1925)]
+    assert hl.history_index(HISTORY) is hl.history_index(HISTORY)
@@ -0,0 +1,47 @@
+import json
+import os
+
+from knowledge_snapshot import build_snapshot, install_snapshot, read_snapshot
+from knowledge_store import KnowledgeStore
+
+
+def test_snapshot_serves_fresh_files_and_skips_changed_ones(tmp_path):
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'thesaurus_assoc.json').write_text(json.dumps({'atom': ['chemistry']}), encoding='utf-8')
+    (tmp_path / 'data' / 'a.json').write_text(json.dumps({'Alpha': {'gloss': 'first'}}), encoding='utf-8')
+    snap_path = str(tmp_path / 'snap.bin')
+    summary = build_snapshot(snap_path, root=str(tmp_path))
+    assert summary['files'] == 2
+
+    ks = KnowledgeStore()
+    assert install_snapshot(snap_path, root=str(tmp_path), knowledge=ks) == 2
+    (tmp_path / 'data' / 'a.json').write_text(json.dumps({'Alpha': {'gloss': 'edited'}}), encoding='utf-8')
+    os.utime(tmp_path / 'data' / 'a.json', ns=(1, 1))
+
+    assert ks.load_json(str(tmp_path / 'thesaurus_assoc.json')) == {'atom': ['chemistry']}
+    assert ks.files(str(tmp_path / 'data'))['a.json']['Alpha']['gloss'] == 'edited'
+    assert ks.stats['snapshot_loads'] == 1
+    assert ks.stats['loads'] == 1
+
+
+def test_missing_snapshot_is_harmless(tmp_path):
+    assert install_snapshot(str(tmp_path / 'nope.bin'), root=str(tmp_path), knowledge=KnowledgeStore()) == 0
+
+
+def test_header_is_read_without_the_payloads(tmp_path):
+    (tmp_path / 'data').mkdir()
+    (tmp_path / 'data' / 'a.json').write_text(json.dumps({'Alpha': {'gloss': 'first'}}), encoding='utf-8')
+    snap_path = tmp_path / 'snap.bin'
+    build_snapshot(str(snap_path), root=str(tmp_path))
+    snap = read_snapshot(str(snap_path))
+    ent = snap['files'][os.path.join('data', 'a.json')]
+    assert 'data' not in ent and snap['data_start'] + ent['offset'] + ent['size'] == snap_path.stat().st_size
+
+    # corrupt the blob region: the header still reads and installs, and the
+    # broken entry falls back to the JSON file when it is requested
+    raw = snap_path.read_bytes()
+    snap_path.write_bytes(raw[:snap['data_start']] + b'\xff' * ent['size'])
+    ks = KnowledgeStore()
+    assert install_snapshot(str(snap_path), root=str(tmp_path), knowledge=ks) == 1
+    assert ks.load_json(str(tmp_path / 'data' / 'a.json')) == {'Alpha': {'gloss': 'first'}}
+    assert ks.stats['snapshot_loads'] == 0 and ks.stats['loads'] == 1
@@ -0,0 +1,62 @@
+import json
+import os
+
+from knowledge_store import KnowledgeStore
+
+
+def _write(path, obj, stamp=None):
+    path.write_text(json.dumps(obj), encoding='utf-8')
+    if stamp is not None:
+        os.utime(path, ns=(stamp, stamp))
+
+
+def test_files_are_parsed_once_and_reloaded_on_change(tmp_path):
+    ks = KnowledgeStore()
+    _write(tmp_path / 'a.json', {'Alpha': {'gloss': 'first'}}, stamp=1_000_000_000)
+    first = ks.files(str(tmp_path))
+    second = ks.files(str(tmp_path))
+    assert first['a.json'] is second['a.json']
+    assert ks.stats['loads'] == 1
+
+    _write(tmp_path / 'a.json', {'Alpha': {'gloss': 'changed'}}, stamp=2_000_000_000)
+    assert ks.files(str(tmp_path))['a.json']['Alpha']['gloss'] == 'changed'
+    assert ks.stats['loads'] == 2
+
+
+def test_merged_terms_and_broken_files(tmp_path):
+    ks = KnowledgeStore()
+    _write(tmp_path / 'a.json', {'Alpha': 1})
+    _write(tmp_path / 'b.json', [{'Beta': 2}])
+    (tmp_path / 'broken.json').write_text('{not json', encoding='utf-8')
+
+    assert ks.files(str(tmp_path))['broken.json'] == {}
+    assert ks.merged_terms(str(tmp_path)) == {'alpha': 1}
+    assert ks.merged_terms(str(tmp_path), include_lists=True) == {'alpha': 1, 'beta': 2}
+
+    _write(tmp_path / 'c.json', {'Gamma': 3})
+    assert 'gamma' in ks.merged_terms(str(tmp_path))
+
+
+def test_term_index_postings(tmp_path):
+    ks = KnowledgeStore()
+    _write(tmp_path / 'a.json', {'Alpha': 1, 'beta': 2})
+    _write(tmp_path / 'b.json', [{'beta': 3}, {'alpha ': 4}])
+    _write(tmp_path / 'c.json', {'beta': 5})
+
+    index = ks.term_index(str(tmp_path))
+    assert index['alpha'] == [('a.json', 'Alpha', None), ('b.json', 'alpha ', 1)]
+    assert ks.files_defining('beta', str(tmp_path)) == ['a.json', 'c.json']
+    assert ks.files_defining('alpha', str(tmp_path)) == []
+
+
+def test_files_defining_many_checks_the_directory_once(tmp_path, monkeypatch):
+    ks = KnowledgeStore()
+    _write(tmp_path / 'a.json', {'Alpha': 1, 'beta': 2})
+    _write(tmp_path / 'c.json', {'beta': 5})
+    calls = []
+    signature = ks.signature
+    monkeypatch.setattr(ks, 'signature', lambda d: calls.append(d) or signature(d))
+
+    found = ks.files_defining_many(['beta', 'Alpha', 'alpha', 'gamma'], str(tmp_path))
+    assert found == {'beta': ['a.json', 'c.json'], 'Alpha': ['a.json'], 'alpha': [], 'gamma': []}
+    assert len(calls) == 1
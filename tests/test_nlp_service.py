@@ -0,0 +1,105 @@
+from nlp_service import NLPService
+
+
+def test_missing_model_degrades_to_no_analysis():
+    svc = NLPService(model='no_such_spacy_model')
+    assert svc.get() is None
+    assert not svc.available()
+    assert svc.analyze_many(['a force', 'the mass']) == [(), ()]
+    assert svc.doc('a force') is None
+    assert svc.noun_tokens('a force') == frozenset()
+    assert not svc.is_noun_in('force', 'a force')
+    assert not svc.is_noun('force')
+    # the failed load is remembered rather than retried
+    assert svc._loaded and svc.stats['parsed'] == 0
+
+
+class _Token:
+    def __init__(self, word):
+        self.text = word
+        self.pos_ = 'NOUN' if word in ('force', 'mass', 'energy') else 'DET'
+        self.lemma_ = word
+
+
+class _StubPipeline:
+    """Stands in for a spaCy model: whitespace tokens, a fixed noun list."""
+
+    def __init__(self):
+        self.calls = []
+        self.piped = []
+
+    def __call__(self, text):
+        self.calls.append(text)
+        return [_Token(w) for w in text.split()]
+
+    def pipe(self, texts, batch_size=64, disable=()):
+        texts = list(texts)
+        self.piped.append(texts)
+        return [[_Token(w) for w in t.split()] for t in texts]
+
+
+def _stub_service(**kwargs):
+    svc = NLPService(**kwargs)
+    svc._nlp = _StubPipeline()
+    svc._loaded = True
+    return svc
+
+
+def test_misses_are_parsed_in_one_deduplicated_batch():
+    svc = _stub_service()
+    out = svc.analyze_many(['a force', 'the mass', 'a force', 'the mass'])
+    assert svc._nlp.piped == [['a force', 'the mass']]
+    assert out[0] == out[2] == (('a', 'DET', 'a'), ('force', 'NOUN', 'force'))
+    assert svc.stats == {'hits': 2, 'parsed': 2, 'batches': 1}
+
+    # cached texts are not parsed again; only the new one goes to the pipeline
+    svc.analyze_many(['the mass', 'an energy'])
+    assert svc._nlp.piped[-1] == ['an energy']
+    assert svc.stats == {'hits': 3, 'parsed': 3, 'batches': 2}
+    svc.analyze_many(['a force'])
+    assert len(svc._nlp.piped) == 2 and svc.stats['hits'] == 4
+
+
+def test_noun_checks_are_memoised_per_text():
+    svc = _stub_service()
+    assert svc.is_noun_in('Force', 'a force') and not svc.is_noun_in('a', 'a force')
+    assert svc.is_noun('mass') and not svc.is_noun('the')
+    assert svc._nlp.piped == [['a force'], ['mass'], ['the']]
+    hits = svc.stats['hits']
+    # the noun set is reused without re-analysing the text
+    assert svc.noun_tokens('a force') is svc.noun_tokens('a force')
+    assert svc.stats['hits'] == hits and len(svc._nlp.piped) == 3
+
+
+def test_noun_sets_are_evicted_with_their_analyses():
+    svc = _stub_service(cache_size=2)
+    svc.noun_tokens('a force')
+    svc.noun_tokens('the mass')
+    assert set(svc._nouns) == {'a force', 'the mass'}
+    svc.noun_tokens('an energy')
+    assert list(svc._analyses) == ['the mass', 'an energy']
+    assert set(svc._nouns) == {'the mass', 'an energy'}
+
+
+def test_doc_cache_keeps_the_most_recent_parses():
+    svc = _stub_service(doc_cache_size=2)
+    first = svc.doc('a force')
+    svc.doc('the mass')
+    assert svc.doc('a force') is first  # refreshed as most recent
+    svc.doc('an energy')
+    assert list(svc._docs) == ['a force', 'an energy']
+    assert svc._nlp.calls == ['a force', 'the mass', 'an energy']
+    # a full parse also fills the token analysis cache
+    assert svc.analyze('the mass') == (('the', 'DET', 'the'), ('mass', 'NOUN', 'mass'))
+    assert svc._nlp.piped == []
+
+
+def test_batches_larger_than_the_cache_return_every_analysis():
+    svc = _stub_service(cache_size=2)
+    texts = ['a force', 'the mass', 'an energy', 'the force']
+    out = svc.analyze_many(texts)
+    assert [a[1][0] for a in out] == ['force', 'mass', 'energy', 'force']
+    assert len(svc._analyses) == 2
+    # cached and freshly parsed texts mixed in one call
+    out = svc.analyze_many(['the force', 'a force'])
+    assert [a[1][0] for a in out] == ['force', 'force'] and svc._nlp.piped[-1] == ['a force']
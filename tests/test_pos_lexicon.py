@@ -0,0 +1,51 @@
+import json
+
+from pos_lexicon import POSLexicon, knowledge_vocabulary
+
+
+def test_lookups_come_from_the_persisted_table(tmp_path):
+    path = tmp_path / 'lex.json'
+    path.write_text(json.dumps({'format': 1, 'tags': {'force': 'NOUN', 'moves': 'VERB'}}), encoding='utf-8')
+    lex = POSLexicon(str(path))
+    assert lex.lookup('Force') == 'NOUN' and 'moves' in lex
+    assert lex.is_noun('force') and lex.is_verb('moves')
+    tags = lex.tag_many(['force', 'moves', 'force'])
+    assert tags == {'force': 'NOUN', 'moves': 'VERB'}
+    assert lex.stats['hits'] == 4 and lex.stats['misses'] == 0
+    lex.save()
+    assert POSLexicon(str(path)).lookup('moves') == 'VERB'
+
+
+def test_vocabulary_covers_keys_and_values(tmp_path):
+    (tmp_path / 'a.json').write_text(json.dumps({'Kinetic Energy': {'gloss': 'energy of Motion', 'n': 2}}), encoding='utf-8')
+    assert knowledge_vocabulary(str(tmp_path), root=str(tmp_path)) == ['energy', 'gloss', 'kinetic', 'motion', 'n', 'of']
+
+
+def test_concurrent_merges_and_saves_keep_the_table(tmp_path):
+    import threading
+
+    path = tmp_path / 'lex.json'
+    lex = POSLexicon(str(path))
+    tags = lex._load()
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(200):
+                with lex._lock:
+                    tags[f'w{n}_{i}'] = 'NOUN'
+                    lex._dirty = True
+                if i % 20 == 0:
+                    lex.save()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    lex.flush()
+    assert not errors
+    assert len(POSLexicon(str(path))) == 800
+    assert [p.name for p in tmp_path.iterdir()] == ['lex.json']
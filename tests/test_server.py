@@ -0,0 +1,88 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from server import Overloaded, WorkerPool, create_app
+
+
+def test_sessions_and_endpoints(tmp_path):
+    (tmp_path / 'gadgets.json').write_text(json.dumps({
+        'widget': {'gloss': 'a small mechanical device with teeth'},
+        'sprocket': {'gloss': 'a toothed wheel with teeth'},
+    }), encoding='utf-8')
+    with TestClient(create_app(workers=2, data_dir=str(tmp_path))) as client:
+        health = client.get('/health').json()
+        assert health['loaded'] and health['definitions'] == 2 and health['data_dir'] == str(tmp_path)
+
+        r = client.post('/respond', json={'prompt': 'what is widget'})
+        assert r.status_code == 200
+        body = r.json()
+        assert 'widget' in body['answer']
+        sid = body['session_id']
+        assert client.app.state.sessions.get(sid).last_answer == body['answer']
+
+        r = client.post('/compare', json={'prompt': 'do widget and sprocket both have teeth', 'session_id': sid})
+        assert r.status_code == 200 and r.json()['session_id'] == sid
+        assert sorted(r.json()['comparison']['terms']) == ['sprocket', 'widget']
+
+        health = client.get('/health').json()
+        assert health['sessions'] == 1 and health['stats']['completed'] == 2
+        assert client.delete(f'/sessions/{sid}').status_code == 200
+        assert client.delete(f'/sessions/{sid}').status_code == 404
+
+
+def test_missing_or_empty_data_dir_fails_startup(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        with TestClient(create_app(data_dir=str(tmp_path / 'nope'))):
+            pass
+    with pytest.raises(RuntimeError):
+        with TestClient(create_app(data_dir=str(tmp_path))):
+            pass
+
+
+def test_pool_rejects_when_full_and_times_out():
+    release = threading.Event()
+
+    async def scenario():
+        pool = WorkerPool(workers=1, max_pending=1, timeout=0.2)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.run(release.wait)
+            # the timed-out call still holds its slot until it really ends
+            with pytest.raises(Overloaded):
+                await pool.run(lambda: 1)
+            release.set()
+            for _ in range(50):
+                if pool.pending == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert await pool.run(lambda: 2) == 2
+            assert pool.stats == {'completed': 1, 'rejected': 1, 'timeouts': 1, 'errors': 0}
+        finally:
+            release.set()
+            pool.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_shutdown_cancels_queued_calls():
+    release = threading.Event()
+    ran = []
+
+    async def scenario():
+        pool = WorkerPool(workers=1, max_pending=4, timeout=0.1)
+        for fn in (release.wait, lambda: ran.append(1)):
+            with pytest.raises(asyncio.TimeoutError):
+                await pool.run(fn)
+        pool.shutdown()
+        release.set()
+        for _ in range(50):
+            if pool.pending == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert pool.pending == 0 and not ran
+
+    asyncio.run(scenario())
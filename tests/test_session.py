@@ -0,0 +1,109 @@
+import json
+import threading
+
+import eng1neer
+from session import Session, SessionStore
+
+
+def _setup(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    (data_dir / 'gadgets.json').write_text(json.dumps({
+        'widget': {'gloss': 'a small mechanical device'},
+        'sprocket': {'gloss': 'a toothed wheel'},
+    }), encoding='utf-8')
+    assoc = tmp_path / 'assoc.json'
+    assoc.write_text('{}', encoding='utf-8')
+    return str(data_dir), str(assoc)
+
+
+def test_sessions_keep_separate_conversations(tmp_path):
+    data_dir, assoc = _setup(tmp_path)
+    a, b = Session(), Session()
+    answer_a = eng1neer.respond_subject_specific('what is widget', assoc, data_dir, session=a)
+    answer_b = eng1neer.respond_subject_specific('what is sprocket', assoc, data_dir, session=b)
+    assert a.last_answer == answer_a and 'widget' in answer_a
+    assert b.last_answer == answer_b and 'widget' not in answer_b
+
+    eng1neer.respond({}, 'hello there', session=a)
+    assert a.context == ['hello there'] and b.context == []
+
+
+def test_concurrent_sessions_do_not_share_state(tmp_path):
+    data_dir, assoc = _setup(tmp_path)
+    store = SessionStore()
+    results = {}
+
+    def converse(sid, term):
+        session = store.get(sid)
+        for _ in range(3):
+            results[sid] = eng1neer.respond_subject_specific(f'what is {term}', assoc, data_dir, session=session)
+
+    threads = [threading.Thread(target=converse, args=(f'user{i}', ('widget', 'sprocket')[i % 2])) for i in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(store) == 6
+    for i in range(6):
+        session = store.get(f'user{i}')
+        term = ('widget', 'sprocket')[i % 2]
+        assert session.last_answer == results[f'user{i}'] and term in session.last_answer
+
+
+def test_concurrent_sessions_keep_their_own_evidence(monkeypatch):
+    import time
+
+    defs = {
+        'widget': [{'definition': 'A widget is a small mechanical device with teeth.'}],
+        'sprocket': [{'definition': 'A sprocket is a toothed wheel with teeth.'}],
+        'gizmo': [{'definition': 'A gizmo is a clever electronic gadget with buttons.'}],
+        'doohickey': [{'definition': 'A doohickey is an unnamed gadget with buttons.'}],
+    }
+    prompts = {'a': 'do widget and sprocket both have teeth', 'b': 'do gizmo and doohickey both have buttons'}
+    expected = {}
+    for sid, prompt in prompts.items():
+        session = Session()
+        eng1neer.respond(defs, prompt, session=session)
+        expected[sid] = session.last_evidence['term_raw_fragments']
+
+    blend = eng1neer.blend_definitions
+
+    def slow_blend(*args, **kwargs):
+        # widen the window between one request's blend and its use of the fragments
+        out = blend(*args, **kwargs)
+        time.sleep(0.002)
+        return out
+
+    monkeypatch.setattr(eng1neer, 'blend_definitions', slow_blend)
+    seen = {sid: [] for sid in prompts}
+
+    def converse(sid):
+        session = Session(sid)
+        for _ in range(10):
+            eng1neer.respond(defs, prompts[sid], session=session)
+            seen[sid].append(session.last_evidence['term_raw_fragments'])
+
+    threads = [threading.Thread(target=converse, args=(sid,)) for sid in prompts]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for sid in prompts:
+        assert seen[sid] == [expected[sid]] * 10
+
+
+def test_store_evicts_least_recently_used_and_idle_sessions():
+    store = SessionStore(max_sessions=2, max_idle=0)
+    first = store.get('a')
+    store.get('b')
+    assert store.get('a') is first
+    store.get('c')
+    assert 'b' not in store and 'a' in store and len(store) == 2
+    assert store.get().id not in ('a', 'c')
+
+    idle = SessionStore(max_idle=60)
+    old = idle.get('old')
+    old.last_used -= 120
+    idle.get('new')
+    assert 'old' not in idle and 'new' in idle
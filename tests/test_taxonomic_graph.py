@@ -0,0 +1,32 @@
+import math
+
+from taxonomic_grammar import evaluate_taxon_with_values
+
+
+def test_graph_points_match_scalar_evaluation():
+    taxon = {'exec': 'lambda a, x, n: a * (x ** n)'}
+    res = evaluate_taxon_with_values(taxon, {'a': 2, 'x': 1, 'n': 0.5}, graph_spec={'x': 'x', 'from': -1, 'to': 4}, points=6)
+    assert res['value'] == 2.0
+    xs = [p['x'] for p in res['graph']]
+    assert xs == [-1.0, 0.0, 1.0, 2.0, 3.0, 4.0]
+    for p in res['graph']:
+        assert abs(p['y'] - 2 * (p['x'] ** 0.5)) < 1e-12
+    assert isinstance(res['graph'][0]['y'], complex)
+
+
+def test_graph_falls_back_for_math_lambdas_and_errors():
+    taxon = {'exec': 'lambda x: math.log(x)'}
+    res = evaluate_taxon_with_values(taxon, {'x': 1}, graph_spec={'x': 'x', 'from': 0, 'to': 2}, points=3)
+    assert [p['y'] for p in res['graph']] == [None, 0.0, math.log(2)]
+
+
+def test_adaptive_graph_refines_steep_regions():
+    taxon = {'exec': 'lambda x: x ** 9'}
+    spec = {'x': 'x', 'from': 0, 'to': 2, 'adaptive': True, 'max_points': 300}
+    graph = evaluate_taxon_with_values(taxon, {'x': 1}, graph_spec=spec, points=11)['graph']
+    xs = [p['x'] for p in graph]
+    assert 11 < len(xs) <= 300
+    assert xs == sorted(xs)
+    assert all(math.isclose(p['y'], p['x'] ** 9, rel_tol=1e-12) for p in graph)
+    # sampling is densest where the curve is steepest
+    assert sum(1 for x in xs if x > 1.8) > sum(1 for x in xs if x < 1.0)
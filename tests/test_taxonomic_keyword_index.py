@@ -0,0 +1,33 @@
+import taxonomic_grammar as tg
+
+DATA = {
+    'a.json': {
+        'sodium chloride': {'gloss': 'table salt, an ionic compound', 'synonyms': ['NaCl', 'salt']},
+        'acid': [{'gloss': 'proton donor', 'synonyms': ['acidic substance']}, {'gloss': 'sour salt solution'}],
+        'base': {'gloss': 'accepts protons', 'synonyms': ['alkali', 'alkaline salt', 'salty base']},
+    },
+    'b.json': [{'salt': 1}, {'gloss': 'no match here'}],
+}
+
+
+def test_find_matches_order_and_kinds():
+    got = [(kw, f, k, kind) for kw, f, k, _, kind in tg.find_matches(['salt', 'acid', 'Na', 'zzz'], DATA)]
+    assert got == [
+        ('salt', 'a.json', 'sodium chloride', 'synonym'),
+        ('salt', 'a.json', 'sodium chloride', 'gloss'),
+        ('salt', 'a.json', 'acid', 'gloss'),
+        ('salt', 'a.json', 'base', 'synonym'),
+        ('acid', 'a.json', 'acid', 'key'),
+        ('Na', 'a.json', 'sodium chloride', 'synonym'),
+    ]
+
+
+def test_keyword_index_is_reused_for_same_data():
+    assert tg.keyword_index(DATA) is tg.keyword_index(dict(DATA))
+
+
+def test_alternating_maps_keep_their_indexes():
+    subset = {'a.json': DATA['a.json']}
+    full, part = tg.keyword_index(DATA), tg.keyword_index(subset)
+    assert full is not part
+    assert tg.keyword_index(DATA) is full and tg.keyword_index(subset) is part
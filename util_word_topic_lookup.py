@@ -1,14 +1,15 @@
 import os
-import json
 import difflib
 
+from fuzzy_index import load_word_index
+from knowledge_store import store
+
 def load_word_freq(word_freq_path):
     with open(word_freq_path, 'r', encoding='utf-8') as f:
         return set(line.strip().lower() for line in f if line.strip())
 
 def load_json(json_path):
-    with open(json_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return store.load_json(json_path)
 
 def similarity(a, b):
     return difflib.SequenceMatcher(None, a, b).ratio()
@@ -19,16 +20,9 @@ def lookup_word_topics(word, word_freq_path='word_freq.txt',
                       definitions_path='data/wikipedia_defs.json',
                       min_similarity=0.8):
     word = word.lower().strip()
-    word_freq = load_word_freq(word_freq_path)
-    # Find closest match in word_freq.txt
-    best_match = None
-    best_score = 0.0
-    for wf in word_freq:
-        score = similarity(word, wf)
-        if score > best_score:
-            best_score = score
-            best_match = wf
-    if best_score < min_similarity:
+    # Find closest match in word_freq.txt (indexed once, see fuzzy_index.py)
+    best_match = load_word_index(word_freq_path).best_match(word, min_similarity)
+    if best_match is None:
         return None  # No good match, leave alone
     # Check for topics in thesaurus_assoc.json
     assoc = load_json(assoc_path)